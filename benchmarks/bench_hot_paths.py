@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the per-update hot paths, with regression thresholds.
+
+Covers what runs for every vehicle on every poll:
+
+  - VinFastApi._parse_ping_response at several alias counts
+  - building the VehicleView entities read their values from
+  - diffing a snapshot against the previous poll's (TelemetrySnapshot.changed_keys)
+  - every value_fn in SENSOR_DESCRIPTIONS and BINARY_SENSOR_DESCRIPTIONS
+  - VinFastSensor.native_value / available
+  - VinFastDeviceTracker.latitude / available
+
+Entities are real ones on a real coordinator, fed from the stand-in cloud
+fixtures in tools/fixtures.
+
+Timings are also expressed relative to a fixed pure-Python calibration
+loop. That makes baselines/hot_paths.json usable across machines. With
+--check the script exits non-zero when any benchmark is slower than its
+baseline by more than --tolerance. After a speed-up, run --write-baseline
+so the gain is guarded from then on.
+
+Usage:
+    python3 benchmarks/bench_hot_paths.py [--check] [--tolerance 0.5] [--filter TEXT]
+    python3 benchmarks/bench_hot_paths.py --write-baseline
+
+Needs Home Assistant installed.
+"""
+
+import argparse
+import asyncio
+import json
+import pathlib
+import sys
+import timeit
+
+REPO = pathlib.Path(__file__).resolve().parent.parent
+FIXTURES = REPO / "tools" / "fixtures"
+BASELINE = REPO / "benchmarks" / "baselines" / "hot_paths.json"
+sys.path.insert(0, str(REPO))
+
+# Alias counts for the parser: the core set, a full catalogue, and beyond
+PARSE_SIZES = (34, 250, 1000)
+
+
+def calibration():
+    """Fixed workload the other timings are expressed against."""
+    table = {str(i): i for i in range(64)}
+    total = 0.0
+    for key in table:
+        total += float(table[key]) * 1.5
+    return total
+
+
+def load_fixture(name):
+    """Return the body of a stand-in cloud fixture."""
+    return json.loads((FIXTURES / f"{name}.json").read_text())["body"]
+
+
+def build_parse_case(size):
+    """Return (plan, ping items) for a catalogue of `size` aliases.
+
+    The fixture catalogue is used as is and padded with synthetic aliases.
+    """
+    from custom_components.vinfast.telemetry import TelemetryRequestPlan
+
+    resources = [
+        (r["alias"], r["devObjID"], r["devObjInstID"], r["devRsrcID"], r["type"])
+        for r in load_fixture("aliases")["data"]["resources"]
+    ]
+    items = list(load_fixture("ping")["data"])
+    for index in range(len(resources), size):
+        obj_id, rsrc_id = 35000 + index // 10, index % 10
+        resources.append((f"SYNTHETIC_ALIAS_{index}", str(obj_id), "1", str(rsrc_id), "Float"))
+        items.append({
+            "objectId": obj_id,
+            "instanceId": 1,
+            "resourceId": rsrc_id,
+            "deviceKey": f"{obj_id}_00001_{rsrc_id:05d}",
+            "value": f"{index * 0.5}",
+            "lastUpdateTime": 1760000000000,
+        })
+    return TelemetryRequestPlan(resources[:size]), items[:size]
+
+
+def time_call(func, repeat):
+    """Return the best time per call in nanoseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+async def collect_cases():
+    """Build every benchmark as name -> zero-argument callable."""
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.vinfast.api import VinFastApi
+    from custom_components.vinfast.binary_sensor import BINARY_SENSOR_DESCRIPTIONS
+    from custom_components.vinfast.coordinator import VinFastDataUpdateCoordinator
+    from custom_components.vinfast.device_tracker import VinFastDeviceTracker
+    from custom_components.vinfast.sensor import SENSOR_DESCRIPTIONS, VinFastSensor
+    from custom_components.vinfast.view import VehicleView
+
+    cases = {}
+    api = VinFastApi(None)
+    for size in PARSE_SIZES:
+        plan, items = build_parse_case(size)
+        cases[f"parse_ping[{size}]"] = (
+            lambda items=items, plan=plan: api._parse_ping_response(items, plan)
+        )
+
+    # Coordinator data for one vehicle, shaped exactly as a poll produces it
+    plan, items = build_parse_case(PARSE_SIZES[0])
+    vehicle = load_fixture("vehicles")["data"][0]
+    vin = vehicle["vinCode"]
+    telemetry = api._parse_ping_response(items, plan)
+    view = VehicleView(vin, vehicle, telemetry)
+    vehicle_data = {
+        "vehicles": [vehicle],
+        "profile": load_fixture("profile")["data"],
+        "telemetry": telemetry,
+        "locations": load_fixture("locations")["data"],
+        "view": view,
+    }
+    cases["vehicle_view.build"] = lambda: VehicleView(vin, vehicle, telemetry)
+    previous = api._parse_ping_response(items, plan)
+    cases["snapshot.changed_keys"] = lambda: telemetry.changed_keys(previous)
+
+    for description in SENSOR_DESCRIPTIONS:
+        cases[f"sensor.value_fn[{description.key}]"] = (
+            lambda fn=description.value_fn: fn(view)
+        )
+    for description in BINARY_SENSOR_DESCRIPTIONS:
+        cases[f"binary_sensor.value_fn[{description.key}]"] = (
+            lambda fn=description.value_fn: fn(view)
+        )
+
+    hass = HomeAssistant("/tmp")
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain="vinfast",
+        title="Benchmark",
+        data={"email": "owner@example.com", "password": "x"},
+        source="user",
+    )
+    coordinator = VinFastDataUpdateCoordinator(hass, entry)
+    coordinator.data = {vin: vehicle_data}
+
+    sensors = [VinFastSensor(coordinator, vin, d) for d in SENSOR_DESCRIPTIONS]
+    tracker = VinFastDeviceTracker(coordinator, vin)
+
+    def native_values():
+        for sensor in sensors:
+            sensor.native_value
+
+    def sensors_available():
+        for sensor in sensors:
+            sensor.available
+
+    # Per-entity cost, so adding sensors doesn't read as a regression
+    per_sensor = len(sensors)
+    cases["sensor.native_value[per entity]"] = (native_values, per_sensor)
+    cases["sensor.available[per entity]"] = (sensors_available, per_sensor)
+    cases["device_tracker.latitude"] = lambda: tracker.latitude
+    cases["device_tracker.available"] = lambda: tracker.available
+    return cases
+
+
+def run(name_filter, repeat):
+    """Time every case; returns (calibration ns, {name: ns})."""
+    cases = asyncio.run(collect_cases())
+    reference = time_call(calibration, repeat)
+    results = {}
+    for name, case in cases.items():
+        if name_filter and name_filter not in name:
+            continue
+        func, per = case if isinstance(case, tuple) else (case, 1)
+        results[name] = time_call(func, repeat) / per
+    # Calibrate on both sides of the run so a slow start doesn't skew every ratio
+    reference = min(reference, time_call(calibration, repeat))
+    return reference, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero when a benchmark regressed past the tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown against the baseline (0.5 = 50%%)")
+    parser.add_argument("--write-baseline", action="store_true",
+                        help=f"store the results in {BASELINE.relative_to(REPO)}")
+    args = parser.parse_args()
+
+    reference, results = run(args.filter, args.repeat)
+    baseline = json.loads(BASELINE.read_text())["relative"] if BASELINE.exists() else {}
+
+    regressions = []
+    print(f"calibration loop: {reference:.0f} ns")
+    print(f"{'benchmark':<48} {'ns/call':>10} {'relative':>9} {'baseline':>9} {'change':>8}")
+    for name, ns in results.items():
+        relative = ns / reference
+        line = f"{name:<48} {ns:>10.1f} {relative:>9.4f}"
+        if (base := baseline.get(name)) is not None:
+            change = relative / base - 1
+            line += f" {base:>9.4f} {change:>+7.0%}"
+            if change > args.tolerance:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.write_baseline:
+        BASELINE.parent.mkdir(exist_ok=True)
+        # A filtered run only updates the benchmarks it ran
+        baseline.update({name: round(ns / reference, 5) for name, ns in results.items()})
+        BASELINE.write_text(json.dumps({"relative": dict(sorted(baseline.items()))}, indent=2) + "\n")
+        print(f"wrote {BASELINE.relative_to(REPO)}")
+
+    if args.check and regressions:
+        print(f"{len(regressions)} benchmark(s) regressed more than {args.tolerance:.0%}:")
+        for name in regressions:
+            print(f"  {name}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the telemetry ping decoder.
+
+Measures the per-item cost of decoding a ping response at 1k and 10k items
+(the scale REQUEST_ALL_ALIASES produces and beyond), next to the previous
+per-item string-splitting parser for reference.
+
+Usage:
+    python3 benchmarks/bench_ping_decoder.py [--repeat N]
+
+Only the standard library is needed - telemetry.py is loaded directly so
+Home Assistant does not have to be installed.
+"""
+
+import argparse
+import importlib.util
+import pathlib
+import sys
+import timeit
+
+TELEMETRY_PY = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "custom_components" / "vinfast" / "telemetry.py"
+)
+
+
+def load_telemetry():
+    """Load telemetry.py without importing the integration package."""
+    spec = importlib.util.spec_from_file_location("vinfast_telemetry", TELEMETRY_PY)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_fixture(telemetry, count):
+    """Build a plan and a matching ping response with `count` resources."""
+    core = list(telemetry.ALIAS_TO_KEY)
+    resources = []
+    items = []
+    for index in range(count):
+        obj_id, rsrc_id = str(34000 + index // 10), str(index % 10)
+        alias = core[index] if index < len(core) else f"SYNTHETIC_ALIAS_{index}"
+        resource_type = "String" if index % 7 == 0 else "Float"
+        resources.append((alias, obj_id, "1", rsrc_id, resource_type))
+        items.append({
+            "objectId": int(obj_id),
+            "instanceId": 1,
+            "resourceId": int(rsrc_id),
+            "deviceKey": f"{obj_id}_00001_{int(rsrc_id):05d}",
+            "value": "ON" if resource_type == "String" else f"{index * 1.5}",
+            "lastUpdateTime": 1700000000000 + index,
+        })
+    return telemetry.TelemetryRequestPlan(resources), resources, items
+
+
+def legacy_parse(raw_data, path_to_alias, alias_to_key):
+    """The pre-plan parser, kept here as a reference point."""
+    result = {"_raw_aliases": {}}
+    for item in raw_data:
+        if not isinstance(item, dict):
+            continue
+        device_key = item.get("deviceKey")
+        value = item.get("value")
+        last_update = item.get("lastUpdateTime")
+        if device_key and value is not None:
+            parts = device_key.split("_")
+            if len(parts) == 3:
+                path = f"/{str(int(parts[0]))}/{str(int(parts[1]))}/{str(int(parts[2]))}"
+            else:
+                path = device_key
+            alias = path_to_alias.get(path, path) if path_to_alias else path
+            try:
+                parsed_value = float(value)
+            except (ValueError, TypeError):
+                parsed_value = value
+            result["_raw_aliases"][alias] = {
+                "value": parsed_value,
+                "path": path,
+                "last_update": last_update,
+            }
+            result[alias_to_key.get(alias, alias.lower())] = parsed_value
+    return result
+
+
+def bench(func, items, repeat):
+    """Return the best per-item time in microseconds."""
+    loops = max(1, 20000 // len(items))
+    best = min(timeit.repeat(func, number=loops, repeat=repeat))
+    return best / loops / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    telemetry = load_telemetry()
+    print(f"{'items':>8} {'decoder us/item':>16} {'legacy us/item':>16} {'speedup':>8}")
+    for count in (1000, 10000):
+        plan, resources, items = build_fixture(telemetry, count)
+        path_to_alias = {f"/{o}/{i}/{r}": a for a, o, i, r, _ in resources}
+        alias_to_key = dict(telemetry.ALIAS_TO_KEY)
+
+        decoded, _ = telemetry.decode_ping_response(items, plan)
+        assert len(decoded) == count, "decoder dropped items"
+
+        fast = bench(lambda: telemetry.decode_ping_response(items, plan), items, args.repeat)
+        slow = bench(lambda: legacy_parse(items, path_to_alias, alias_to_key), items, args.repeat)
+        print(f"{count:>8} {fast:>16.3f} {slow:>16.3f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
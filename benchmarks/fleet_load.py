@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Fleet load test: how the integration scales with the number of vehicles.
+
+Boots a real Home Assistant instance, sets the integration up against the
+stand-in cloud (tools/fake_cloud.py) with N synthetic vehicles, and runs
+update rounds. Between rounds every vehicle's telemetry moves on through
+a driving / charging / parked / sleeping state machine. For each fleet
+size it reports:
+
+  - update latency (p50/p99): one coordinator refresh, from the request
+    until every entity has written its state
+  - state writes per round and per second of update time
+  - event loop lag (p99/max) measured while the rounds run
+  - RSS, and RSS added per vehicle by setting the integration up
+
+The stand-in cloud runs in its own process so its work doesn't count
+against the integration's latency or loop lag. By default the per-host
+rate limiter is opened up, so the numbers measure the integration rather
+than VinFast's request budget; --rate-limit keeps the real limits.
+
+Usage:
+    python3 benchmarks/fleet_load.py [--vehicles 1,10,100,500] [--rounds N]
+    python3 benchmarks/fleet_load.py --write-baseline
+
+Needs Home Assistant installed (any version the integration supports).
+Results are compared with benchmarks/baselines/fleet_load.json, which
+records the machine and versions it was measured on.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import pathlib
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = pathlib.Path(__file__).resolve().parent.parent
+BASELINE = REPO / "benchmarks" / "baselines" / "fleet_load.json"
+sys.path.insert(0, str(REPO / "tools"))
+
+DEFAULT_SIZES = "1,10,100,500"
+
+# Share of the fleet starting in each state
+STATE_MIX = {"driving": 0.2, "charging": 0.15, "parked": 0.35, "sleeping": 0.3}
+
+# Per-round chance of moving from one state to another
+TRANSITIONS = {
+    "driving": {"parked": 0.15},
+    "charging": {},  # leaves once the charge target is reached
+    "parked": {"driving": 0.08, "charging": 0.05, "sleeping": 0.15},
+    "sleeping": {"driving": 0.04},
+}
+
+# Minutes of simulated time per update round
+ROUND_MINUTES = 5
+
+GEAR_PARK = 1
+GEAR_DRIVE = 4
+
+
+class SyntheticVehicle:
+    """Telemetry stream for one simulated car."""
+
+    def __init__(self, rng: random.Random) -> None:
+        """Start the car in a random state with plausible readings."""
+        self._rng = rng
+        self.state = rng.choices(list(STATE_MIX), weights=list(STATE_MIX.values()))[0]
+        self.soc = rng.uniform(25, 90)
+        self.target_soc = rng.choice((80, 90, 100))
+        self.odometer = rng.uniform(500, 60000)
+        self.latitude = 21.0285 + rng.uniform(-0.2, 0.2)
+        self.longitude = 105.8522 + rng.uniform(-0.2, 0.2)
+        self.heading = rng.uniform(0, 360)
+        self.outside_temp = rng.uniform(18, 34)
+        self.cabin_temp = self.outside_temp
+
+    def step(self, minutes: float) -> dict[str, object] | None:
+        """Advance the car; return changed aliases, or None while it sleeps."""
+        rng = self._rng
+        for state, chance in TRANSITIONS[self.state].items():
+            if rng.random() < chance:
+                self.state = state
+                break
+        if self.state == "charging" and self.soc >= self.target_soc:
+            self.state = "parked"
+
+        self.outside_temp += rng.uniform(-0.3, 0.3)
+        if self.state == "sleeping":
+            return None
+
+        values: dict[str, object] = {}
+        speed = 0.0
+        if self.state == "driving":
+            speed = rng.uniform(20, 110)
+            distance = speed * minutes / 60
+            self.odometer += distance
+            self.soc = max(self.soc - distance * 0.2, 5)
+            self.heading = (self.heading + rng.uniform(-30, 30)) % 360
+            self.latitude += distance / 111 * rng.uniform(-1, 1)
+            self.longitude += distance / 111 * rng.uniform(-1, 1)
+            self.cabin_temp += (22 - self.cabin_temp) * 0.5
+        elif self.state == "charging":
+            self.soc = min(self.soc + minutes * 0.5, self.target_soc)
+        else:
+            self.cabin_temp += (self.outside_temp - self.cabin_temp) * 0.3
+
+        charging = self.state == "charging"
+        values.update({
+            "VEHICLE_STATUS_HV_BATTERY_SOC": round(self.soc),
+            "VEHICLE_STATUS_REMAINING_DISTANCE": round(self.soc * 4.1),
+            "VEHICLE_STATUS_ODOMETER": round(self.odometer, 1),
+            "VEHICLE_STATUS_VEHICLE_SPEED": round(speed),
+            "VEHICLE_STATUS_GEAR_POSITION": GEAR_DRIVE if speed else GEAR_PARK,
+            "VEHICLE_STATUS_IGNITION_STATUS": int(self.state == "driving"),
+            "VEHICLE_STATUS_HANDBRAKE_STATUS": int(self.state != "driving"),
+            "CHARGING_STATUS_CHARGING_STATUS": int(charging),
+            "REMOTE_CONTROL_CHARGE_PORT_STATUS": int(charging),
+            "CHARGING_STATUS_CHARGING_REMAINING_TIME": (
+                round((self.target_soc - self.soc) * 2) if charging else 0
+            ),
+            "CHARGE_CONTROL_CURRENT_TARGET_SOC": self.target_soc,
+            "VEHICLE_STATUS_AMBIENT_TEMPERATURE": round(self.outside_temp),
+            "CLIMATE_INFORMATION_DRIVER_TEMPERATURE": round(self.cabin_temp),
+            "LOCATION_LATITUDE": round(self.latitude, 5),
+            "LOCATION_LONGITUDE": round(self.longitude, 5),
+            "VEHICLE_BEARING_DEGREE": round(self.heading),
+        })
+        return values
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def rss_mb() -> float:
+    """Return the current resident set size in MiB."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+# Stand-in cloud process
+
+
+async def serve_cloud(vehicles: int, seed: int) -> None:
+    """Run the stand-in cloud with a synthetic fleet until stdin closes."""
+    from aiohttp import web
+    from fake_cloud import FakeVinFastCloud
+
+    rng = random.Random(seed)
+    cloud = FakeVinFastCloud(seed=seed)
+    fleet: dict[str, SyntheticVehicle] = {}
+    for index in range(vehicles):
+        vin = f"VFFAKE{index + 1:011d}"
+        if vin not in cloud.vins:
+            cloud.add_vehicle(vin, vehicleName=f"VF 8 #{index + 1}")
+        fleet[vin] = SyntheticVehicle(rng)
+
+    def advance(minutes: float) -> dict[str, int]:
+        states: dict[str, int] = dict.fromkeys(STATE_MIX, 0)
+        for vin, vehicle in fleet.items():
+            if (values := vehicle.step(minutes)) is not None:
+                cloud.set_values(vin, values)
+            states[vehicle.state] += 1
+        return states
+
+    async def handle_step(request: web.Request) -> web.Response:
+        minutes = (await request.json()).get("minutes", ROUND_MINUTES)
+        return web.json_response(advance(minutes))
+
+    cloud.app.router.add_post("/_fleet/step", handle_step)
+    advance(0)
+    port = await cloud.start()
+    print(port, flush=True)
+    await asyncio.get_running_loop().run_in_executor(None, sys.stdin.read)
+    await cloud.stop()
+
+
+# Home Assistant process
+
+
+async def measure_lag(samples: list[float], stop: asyncio.Event, interval: float = 0.01) -> None:
+    """Record how late the event loop wakes up from short sleeps."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(loop.time() - started - interval, 0.0))
+
+
+async def run_fleet(vehicles: int, rounds: int, rate_limit: bool, seed: int) -> dict:
+    """Measure one fleet size against a stand-in cloud process; returns the result row."""
+    cloud_proc = subprocess.Popen(
+        [sys.executable, __file__, "--cloud", str(vehicles), "--seed", str(seed)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        port = int(cloud_proc.stdout.readline())
+        return await measure_fleet(port, vehicles, rounds, rate_limit)
+    finally:
+        cloud_proc.stdin.close()
+        cloud_proc.wait()
+
+
+async def measure_fleet(port: int, vehicles: int, rounds: int, rate_limit: bool) -> dict:
+    """Set the integration up in a fresh Home Assistant and time update rounds."""
+    from homeassistant import bootstrap, runner
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.const import EVENT_STATE_CHANGED
+    from homeassistant.helpers.entity import Entity
+
+    with tempfile.TemporaryDirectory(prefix="vinfast-fleet-") as config_dir:
+        config = pathlib.Path(config_dir)
+        (config / "configuration.yaml").write_text("homeassistant:\n")
+        (config / "custom_components").mkdir()
+        (config / "custom_components" / "vinfast").symlink_to(
+            REPO / "custom_components" / "vinfast"
+        )
+
+        hass = await bootstrap.async_setup_hass(
+            runner.RuntimeConfig(config_dir=config_dir, skip_pip=True)
+        )
+        await hass.async_start()
+
+        from fake_cloud import stand_in_session
+        # Platforms are imported up front so RSS per vehicle excludes module code
+        from custom_components.vinfast import (  # noqa: F401
+            account,
+            binary_sensor,
+            device_tracker,
+            ratelimit,
+            sensor,
+            switch,
+        )
+        from custom_components.vinfast.const import (
+            CONF_DAILY_BUDGET,
+            CONF_REGION,
+            CONF_UPDATE_INTERVAL,
+            DOMAIN,
+        )
+
+        session = stand_in_session(port)
+        account.async_get_clientsession = lambda _hass: session
+        if not rate_limit:
+            for host in (
+                "vinfast-us-prod.us.auth0.com",
+                "mobile.connected-car.vinfastauto.us",
+            ):
+                ratelimit._LIMITERS[host] = ratelimit.HostRateLimiter(rate=1e9, burst=10**9)
+
+        writes = 0
+        changes = 0
+        write_ha_state = Entity.async_write_ha_state
+
+        def counting_write_ha_state(self):
+            nonlocal writes
+            writes += 1
+            write_ha_state(self)
+
+        def count_change(_event) -> None:
+            nonlocal changes
+            changes += 1
+
+        Entity.async_write_ha_state = counting_write_ha_state
+        hass.bus.async_listen(EVENT_STATE_CHANGED, count_change)
+
+        rss_before = rss_mb()
+        entry = ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="Fleet",
+            data={"email": "fleet@example.com", "password": "fleet", CONF_REGION: "us"},
+            source="user",
+            # Rounds are driven by the harness, not the update interval, and
+            # a big fleet sends more pings per round than a day's budget
+            options={CONF_UPDATE_INTERVAL: 86400, CONF_DAILY_BUDGET: 0},
+        )
+        setup_started = time.perf_counter()
+        await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        setup_time = time.perf_counter() - setup_started
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        entities = len(hass.states.async_entity_ids(("sensor", "binary_sensor", "device_tracker", "switch")))
+        rss_setup = rss_mb()
+
+        lag: list[float] = []
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(measure_lag(lag, stop))
+        latencies: list[float] = []
+        writes_per_round: list[int] = []
+        changes_per_round: list[int] = []
+        for _ in range(rounds):
+            async with session.post(
+                "https://fleet.invalid/_fleet/step", json={"minutes": ROUND_MINUTES}
+            ) as response:
+                await response.read()
+            writes_before, changes_before = writes, changes
+            started = time.perf_counter()
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            latencies.append(time.perf_counter() - started)
+            writes_per_round.append(writes - writes_before)
+            changes_per_round.append(changes - changes_before)
+        stop.set()
+        await lag_task
+
+        result = {
+            "vehicles": vehicles,
+            "entities": entities,
+            "setup_s": round(setup_time, 3),
+            "latency_p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "latency_p99_ms": round(percentile(latencies, 99) * 1000, 1),
+            "writes_per_round": round(sum(writes_per_round) / rounds, 1),
+            "changes_per_round": round(sum(changes_per_round) / rounds, 1),
+            "writes_per_s": round(sum(writes_per_round) / sum(latencies)),
+            "loop_lag_p99_ms": round(percentile(lag, 99) * 1000, 1),
+            "loop_lag_max_ms": round(max(lag, default=0.0) * 1000, 1),
+            "rss_mb": round(rss_mb(), 1),
+            "rss_per_vehicle_kb": round((rss_setup - rss_before) * 1024 / vehicles, 1),
+        }
+
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop()
+        await session.close()
+
+    return result
+
+
+# Orchestration
+
+COLUMNS = (
+    ("vehicles", "vehicles"),
+    ("entities", "entities"),
+    ("latency_p50_ms", "p50 ms"),
+    ("latency_p99_ms", "p99 ms"),
+    ("writes_per_round", "writes/round"),
+    ("changes_per_round", "changes/round"),
+    ("writes_per_s", "writes/s"),
+    ("loop_lag_p99_ms", "lag p99 ms"),
+    ("loop_lag_max_ms", "lag max ms"),
+    ("rss_mb", "RSS MiB"),
+    ("rss_per_vehicle_kb", "KiB/vehicle"),
+)
+
+
+def print_table(results: list[dict], baseline: dict[int, dict]) -> None:
+    """Print results, with the baseline value under each changed number."""
+    print(" ".join(f"{title:>13}" for _, title in COLUMNS))
+    for row in results:
+        print(" ".join(f"{row[key]:>13}" for key, _ in COLUMNS))
+        if (base := baseline.get(row["vehicles"])) is not None:
+            print(" ".join(
+                f"{'(' + str(base.get(key, '-')) + ')':>13}" if key != "vehicles" else f"{'baseline':>13}"
+                for key, _ in COLUMNS
+            ))
+
+
+def environment() -> dict:
+    """Describe where the numbers were measured."""
+    from homeassistant.const import __version__ as ha_version
+
+    return {
+        "python": platform.python_version(),
+        "home_assistant": ha_version,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", default=DEFAULT_SIZES, help="comma-separated fleet sizes")
+    parser.add_argument("--rounds", type=int, default=20, help="update rounds per fleet size")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the synthetic fleet")
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="keep the integration's real per-host rate limits")
+    parser.add_argument("--write-baseline", action="store_true",
+                        help=f"store the results in {BASELINE.relative_to(REPO)}")
+    parser.add_argument("--cloud", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--run", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cloud is not None:
+        asyncio.run(serve_cloud(args.cloud, args.seed))
+        return
+    if args.run is not None:
+        result = asyncio.run(run_fleet(args.run, args.rounds, args.rate_limit, args.seed))
+        print(json.dumps(result))
+        return
+
+    # Each fleet size runs in a fresh process so RSS and caches start clean
+    results = []
+    for size in (int(v) for v in args.vehicles.split(",")):
+        command = [sys.executable, __file__, "--run", str(size),
+                   "--rounds", str(args.rounds), "--seed", str(args.seed)]
+        if args.rate_limit:
+            command.append("--rate-limit")
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+        print(f"measured {size} vehicles", file=sys.stderr)
+
+    baseline = {}
+    if BASELINE.exists():
+        baseline = {row["vehicles"]: row for row in json.loads(BASELINE.read_text())["results"]}
+    print_table(results, baseline)
+
+    if args.write_baseline:
+        BASELINE.parent.mkdir(exist_ok=True)
+        BASELINE.write_text(json.dumps({
+            "environment": environment(),
+            "rounds": args.rounds,
+            "rate_limit": args.rate_limit,
+            "results": results,
+        }, indent=2) + "\n")
+        print(f"wrote {BASELINE.relative_to(REPO)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,11 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_EMAIL, Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .account import account_id, alias_store, budget_store, token_store, yield_store
+from .const import CONF_REGION, DEFAULT_REGION, DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,9 +51,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unsubscribe from charger state changes
     coordinator: VinFastDataUpdateCoordinator = hass.data[DOMAIN].get(entry.entry_id)
     if coordinator:
-        coordinator.async_unsubscribe()
+        await coordinator.async_unsubscribe()
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove an account's persisted data when the last entry for it is deleted."""
+    region = entry.data.get(CONF_REGION, DEFAULT_REGION)
+    email = entry.data[CONF_EMAIL]
+    key = account_id(region, email)
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if other.entry_id != entry.entry_id and key == account_id(
+            other.data.get(CONF_REGION, DEFAULT_REGION), other.data[CONF_EMAIL]
+        ):
+            return
+    for store in (token_store, alias_store, yield_store, budget_store):
+        await store(hass, region, email).async_remove()
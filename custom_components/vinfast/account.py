@@ -0,0 +1,305 @@
+"""Shared VinFast account clients."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .api import TOKEN_REFRESH_MARGIN, VinFastApi, VinFastApiError, VinFastRateLimitError
+from .budget import RequestBudget
+from .const import (
+    CONF_DAILY_BUDGET,
+    CONF_REGION,
+    DATA_ACCOUNTS,
+    DATA_ACCOUNTS_LOCK,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_REGION,
+    STORAGE_KEY_ALIASES,
+    STORAGE_KEY_ALIAS_YIELD,
+    STORAGE_KEY_BUDGET,
+    STORAGE_KEY_TOKENS,
+    STORAGE_VERSION,
+    TOKEN_REFRESH_RETRY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def account_id(region: str, email: str) -> str:
+    """Return a stable, non-identifying id for a (region, account) pair."""
+    return hashlib.sha256(f"{region}:{email.strip().lower()}".encode()).hexdigest()[:16]
+
+
+def token_store(hass: HomeAssistant, region: str, email: str) -> Store[dict[str, Any]]:
+    """Return the Store holding an account's tokens."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_TOKENS}.{account_id(region, email)}")
+
+
+def alias_store(hass: HomeAssistant, region: str, email: str) -> Store[dict[str, Any]]:
+    """Return the Store holding an account's alias catalogues."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_ALIASES}.{account_id(region, email)}")
+
+
+def yield_store(hass: HomeAssistant, region: str, email: str) -> Store[dict[str, Any]]:
+    """Return the Store holding an account's alias yield profiles."""
+    return Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY_ALIAS_YIELD}.{account_id(region, email)}"
+    )
+
+
+def budget_store(hass: HomeAssistant, region: str, email: str) -> Store[dict[str, Any]]:
+    """Return the Store holding an account's request count for today."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_BUDGET}.{account_id(region, email)}")
+
+
+class VinFastAccount:
+    """One authenticated API client per (region, account).
+
+    Config entries, config/options flows and entities all borrow the same
+    client, so tokens, the alias catalogue and the vehicle list are shared
+    instead of every caller logging in and fetching vehicles again. The
+    account persists its tokens and keeps them fresh in the background
+    while at least one config entry uses it. It also counts every request
+    against the account's daily budget.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        region: str,
+        email: str,
+        password: str,
+        api: VinFastApi | None = None,
+    ) -> None:
+        """Initialize the account, adopting a client that already logged in."""
+        self.hass = hass
+        self.id = account_id(region, email)
+        self.api = api or VinFastApi(async_get_clientsession(hass), region=region)
+        self.api.set_credentials(email, password)
+        self._password = password
+        self._entries: set[str] = set()
+        self._unsub_token_refresh: CALLBACK_TYPE | None = None
+        self._alias_refresh_task: asyncio.Task | None = None
+        self._token_store = token_store(hass, region, email)
+        self._alias_store = alias_store(hass, region, email)
+        self._yield_store = yield_store(hass, region, email)
+        self.budget = RequestBudget()
+        self._budget_store = budget_store(hass, region, email)
+
+    async def async_setup(self) -> None:
+        """Restore persisted tokens, alias catalogue, yield profiles and request count."""
+        api = self.api
+        if api.token_valid:
+            # Adopted from a flow that just logged in - keep its newer tokens
+            self._token_store.async_delay_save(api.export_tokens, 1)
+        elif stored := await self._token_store.async_load():
+            if api.restore_tokens(stored):
+                _LOGGER.debug("Restored access token from storage")
+            else:
+                _LOGGER.debug("Stored access token expired, will refresh")
+
+        if stored_aliases := await self._alias_store.async_load():
+            api.load_alias_cache(stored_aliases.get("entries", {}))
+
+        if stored_yield := await self._yield_store.async_load():
+            api.load_yield_profiles(stored_yield.get("profiles", {}))
+
+        if stored_budget := await self._budget_store.async_load():
+            self.budget.load(stored_budget)
+
+        api.set_token_listener(self._handle_token_update)
+        api.set_request_listener(self.async_record_request)
+        api.set_alias_listener(self._handle_alias_update)
+        api.set_yield_listener(self._handle_yield_update)
+
+    def update_password(self, password: str) -> bool:
+        """Switch to a new password. Returns True if it differs from the current one.
+
+        The old tokens are dropped so the next ensure_token() proves the new
+        password with a password grant.
+        """
+        if password == self._password:
+            return False
+        self._password = password
+        self.api.set_credentials(self.api.email or "", password)
+        self.api.clear_tokens()
+        return True
+
+    @property
+    def in_use(self) -> bool:
+        """Return True while a config entry uses the account."""
+        return bool(self._entries)
+
+    @callback
+    def async_acquire(self, entry: ConfigEntry) -> None:
+        """Mark the account as used by a config entry and apply its options."""
+        self._entries.add(entry.entry_id)
+        # One budget per account: the entry that acquired it last sets the allowance
+        self.budget.allowance = entry.options.get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET)
+        if self._unsub_token_refresh is None:
+            self._schedule_token_refresh()
+
+    async def async_release(self, entry_id: str) -> None:
+        """Release a config entry's use; the last release shuts the account down.
+
+        Delayed saves are written out first. An account set up again for
+        these credentials then loads the latest state, and a delayed save
+        left behind can't overwrite what the new one saves.
+        """
+        self._entries.discard(entry_id)
+        if self._entries:
+            return
+        if self._unsub_token_refresh:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+        if self._alias_refresh_task and not self._alias_refresh_task.done():
+            self._alias_refresh_task.cancel()
+        await self._async_flush_stores()
+        if self._entries:
+            return  # Acquired again while saving
+        self.hass.data.get(DATA_ACCOUNTS, {}).pop(self.id, None)
+
+    async def _async_flush_stores(self) -> None:
+        """Write the budget, yield profiles and alias catalogues now."""
+        api = self.api
+        await self._budget_store.async_save(self.budget.export())
+        await self._yield_store.async_save({"profiles": api.export_yield_profiles()})
+        await self._alias_store.async_save({"entries": api.export_alias_cache()})
+
+    @callback
+    def _handle_token_update(self) -> None:
+        """Persist new tokens and reschedule the background refresh."""
+        self._token_store.async_delay_save(self.api.export_tokens, 1)
+        if self._entries:
+            self._schedule_token_refresh()
+
+    @callback
+    def _schedule_token_refresh(self, delay: float | None = None) -> None:
+        """Schedule a token refresh shortly before the access token expires."""
+        if self._unsub_token_refresh:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+
+        if delay is None:
+            expires_at = self.api.token_expires_at
+            if expires_at is None:
+                return
+            delay = max(expires_at - TOKEN_REFRESH_MARGIN - time.time(), TOKEN_REFRESH_RETRY)
+
+        _LOGGER.debug("Next token refresh in %d seconds", delay)
+        self._unsub_token_refresh = async_call_later(
+            self.hass, delay, self._async_background_token_refresh
+        )
+
+    async def _async_background_token_refresh(self, _now: Any) -> None:
+        """Renew the access token ahead of expiry."""
+        self._unsub_token_refresh = None
+        if not self._entries:
+            return
+
+        try:
+            await self.api.ensure_token()
+        except VinFastRateLimitError as err:
+            _LOGGER.warning("Background token refresh rate limited: %s", err)
+            self._schedule_token_refresh(max(TOKEN_REFRESH_RETRY, err.retry_after or 0))
+            return
+        except VinFastApiError as err:
+            _LOGGER.warning("Background token refresh failed: %s", err)
+            self._schedule_token_refresh(TOKEN_REFRESH_RETRY)
+            return
+
+        # ensure_token() is a no-op while the token is still fresh, in which
+        # case the token listener did not fire and we reschedule ourselves
+        if self._unsub_token_refresh is None:
+            self._schedule_token_refresh()
+
+    @callback
+    def _handle_alias_update(self) -> None:
+        """Persist a freshly fetched alias catalogue."""
+        api = self.api
+        self._alias_store.async_delay_save(
+            lambda: {"entries": api.export_alias_cache()}, 1
+        )
+
+    @callback
+    def _handle_yield_update(self) -> None:
+        """Persist the learned alias yield profiles."""
+        api = self.api
+        self._yield_store.async_delay_save(
+            lambda: {"profiles": api.export_yield_profiles()}, 60
+        )
+
+    @callback
+    def async_record_request(self, url: str) -> None:
+        """Count a request against the daily budget and persist the count."""
+        self.budget.record(url)
+        self._budget_store.async_delay_save(self.budget.export, 60)
+
+    @callback
+    def async_check_alias_cache(self) -> None:
+        """Re-fetch stale alias catalogues in the background."""
+        if not self.api.alias_cache_stale:
+            return
+        if self._alias_refresh_task and not self._alias_refresh_task.done():
+            return
+        _LOGGER.debug("Alias catalogue is stale, refreshing in the background")
+        self._alias_refresh_task = self.hass.async_create_task(
+            self.api.async_refresh_stale_alias_catalogues()
+        )
+
+
+async def async_get_account(
+    hass: HomeAssistant,
+    region: str,
+    email: str,
+    password: str,
+    api: VinFastApi | None = None,
+) -> VinFastAccount:
+    """Return the shared account for these credentials, creating it if needed.
+
+    A new account adopts api when given - a config flow's client that has
+    just logged in. The credentials of an account in use by a config entry
+    are never changed here, so an unchecked password can't log it out.
+    """
+    accounts: dict[str, VinFastAccount] = hass.data.setdefault(DATA_ACCOUNTS, {})
+    lock: asyncio.Lock = hass.data.setdefault(DATA_ACCOUNTS_LOCK, asyncio.Lock())
+    key = account_id(region, email)
+
+    # Callers setting up together wait for one account to be set up and share it
+    async with lock:
+        if (account := accounts.get(key)) is not None:
+            if not account.in_use and account.update_password(password):
+                _LOGGER.debug("Password changed, the next request will log in again")
+            return account
+
+        account = VinFastAccount(hass, region, email, password, api)
+        await account.async_setup()
+        # Only registered once its tokens, caches and listeners are in place
+        accounts[key] = account
+    return account
+
+
+@callback
+def async_get_loaded_account(hass: HomeAssistant, entry: ConfigEntry) -> VinFastAccount | None:
+    """Return the shared account of a config entry if one exists, without creating it."""
+    key = account_id(entry.data.get(CONF_REGION, DEFAULT_REGION), entry.data[CONF_EMAIL])
+    return hass.data.get(DATA_ACCOUNTS, {}).get(key)
+
+
+async def async_get_entry_account(hass: HomeAssistant, entry: ConfigEntry) -> VinFastAccount:
+    """Return the shared account for a config entry's credentials."""
+    return await async_get_account(
+        hass,
+        entry.data.get(CONF_REGION, DEFAULT_REGION),
+        entry.data[CONF_EMAIL],
+        entry.data[CONF_PASSWORD],
+    )
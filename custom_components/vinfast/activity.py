@@ -0,0 +1,81 @@
+"""Vehicle activity state machine for adaptive polling."""
+from __future__ import annotations
+
+import logging
+
+from .view import VehicleView
+
+_LOGGER = logging.getLogger(__name__)
+
+# A car stays "recently parked" this long after it last drove or charged, and
+# values it uploaded longer ago than this no longer say it is active (seconds)
+RECENTLY_PARKED_WINDOW = 3600
+
+STATE_DRIVING = "driving"
+STATE_CHARGING = "charging"
+STATE_PARKED = "parked"
+STATE_ASLEEP = "asleep"
+
+# Telemetry the state machine reads; always requested from the ping
+ACTIVITY_TELEMETRY_KEYS = ("ignition", "gear", "speed", "charging_status")
+
+# Gear positions that mean the car is being driven
+_MOVING_GEARS = frozenset({"D", "R"})
+
+
+class VehicleActivity:
+    """Tracks what a vehicle is doing from its own telemetry.
+
+    Driving: ignition on, in gear or moving. Charging: the charging status
+    says so. Parked: neither, but it was driving or charging within the
+    recently parked window. Asleep: idle for longer than that (and the
+    state until the first telemetry shows otherwise).
+
+    The server keeps serving the car's last values after it goes quiet, so
+    they only count as driving or charging while the car's last upload is
+    within the recently parked window. Times are the car's upload times,
+    not when they were polled.
+    """
+
+    def __init__(self, parked_window: float = RECENTLY_PARKED_WINDOW) -> None:
+        """Initialize an asleep vehicle."""
+        self._parked_window = parked_window
+        self._state = STATE_ASLEEP
+        self._active_at: int | None = None  # epoch milliseconds
+
+    @property
+    def state(self) -> str:
+        """Return the current activity state."""
+        return self._state
+
+    def update(self, view: VehicleView, uploaded_ms: int | None, now_ms: int) -> bool:
+        """Update the state from the latest derived telemetry; True if it changed.
+
+        uploaded_ms is when the car last uploaded, in epoch milliseconds.
+        """
+        window_ms = self._parked_window * 1000
+        # Values from a car that has since gone quiet say nothing about now
+        current = (
+            view.has_telemetry
+            and view.expired.isdisjoint(ACTIVITY_TELEMETRY_KEYS)
+            and uploaded_ms is not None
+            and now_ms - uploaded_ms < window_ms
+        )
+        if current and (
+            view.ignition_on or view.gear in _MOVING_GEARS or (view.speed_mph or 0) > 0
+        ):
+            state = STATE_DRIVING
+        elif current and view.charging:
+            state = STATE_CHARGING
+        elif self._active_at is not None and now_ms - self._active_at < window_ms:
+            state = STATE_PARKED
+        else:
+            state = STATE_ASLEEP
+
+        if state in (STATE_DRIVING, STATE_CHARGING):
+            self._active_at = uploaded_ms
+        if state == self._state:
+            return False
+        _LOGGER.debug("Vehicle %s is now %s (was %s)", view.vin, state, self._state)
+        self._state = state
+        return True
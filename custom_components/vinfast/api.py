@@ -1,7 +1,12 @@
 """VinFast Connected Car API Client."""
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any
 
 import aiohttp
@@ -15,6 +20,20 @@ from .const import (
     DEFAULT_REGION,
     REGIONS,
 )
+from .ratelimit import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    limiter_for,
+    parse_retry_after,
+)
+from .telemetry import (
+    AliasCatalogue,
+    AliasYieldTracker,
+    TelemetryRequestPlan,
+    TelemetrySnapshot,
+    aliases_for_keys,
+    decode_ping_response,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,6 +117,45 @@ FALLBACK_TELEMETRY_RESOURCES = [
 ]
 
 
+# Refresh the access token this many seconds before the JWT expires
+TOKEN_REFRESH_MARGIN = 300
+
+# Upper bound for each concurrently fetched part of a poll (seconds)
+FETCH_TIMEOUT = 45
+
+# How long get_vehicle_info() reuses slow-changing endpoint results (seconds)
+# Telemetry is never cached - it is the only data that needs per-poll freshness
+ENDPOINT_CACHE_TTL: dict[str, float] = {
+    "vehicles": 86400,   # Vehicle list rarely changes
+    "profile": 86400,    # Account profile
+    "locations": 86400,  # Favorite locations
+}
+
+# Persisted alias catalogues are re-fetched in the background after this age (seconds)
+ALIAS_CACHE_MAX_AGE = 7 * 86400
+# Minimum age before ping keys that don't resolve to an alias trigger a re-fetch (seconds)
+ALIAS_MISS_REFRESH_INTERVAL = 3600
+
+# Marks a vehicle whose ping failed in get_all_telemetry()
+_FAILED = object()
+
+
+def _decode_jwt_exp(token: str) -> float | None:
+    """Return the ``exp`` claim of a JWT as an epoch timestamp.
+
+    The signature is not verified - the expiry is only used to schedule
+    refreshes, the server remains the authority on token validity.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        exp = claims.get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
 class VinFastApiError(Exception):
     """Exception for VinFast API errors."""
 
@@ -106,20 +164,58 @@ class VinFastAuthError(VinFastApiError):
     """Exception for authentication errors."""
 
 
+class VinFastTokenExpiredError(VinFastAuthError):
+    """Exception raised when the server rejects the access token (HTTP 401)."""
+
+
+class VinFastRateLimitError(VinFastApiError):
+    """Exception raised when the server asks us to back off (HTTP 429/503)."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize with the server's Retry-After in seconds, if it sent one."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class VinFastApi:
     """VinFast Connected Car API Client."""
 
-    def __init__(self, session: aiohttp.ClientSession, region: str = DEFAULT_REGION) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        region: str = DEFAULT_REGION,
+        cache_ttl: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize the API client.
+
+        cache_ttl overrides ENDPOINT_CACHE_TTL per endpoint; a TTL of 0
+        disables caching for that endpoint.
+        """
         self._session = session
         self._region = region
         self._region_config = REGIONS.get(region, REGIONS[DEFAULT_REGION])
         self._access_token: str | None = None
         self._refresh_token: str | None = None
+        self._token_expires_at: float | None = None
+        self._token_listener: Callable[[], None] | None = None
+        self._request_listener: Callable[[str], None] | None = None
+        self._email: str | None = None
+        self._password: str | None = None
+        self._renew_future: asyncio.Future[None] | None = None
         self._user_id: str | None = None
-        self._vin: str | None = None
-        self._alias_mappings: dict[str, dict[str, str]] = {}  # alias -> {path, objectId, etc}
-        self._alias_version: str | None = None
+        self._vin: str | None = None  # primary vehicle, used for account-level requests
+        self._vehicles: dict[str, dict[str, Any]] = {}  # VIN -> vehicle info
+        self._alias_catalogues: dict[str, AliasCatalogue] = {}  # vehicle model -> catalogue
+        self._alias_listener: Callable[[], None] | None = None
+        self._persisted_aliases: dict[str, dict[str, Any]] = {}  # cache key -> entry
+        self._vehicle_model: str | None = None  # model of the primary vehicle
+        # (vehicle model, selection, reprobe) -> plan
+        self._request_plans: dict[tuple[str, str, bool], TelemetryRequestPlan] = {}
+        self._yield_trackers: dict[str, AliasYieldTracker] = {}  # vehicle model -> tracker
+        self._yield_listener: Callable[[], None] | None = None
+        self._requested_aliases: frozenset[str] | None = None  # None = all core aliases
+        self._cache_ttl: dict[str, float] = {**ENDPOINT_CACHE_TTL, **(cache_ttl or {})}
+        self._endpoint_cache: dict[str, tuple[float, Any]] = {}  # name -> (fetched_at, value)
 
     @property
     def auth0_domain(self) -> str:
@@ -143,16 +239,276 @@ class VinFastApi:
 
     @property
     def vin(self) -> str | None:
-        """Return the VIN."""
+        """Return the VIN of the primary (first) vehicle."""
         return self._vin
 
+    @property
+    def vins(self) -> list[str]:
+        """Return the VINs of all vehicles on the account."""
+        return list(self._vehicles)
+
+    @property
+    def vehicles(self) -> list[dict[str, Any]]:
+        """Return the last known vehicle list."""
+        return list(self._vehicles.values())
+
     @property
     def user_id(self) -> str | None:
         """Return the user ID."""
         return self._user_id
 
+    def user_id_for(self, vin: str | None) -> str | None:
+        """Return the user ID a vehicle is registered to, defaulting to the account's."""
+        return self._vehicles.get(vin or "", {}).get("userId") or self._user_id
+
+    @property
+    def access_token(self) -> str | None:
+        """Return the current access token."""
+        return self._access_token
+
+    @property
+    def token_expires_at(self) -> float | None:
+        """Return the access token expiry as an epoch timestamp."""
+        return self._token_expires_at
+
+    @property
+    def token_valid(self) -> bool:
+        """Return True if the access token is usable for at least the refresh margin."""
+        if not self._access_token:
+            return False
+        if self._token_expires_at is None:
+            # Opaque token without expiry - trust it until the server says otherwise
+            return True
+        return time.time() < self._token_expires_at - TOKEN_REFRESH_MARGIN
+
+    @property
+    def email(self) -> str | None:
+        """Return the account email."""
+        return self._email
+
+    def set_credentials(self, email: str, password: str) -> None:
+        """Remember credentials for falling back to a password grant."""
+        self._email = email
+        self._password = password
+
+    def set_token_listener(self, listener: Callable[[], None] | None) -> None:
+        """Register a callback invoked whenever the tokens change."""
+        self._token_listener = listener
+
+    def set_request_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Register a callback called with the URL of every request sent."""
+        self._request_listener = listener
+
+    def _count_request(self, url: str) -> None:
+        """Report a request about to be sent to the request listener."""
+        if self._request_listener:
+            self._request_listener(url)
+
+    async def _acquire(self, url: str, priority: int) -> None:
+        """Wait for the host's rate limiter, then count the request.
+
+        Raises VinFastRateLimitError instead of queueing through a server
+        backoff longer than the priority may wait.
+        """
+        limiter = limiter_for(url)
+        if limiter.too_long_to_wait(priority):
+            raise VinFastRateLimitError("Rate limited, backing off", limiter.blocked_for)
+        await limiter.acquire(priority)
+        self._count_request(url)
+
+    def _alias_cache_key(self, model: str, version: str) -> str:
+        """Return the key identifying a model's alias catalogue in storage."""
+        return f"{self._region}:{model}:{version}"
+
+    def _alias_catalogue(self, model: str) -> AliasCatalogue:
+        """Return the alias catalogue for a vehicle model."""
+        if model not in self._alias_catalogues:
+            self._alias_catalogues[model] = AliasCatalogue()
+        return self._alias_catalogues[model]
+
+    @property
+    def stale_alias_models(self) -> list[str]:
+        """Return the vehicle models whose alias catalogue should be re-fetched."""
+        now, now_monotonic = time.time(), time.monotonic()
+        stale = []
+        for model, catalogue in self._alias_catalogues.items():
+            if not catalogue.mappings or catalogue.fetched_at is None:
+                continue  # Nothing loaded yet - get_telemetry() fetches it inline
+            if now_monotonic - catalogue.attempted_at < ALIAS_MISS_REFRESH_INTERVAL:
+                continue  # Don't hammer get-alias when re-fetching keeps failing
+            age = now - catalogue.fetched_at
+            if (catalogue.miss and age > ALIAS_MISS_REFRESH_INTERVAL) or age > ALIAS_CACHE_MAX_AGE:
+                stale.append(model)
+        return stale
+
+    @property
+    def alias_cache_stale(self) -> bool:
+        """Return True if any vehicle model's alias catalogue should be re-fetched."""
+        return bool(self.stale_alias_models)
+
+    async def async_refresh_stale_alias_catalogues(self) -> None:
+        """Re-fetch the alias catalogue of every model it is stale for."""
+        for model in self.stale_alias_models:
+            await self.get_alias_mappings(force=True, vin=self._vin_for_model(model))
+
+    def set_alias_listener(self, listener: Callable[[], None] | None) -> None:
+        """Register a callback invoked after the alias catalogue was fetched."""
+        self._alias_listener = listener
+
+    def load_alias_cache(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Provide persisted alias catalogues, keyed by region, model and version."""
+        self._persisted_aliases = dict(entries)
+
+    def export_alias_cache(self) -> dict[str, dict[str, Any]]:
+        """Export all known alias catalogues for persistent storage."""
+        entries = dict(self._persisted_aliases)
+        for model, catalogue in self._alias_catalogues.items():
+            if catalogue.mappings and catalogue.fetched_at is not None:
+                entries[self._alias_cache_key(model, catalogue.version or "1.0")] = {
+                    "fetched_at": catalogue.fetched_at,
+                    "mappings": catalogue.mappings,
+                }
+        return entries
+
+    def _restore_alias_cache(self, model: str, version: str) -> bool:
+        """Load the persisted catalogue for this model and version, if any."""
+        entry = self._persisted_aliases.get(self._alias_cache_key(model, version))
+        if not entry or not entry.get("mappings"):
+            return False
+
+        self._alias_catalogue(model).load(entry["mappings"], version, entry.get("fetched_at", 0))
+        self._drop_request_plans(model)
+        _LOGGER.debug(
+            "Loaded %d alias mappings for %s from storage", len(entry["mappings"]), model
+        )
+        return True
+
+    def _drop_request_plans(self, model: str) -> None:
+        """Forget the compiled ping requests of a vehicle model."""
+        self._request_plans = {
+            key: plan for key, plan in self._request_plans.items() if key[0] != model
+        }
+
+    def _vin_for_model(self, model: str) -> str | None:
+        """Return a vehicle of this model, to scope model-specific requests to."""
+        for vin in self._vehicles:
+            if self._vehicle_model_for(vin) == model:
+                return vin
+        return self._vin
+
+    def _vehicle_model_for(self, vin: str | None) -> str:
+        """Return the model of a vehicle, for model-specific telemetry state."""
+        vehicle = self._vehicles.get(vin or "", {})
+        return vehicle.get("vehicleType") or self._vehicle_model or "unknown"
+
+    def _yield_tracker(self, model: str) -> AliasYieldTracker:
+        """Return the yield tracker for a vehicle model."""
+        if model not in self._yield_trackers:
+            self._yield_trackers[model] = AliasYieldTracker()
+        return self._yield_trackers[model]
+
+    def set_yield_listener(self, listener: Callable[[], None] | None) -> None:
+        """Register a callback invoked after a ping updated the yield profile."""
+        self._yield_listener = listener
+
+    def load_yield_profiles(self, profiles: dict[str, dict[str, Any]]) -> None:
+        """Restore learned yield profiles, keyed by vehicle model."""
+        self._yield_trackers = {
+            model: AliasYieldTracker(data) for model, data in profiles.items()
+        }
+        self._request_plans.clear()
+
+    def export_yield_profiles(self) -> dict[str, dict[str, Any]]:
+        """Export learned yield profiles for persistent storage."""
+        return {model: tracker.export() for model, tracker in self._yield_trackers.items()}
+
+    def export_tokens(self) -> dict[str, Any]:
+        """Export tokens for persistent storage."""
+        return {
+            "access_token": self._access_token,
+            "refresh_token": self._refresh_token,
+            "expires_at": self._token_expires_at,
+        }
+
+    def restore_tokens(self, data: dict[str, Any]) -> bool:
+        """Restore tokens from persistent storage.
+
+        Returns True if the restored access token can be used right away.
+        """
+        self._access_token = data.get("access_token")
+        self._refresh_token = data.get("refresh_token")
+        self._token_expires_at = data.get("expires_at")
+        return self.token_valid
+
+    def invalidate_token(self) -> None:
+        """Forget the access token so the next ensure_token() renews it."""
+        self._access_token = None
+        self._token_expires_at = None
+
+    def clear_tokens(self) -> None:
+        """Forget all tokens so the next ensure_token() does a password grant."""
+        self.invalidate_token()
+        self._refresh_token = None
+
+    def _set_tokens(self, data: dict[str, Any]) -> None:
+        """Store tokens from an Auth0 token response."""
+        self._access_token = data["access_token"]
+        self._refresh_token = data.get("refresh_token", self._refresh_token)
+
+        expires_at = _decode_jwt_exp(self._access_token)
+        if expires_at is None and data.get("expires_in"):
+            expires_at = time.time() + float(data["expires_in"])
+        self._token_expires_at = expires_at
+
+        if self._token_listener:
+            self._token_listener()
+
+    async def ensure_token(self) -> None:
+        """Make sure a valid access token is available.
+
+        Uses the refresh token when possible and only falls back to a full
+        password grant when there is no refresh token or it was rejected.
+        """
+        if self.token_valid:
+            return
+
+        await self._renew_token()
+
+    async def _renew_token(self) -> None:
+        """Renew the access token, sharing one renewal between concurrent callers."""
+        if self._renew_future is None:
+            self._renew_future = asyncio.ensure_future(self._async_do_renew_token())
+            self._renew_future.add_done_callback(self._clear_renew_future)
+
+        # Shield so a cancelled caller doesn't cancel the renewal for everyone else
+        await asyncio.shield(self._renew_future)
+
+    def _clear_renew_future(self, future: asyncio.Future[None]) -> None:
+        """Forget a finished renewal so the next expiry starts a new one."""
+        if self._renew_future is future:
+            self._renew_future = None
+        if not future.cancelled():
+            # Mark the exception as retrieved when no caller is left waiting on it
+            future.exception()
+
+    async def _async_do_renew_token(self) -> None:
+        """Renew the access token with the refresh token.
+
+        The password grant is only used when there is no refresh token or
+        the server rejected it; rate limits and outages are raised instead.
+        """
+        if await self.refresh_auth():
+            _LOGGER.debug("Access token refreshed")
+            return
+
+        if not self._email or not self._password:
+            raise VinFastAuthError("Authentication expired")
+
+        await self.authenticate(self._email, self._password)
+
     async def authenticate(self, email: str, password: str) -> bool:
         """Authenticate with VinFast Connected Car services."""
+        self.set_credentials(email, password)
         url = f"https://{self.auth0_domain}/oauth/token"
 
         payload = {
@@ -169,6 +525,8 @@ class VinFastApi:
             "Accept": "application/json",
         }
 
+        # Logins gate every other request, so they queue ahead of polls
+        await self._acquire(url, PRIORITY_COMMAND)
         try:
             async with async_timeout.timeout(30):
                 async with self._session.post(
@@ -176,12 +534,13 @@ class VinFastApi:
                 ) as response:
                     if response.status == 200:
                         data = await response.json()
-                        self._access_token = data["access_token"]
-                        self._refresh_token = data.get("refresh_token")
+                        self._set_tokens(data)
                         _LOGGER.debug("Authentication successful")
                         return True
                     elif response.status == 401:
                         raise VinFastAuthError("Invalid credentials")
+                    elif response.status in (429, 503):
+                        self._raise_rate_limited(response)
                     else:
                         text = await response.text()
                         _LOGGER.error("Auth failed: %s - %s", response.status, text)
@@ -191,7 +550,13 @@ class VinFastApi:
             raise VinFastApiError(f"Connection error: {err}") from err
 
     async def refresh_auth(self) -> bool:
-        """Refresh the access token."""
+        """Refresh the access token.
+
+        Returns False when there is no refresh token or the server rejects
+        it, in which case a password grant can replace it. Raises
+        VinFastRateLimitError when the auth host asks to back off, and
+        VinFastApiError on other failures.
+        """
         if not self._refresh_token:
             return False
 
@@ -203,21 +568,29 @@ class VinFastApi:
             "refresh_token": self._refresh_token,
         }
 
+        await self._acquire(url, PRIORITY_COMMAND)
         try:
             async with async_timeout.timeout(30):
                 async with self._session.post(url, json=payload) as response:
                     if response.status == 200:
                         data = await response.json()
-                        self._access_token = data["access_token"]
-                        self._refresh_token = data.get("refresh_token", self._refresh_token)
+                        self._set_tokens(data)
                         return True
-                    return False
-        except Exception as err:
-            _LOGGER.error("Token refresh failed: %s", err)
-            return False
+                    if response.status in (429, 503):
+                        # A password grant would hit the same host, so back off instead
+                        self._raise_rate_limited(response)
+                    text = await response.text()
+                    if response.status in (400, 401) or "invalid_grant" in text:
+                        _LOGGER.debug("Refresh token rejected: %s - %s", response.status, text)
+                        return False
+                    _LOGGER.error("Token refresh failed: %s - %s", response.status, text)
+                    raise VinFastApiError(f"Token refresh failed: {response.status}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("Connection error during token refresh: %s", err)
+            raise VinFastApiError(f"Connection error: {err}") from err
 
-    def _get_headers(self) -> dict[str, str]:
-        """Build headers for API requests."""
+    def _get_headers(self, vin: str | None = None) -> dict[str, str]:
+        """Build headers for API requests, scoped to a vehicle (default: primary)."""
         headers = {
             "Authorization": f"Bearer {self._access_token}",
             "Content-Type": "application/json",
@@ -231,30 +604,61 @@ class VinFastApi:
             "x-timezone": "America/New_York",
             "x-device-identifier": "ha-vinfast-integration",
         }
-        if self._vin:
-            headers["x-vin-code"] = self._vin
-        if self._user_id:
-            headers["x-player-identifier"] = self._user_id
+        vin = vin or self._vin
+        if vin:
+            headers["x-vin-code"] = vin
+        if user_id := self.user_id_for(vin):
+            headers["x-player-identifier"] = user_id
         return headers
 
     async def _api_request(
-        self, method: str, endpoint: str, data: dict | None = None
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | list | bytes | None = None,
+        vin: str | None = None,
+    ) -> dict[str, Any]:
+        """Make an API request, retrying once with a renewed token on a 401.
+
+        A rate limited request is not retried: the host is left to cool
+        down until the next poll.
+        """
+        token = self._access_token
+        try:
+            return await self._send_request(method, endpoint, data, vin)
+        except VinFastTokenExpiredError:
+            # Another request may already have renewed the token while ours was in flight
+            if self._access_token == token or not self.token_valid:
+                _LOGGER.debug("Access token rejected, renewing and retrying %s", endpoint)
+                await self._renew_token()
+            return await self._send_request(method, endpoint, data, vin)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | list | bytes | None = None,
+        vin: str | None = None,
     ) -> dict[str, Any]:
-        """Make an API request."""
+        """Send a single API request once the host's rate limiter allows it."""
         url = f"{self.api_base}{endpoint}"
 
+        await self._acquire(url, PRIORITY_POLL)
         try:
             async with async_timeout.timeout(30):
                 if method == "GET":
                     async with self._session.get(
-                        url, headers=self._get_headers()
+                        url, headers=self._get_headers(vin)
                     ) as response:
                         return await self._handle_response(response)
                 elif method == "POST":
+                    # Pre-serialized bodies (compiled telemetry plans) are sent as-is
+                    body = {"data": data} if isinstance(data, bytes) else {"json": data}
                     async with self._session.post(
-                        url, headers=self._get_headers(), json=data
+                        url, headers=self._get_headers(vin), **body
                     ) as response:
                         return await self._handle_response(response)
+                raise VinFastApiError(f"Unsupported method: {method}")
         except aiohttp.ClientError as err:
             _LOGGER.error("API request failed: %s", err)
             raise VinFastApiError(f"API request failed: {err}") from err
@@ -262,9 +666,10 @@ class VinFastApi:
     async def _handle_response(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
         """Handle API response."""
         if response.status == 401:
-            if await self.refresh_auth():
-                raise VinFastApiError("Token refreshed, retry request")
-            raise VinFastAuthError("Authentication expired")
+            raise VinFastTokenExpiredError("Authentication expired")
+
+        if response.status in (429, 503):
+            self._raise_rate_limited(response)
 
         if response.status != 200:
             text = await response.text()
@@ -276,35 +681,71 @@ class VinFastApi:
 
         return data
 
+    @staticmethod
+    def _raise_rate_limited(response: aiohttp.ClientResponse) -> None:
+        """Hold back the host for the server's Retry-After and raise."""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            limiter_for(str(response.url)).defer(retry_after)
+        raise VinFastRateLimitError(
+            f"Rate limited (HTTP {response.status})", retry_after
+        )
+
     async def get_vehicles(self) -> list[dict[str, Any]]:
-        """Get list of vehicles for the account."""
+        """Get list of vehicles for the account.
+
+        A direct fetch also refreshes the endpoint cache, so the first poll
+        after a config flow doesn't fetch the list a second time.
+        """
         data = await self._api_request("GET", "/ccarusermgnt/api/v1/user-vehicle")
         vehicles = data.get("data", [])
+        if self._cache_ttl.get("vehicles", 0) > 0:
+            self._endpoint_cache["vehicles"] = (time.monotonic(), vehicles)
 
         if vehicles:
+            self._vehicles = {
+                vehicle["vinCode"]: vehicle for vehicle in vehicles if vehicle.get("vinCode")
+            }
             self._vin = vehicles[0].get("vinCode")
             self._user_id = vehicles[0].get("userId")
+            self._vehicle_model = vehicles[0].get("vehicleType")
 
         return vehicles
 
-    async def get_alias_mappings(self, version: str = "1.0") -> dict[str, dict[str, str]]:
+    async def get_alias_mappings(
+        self, version: str = "1.0", force: bool = False, vin: str | None = None
+    ) -> dict[str, dict[str, str]]:
         """Fetch alias-to-resource-path mappings from the server.
 
         This retrieves the dynamic mapping between human-readable aliases
         (like VEHICLE_STATUS_ODOMETER) and LwM2M resource paths (like /34xxx/0/0).
+        The catalogue depends on the vehicle model, so it is fetched for the
+        model of vin (default: the primary vehicle) and kept per model.
+        A catalogue persisted via load_alias_cache() is used instead of the
+        network unless force is set. A failed forced fetch keeps the current
+        catalogue.
         """
-        if self._alias_mappings and self._alias_version == version:
-            return self._alias_mappings
+        vin = vin or self._vin
+        model = self._vehicle_model_for(vin)
+        catalogue = self._alias_catalogue(model)
+        if not force:
+            if catalogue.mappings and catalogue.version == version:
+                return catalogue.mappings
+            if self._restore_alias_cache(model, version):
+                return catalogue.mappings
+        else:
+            catalogue.attempted_at = time.monotonic()
 
         try:
             # This endpoint may have different response format, so we call it directly
             url = f"{self.api_base}/modelmgmt/api/v2/vehicle-model/mobile-app/vehicle/get-alias?version={version}"
 
+            await self._acquire(url, PRIORITY_POLL)
             async with async_timeout.timeout(30):
-                async with self._session.get(url, headers=self._get_headers()) as response:
+                async with self._session.get(url, headers=self._get_headers(vin)) as response:
                     if response.status != 200:
                         _LOGGER.warning("get-alias returned status %s", response.status)
-                        return {}
+                        return catalogue.mappings if force else {}
 
                     data = await response.json()
                     _LOGGER.debug("get-alias response: %s", data)
@@ -345,20 +786,22 @@ class VinFastApi:
                     }
 
             if mappings:
-                self._alias_mappings = mappings
-                self._alias_version = version
-                _LOGGER.debug("Loaded %d alias mappings from server", len(mappings))
+                catalogue.load(mappings, version, time.time())
+                self._drop_request_plans(model)
+                _LOGGER.debug("Loaded %d alias mappings for %s from server", len(mappings), model)
+                if self._alias_listener:
+                    self._alias_listener()
 
                 # Log which of our requested aliases were found
                 found = [a for a in CORE_TELEMETRY_ALIASES if a in mappings]
                 missing = [a for a in CORE_TELEMETRY_ALIASES if a not in mappings]
                 _LOGGER.debug("Aliases found: %d, missing: %d", len(found), len(missing))
 
-            return mappings
+            return catalogue.mappings if force else mappings
 
         except (aiohttp.ClientError, Exception) as err:
             _LOGGER.warning("Failed to fetch alias mappings: %s", err)
-            return {}
+            return catalogue.mappings if force else {}
 
     async def get_profile(self) -> dict[str, Any]:
         """Get user profile."""
@@ -367,96 +810,175 @@ class VinFastApi:
         )
         return data.get("data", {})
 
-    async def get_telemetry(self) -> dict[str, Any] | None:
-        """Get vehicle telemetry data.
+    def set_requested_keys(self, keys: Iterable[str] | None) -> None:
+        """Limit the core telemetry ping to the aliases behind these friendly keys.
 
-        When REQUEST_ALL_ALIASES is True, requests ALL available aliases from the server.
-        This enables discovery of all data points the vehicle provides.
+        None requests every core alias. The static fallback paths and
+        REQUEST_ALL_ALIASES discovery mode are not pruned.
         """
-        if not self._vin:
-            _LOGGER.info("TELEMETRY: No VIN available, skipping telemetry fetch")
-            return None
-
-        # Try to fetch alias mappings first (for dynamic resource paths)
-        alias_mappings = await self.get_alias_mappings()
-        _LOGGER.debug("Telemetry: alias_mappings returned %d mappings", len(alias_mappings) if alias_mappings else 0)
-
-        # Build request objects from alias mappings
-        # API expects: [{"instanceId": "1", "objectId": "34183", "resourceId": "3"}, ...]
-        request_objects = []
-        path_to_alias = {}  # Reverse mapping for parsing response
+        aliases = aliases_for_keys(keys) if keys is not None else None
+        if aliases == self._requested_aliases:
+            return
+        self._requested_aliases = aliases
+        self._request_plans = {
+            key: plan for key, plan in self._request_plans.items() if key[1] != "core"
+        }
+        _LOGGER.debug(
+            "Telemetry: Requesting %s core aliases",
+            len(aliases) if aliases is not None else "all",
+        )
 
+    def _get_request_plan(
+        self, alias_mappings: dict[str, dict[str, str]], model: str
+    ) -> TelemetryRequestPlan | None:
+        """Return the compiled ping request for the catalogue, selection and model."""
         if alias_mappings:
-            if REQUEST_ALL_ALIASES:
-                # Request ALL available aliases for comprehensive data discovery
-                for alias, mapping in alias_mappings.items():
-                    path = mapping["path"]
-                    request_objects.append({
-                        "objectId": mapping["objectId"],
-                        "instanceId": mapping["instanceId"],
-                        "resourceId": mapping["resourceId"],
-                    })
-                    path_to_alias[path] = alias
-                _LOGGER.info("Telemetry: Requesting ALL %d aliases for comprehensive data", len(request_objects))
-            else:
-                # Use only core aliases
-                for alias in CORE_TELEMETRY_ALIASES:
-                    if alias in alias_mappings:
-                        mapping = alias_mappings[alias]
-                        path = mapping["path"]
-                        request_objects.append({
-                            "objectId": mapping["objectId"],
-                            "instanceId": mapping["instanceId"],
-                            "resourceId": mapping["resourceId"],
-                        })
-                        path_to_alias[path] = alias
-                _LOGGER.debug("Telemetry: Using %d core resources", len(request_objects))
+            selection = "all" if REQUEST_ALL_ALIASES else "core"
+        else:
+            selection = "fallback"
+
+        tracker = self._yield_tracker(model)
+        reprobe = tracker.reprobe_due
+        plan = self._request_plans.get((model, selection, reprobe))
+        if plan is not None:
+            return plan
+
+        if selection == "all":
+            # Request ALL available aliases for comprehensive data discovery
+            aliases = list(alias_mappings)
+        elif selection == "core":
+            # Use only core aliases that an enabled entity consumes
+            requested = self._requested_aliases
+            aliases = [
+                a for a in CORE_TELEMETRY_ALIASES
+                if a in alias_mappings and (requested is None or a in requested)
+            ]
+            if not aliases:
+                return None
+        else:
+            aliases = []
+
+        if aliases:
+            resources = [
+                (
+                    alias,
+                    alias_mappings[alias]["objectId"],
+                    alias_mappings[alias]["instanceId"],
+                    alias_mappings[alias]["resourceId"],
+                    alias_mappings[alias].get("type"),
+                )
+                for alias in aliases
+            ]
         else:
             # Fallback to static paths - parse them into object format
+            resources = []
             for path in FALLBACK_TELEMETRY_RESOURCES:
                 parts = path.strip("/").split("/")
                 if len(parts) == 3:
-                    request_objects.append({
-                        "objectId": parts[0],
-                        "instanceId": parts[1],
-                        "resourceId": parts[2],
-                    })
-            _LOGGER.debug("Telemetry: Using %d fallback static resources", len(request_objects))
-
-        if not request_objects:
-            _LOGGER.warning("No telemetry resource paths available")
+                    resources.append((None, parts[0], parts[1], parts[2], None))
+
+        if not reprobe:
+            # Leave out paths that have never returned a value for this model
+            dead = tracker.dead_paths()
+            active = [r for r in resources if f"/{r[1]}/{r[2]}/{r[3]}" not in dead]
+            if active:
+                resources = active
+
+        if not resources:
             return None
 
-        _LOGGER.debug("Telemetry: Requesting %d resources", len(request_objects))
+        plan = TelemetryRequestPlan(resources)
+        self._request_plans[(model, selection, reprobe)] = plan
+        _LOGGER.debug(
+            "Telemetry: Compiled %s request plan for %s with %d resources%s",
+            selection, model, plan.size, " (re-probing dropped paths)" if reprobe else "",
+        )
+        return plan
+
+    def _record_yield(
+        self, plan: TelemetryRequestPlan, raw_data: list[Any], model: str
+    ) -> None:
+        """Learn which requested paths returned a value in this ping."""
+        tracker = self._yield_tracker(model)
+        returned = {
+            entry.path
+            for item in raw_data
+            if isinstance(item, dict) and item.get("value") is not None
+            and (entry := plan.resolve(item.get("deviceKey") or "")) is not None
+        }
+        if not returned:
+            return  # Nothing came back at all - don't blame individual paths
 
-        try:
-            # Use the "ping" endpoint which returns cached telemetry data
-            # This works even when the vehicle is asleep
-            data = await self._api_request(
-                "POST",
-                "/ccaraccessmgmt/api/v1/telemetry/app/ping",
-                request_objects,  # Send array directly, not wrapped in object
+        if tracker.record(plan.by_path, returned):
+            _LOGGER.debug(
+                "Telemetry: %d requested paths never returned a value",
+                len(tracker.dead_paths()),
             )
-            raw_data = data.get("data")
-            if not raw_data:
-                _LOGGER.debug("Telemetry: No data in response")
-                return None
+            self._drop_request_plans(model)
+        if self._yield_listener:
+            self._yield_listener()
 
-            _LOGGER.info("Telemetry: Received %d values out of %d requested",
-                        len(raw_data) if isinstance(raw_data, list) else 0,
-                        len(request_objects))
+    async def get_telemetry(self, vin: str | None = None) -> TelemetrySnapshot | None:
+        """Get telemetry data for a vehicle (default: the primary vehicle).
 
-            # Parse ping response - it's a list of VehiclePingResourceDto objects
-            return self._parse_ping_response(raw_data, path_to_alias, alias_mappings)
+        When REQUEST_ALL_ALIASES is True, requests ALL available aliases from the server.
+        This enables discovery of all data points the vehicle provides.
+        """
+        try:
+            return await self._fetch_telemetry(vin)
         except VinFastApiError as err:
             _LOGGER.debug("Telemetry request failed: %s", err)
             return None
 
+    async def _fetch_telemetry(self, vin: str | None = None) -> TelemetrySnapshot | None:
+        """Get telemetry data for a vehicle, raising when the ping fails."""
+        vin = vin or self._vin
+        if not vin:
+            _LOGGER.info("TELEMETRY: No VIN available, skipping telemetry fetch")
+            return None
+
+        # Try to fetch this model's alias mappings first (for dynamic resource paths)
+        alias_mappings = await self.get_alias_mappings(vin=vin)
+        _LOGGER.debug("Telemetry: alias_mappings returned %d mappings", len(alias_mappings) if alias_mappings else 0)
+
+        model = self._vehicle_model_for(vin)
+        plan = self._get_request_plan(alias_mappings, model)
+        if plan is None:
+            _LOGGER.warning("No telemetry resource paths available")
+            return None
+
+        _LOGGER.debug("Telemetry: Requesting %d resources", plan.size)
+
+        # Use the "ping" endpoint which returns cached telemetry data
+        # This works even when the vehicle is asleep
+        data = await self._api_request(
+            "POST",
+            "/ccaraccessmgmt/api/v1/telemetry/app/ping",
+            plan.body,  # Pre-serialized array of {objectId, instanceId, resourceId}
+            vin=vin,
+        )
+        raw_data = data.get("data")
+        if not raw_data:
+            _LOGGER.debug("Telemetry: No data in response")
+            return None
+
+        _LOGGER.info("Telemetry: Received %d values out of %d requested",
+                    len(raw_data) if isinstance(raw_data, list) else 0,
+                    plan.size)
+
+        if isinstance(raw_data, list):
+            self._record_yield(plan, raw_data, model)
+
+        # Parse ping response - it's a list of VehiclePingResourceDto objects
+        return self._parse_ping_response(raw_data, plan, model)
+
     def _parse_ping_response(
-        self, raw_data: list, path_to_alias: dict[str, str] | None = None,
-        alias_mappings: dict[str, dict[str, str]] | None = None
-    ) -> dict[str, Any]:
-        """Parse ping response into friendly format.
+        self,
+        raw_data: list,
+        plan: TelemetryRequestPlan | None = None,
+        model: str | None = None,
+    ) -> TelemetrySnapshot:
+        """Parse ping response into a telemetry snapshot keyed by friendly name.
 
         Ping response is a list of objects like:
         {
@@ -469,139 +991,133 @@ class VinFastApi:
         }
 
         deviceKey format is: {objectId}_{instanceId:05d}_{resourceId:05d}
-        """
-        result = {}
-        # Also store raw alias data for comprehensive monitoring
-        result["_raw_aliases"] = {}
 
+        model is the vehicle model whose catalogue the plan was built from.
+        """
         if not isinstance(raw_data, list):
             _LOGGER.debug("Telemetry: ping response is not a list: %s", type(raw_data))
-            return result
-
-        # Map core aliases to friendly keys for backward compatibility
-        alias_to_key = {
-            # Battery & Charging
-            "VEHICLE_STATUS_HV_BATTERY_SOC": "battery_level",
-            "VEHICLE_STATUS_LV_BATTERY_SOC": "lv_battery_level",
-            "VEHICLE_STATUS_REMAINING_DISTANCE": "range",
-            "VEHICLE_STATUS_ODOMETER": "odometer",
-            "CHARGING_STATUS_CHARGING_STATUS": "charging_status",
-            "CHARGING_STATUS_CHARGING_REMAINING_TIME": "time_to_full",
-            "CHARGE_CONTROL_CURRENT_TARGET_SOC": "charge_limit",
-            "CHARGE_CONTROL_SAMPLE_CHARGE_STATUS": "sample_charge_status",
-            # Vehicle Status
-            "VEHICLE_STATUS_IGNITION_STATUS": "ignition",
-            "VEHICLE_STATUS_GEAR_POSITION": "gear",
-            "VEHICLE_STATUS_VEHICLE_SPEED": "speed",
-            "VEHICLE_STATUS_HANDBRAKE_STATUS": "handbrake",
-            # Climate
-            "VEHICLE_STATUS_AMBIENT_TEMPERATURE": "outside_temp",
-            "CLIMATE_INFORMATION_DRIVER_TEMPERATURE": "inside_temp",
-            "CLIMATE_INFORMATION_STATUS": "climate_status",
-            # Tire Pressure
-            "VEHICLE_STATUS_FRONT_LEFT_TIRE_PRESSURE": "tire_pressure_fl",
-            "VEHICLE_STATUS_FRONT_RIGHT_TIRE_PRESSURE": "tire_pressure_fr",
-            "VEHICLE_STATUS_REAR_LEFT_TIRE_PRESSURE": "tire_pressure_rl",
-            "VEHICLE_STATUS_REAR_RIGHT_TIRE_PRESSURE": "tire_pressure_rr",
-            # Door Status
-            "DOOR_AJAR_FRONT_LEFT_DOOR_STATUS": "door_fl",
-            "DOOR_AJAR_FRONT_RIGHT_DOOR_STATUS": "door_fr",
-            "DOOR_AJAR_REAR_LEFT_DOOR_STATUS": "door_rl",
-            "DOOR_AJAR_REAR_RIGHT_DOOR_STATUS": "door_rr",
-            "DOOR_TRUNK_DOOR_STATUS": "trunk_status",
-            # Remote Control Status
-            "REMOTE_CONTROL_DOOR_STATUS": "locked",
-            "REMOTE_CONTROL_BONNET_CONTROL_STATUS": "hood_status",
-            "REMOTE_CONTROL_WINDOW_STATUS": "window_status",
-            "REMOTE_CONTROL_CHARGE_PORT_STATUS": "plugged_in",
-            # Location
-            "LOCATION_LATITUDE": "latitude",
-            "LOCATION_LONGITUDE": "longitude",
-            "VEHICLE_BEARING_DEGREE": "heading",
-        }
+            raw_data = []
 
-        for item in raw_data:
-            if not isinstance(item, dict):
-                continue
+        result, unresolved = decode_ping_response(raw_data, plan)
+        if unresolved:
+            # Catalogue doesn't know some returned resources - it may be outdated
+            self._alias_catalogue(model or self._vehicle_model_for(None)).miss = True
 
-            device_key = item.get("deviceKey")
-            value = item.get("value")
-            last_update = item.get("lastUpdateTime")
-
-            if device_key and value is not None:
-
-                # Parse deviceKey format: 34183_00001_00003 -> /34183/1/3
-                parts = device_key.split("_")
-                if len(parts) == 3:
-                    obj_id = str(int(parts[0]))  # Remove leading zeros
-                    inst_id = str(int(parts[1]))  # Remove leading zeros
-                    rsrc_id = str(int(parts[2]))  # Remove leading zeros
-                    path = f"/{obj_id}/{inst_id}/{rsrc_id}"
-                else:
-                    path = device_key
-
-                # Get the alias name for this path
-                alias = path_to_alias.get(path, path) if path_to_alias else path
-
-                # Store in raw_aliases for comprehensive monitoring (use alias name as key)
-                try:
-                    parsed_value = float(value)
-                except (ValueError, TypeError):
-                    parsed_value = value
-
-                result["_raw_aliases"][alias] = {
-                    "value": parsed_value,
-                    "path": path,
-                    "last_update": last_update,
-                }
-
-                # Use alias_to_key for backward-compatible friendly names
-                friendly_key = alias_to_key.get(alias, alias.lower())
-
-                # Store in main result with friendly key
-                result[friendly_key] = parsed_value
-
-        _LOGGER.debug("Telemetry: Parsed %d values", len(result) - 1)  # -1 for _raw_aliases
+        _LOGGER.debug("Telemetry: Parsed %d values", len(result))
 
         return result
 
     async def get_locations(self) -> list[dict[str, Any]]:
         """Get saved locations."""
         try:
-            data = await self._api_request(
-                "GET", "/ccarusermgnt/api/v1/location-favorite"
-            )
-            return data.get("data", [])
+            return await self._fetch_locations()
         except VinFastApiError:
             return []
 
-    async def get_all_data(self) -> dict[str, Any]:
-        """Get all available vehicle data."""
-        result = {
-            "vehicles": [],
-            "profile": {},
-            "telemetry": None,
-            "locations": [],
-        }
-
-        try:
-            result["vehicles"] = await self.get_vehicles()
-        except VinFastApiError as err:
-            _LOGGER.warning("Failed to get vehicles: %s", err)
+    async def _fetch_locations(self) -> list[dict[str, Any]]:
+        """Get saved locations, raising on failure."""
+        data = await self._api_request(
+            "GET", "/ccarusermgnt/api/v1/location-favorite"
+        )
+        return data.get("data", [])
 
-        try:
-            result["profile"] = await self.get_profile()
-        except VinFastApiError as err:
-            _LOGGER.warning("Failed to get profile: %s", err)
+    async def _get_cached(
+        self, name: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached endpoint result, fetching it when missing or expired.
 
+        Only successful fetches are cached - when fetch raises, the next poll
+        tries again instead of serving the failure for a whole TTL.
+        """
+        ttl = self._cache_ttl.get(name, 0)
+        cached = self._endpoint_cache.get(name)
+        if ttl > 0 and cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        value = await fetch()
+        if ttl > 0:
+            self._endpoint_cache[name] = (time.monotonic(), value)
+        return value
+
+    def invalidate_cache(self, name: str | None = None) -> None:
+        """Drop cached endpoint results (all of them when name is None)."""
+        if name is None:
+            self._endpoint_cache.clear()
+        else:
+            self._endpoint_cache.pop(name, None)
+
+    async def _fetch_isolated(
+        self,
+        name: str,
+        fetch: Awaitable[Any],
+        default: Any,
+        log_level: int = logging.WARNING,
+    ) -> Any:
+        """Await one part of a poll with its own timeout, returning a default on failure."""
         try:
-            result["telemetry"] = await self.get_telemetry()
+            async with async_timeout.timeout(FETCH_TIMEOUT):
+                return await fetch
         except VinFastApiError as err:
-            _LOGGER.debug("Telemetry unavailable: %s", err)
+            _LOGGER.log(log_level, "Failed to get %s: %s", name, err)
+        except asyncio.TimeoutError:
+            _LOGGER.log(log_level, "Timed out getting %s", name)
+        return default
 
-        try:
-            result["locations"] = await self.get_locations()
-        except VinFastApiError as err:
-            _LOGGER.debug("Locations unavailable: %s", err)
+    async def get_vehicle_info(self) -> dict[str, Any]:
+        """Get the account-wide vehicle list, profile and saved locations.
 
+        The endpoints are fetched concurrently and served from the endpoint
+        cache. A failed vehicle refresh keeps the last known list; raises
+        VinFastApiError when there is no vehicle list at all.
+        """
+        fetches = {
+            "vehicles": (
+                self._get_cached("vehicles", self.get_vehicles), self.vehicles, logging.WARNING
+            ),
+            "profile": (self._get_cached("profile", self.get_profile), {}, logging.WARNING),
+            "locations": (self._get_cached("locations", self._fetch_locations), [], logging.DEBUG),
+        }
+        values = await asyncio.gather(
+            *(
+                self._fetch_isolated(name, fetch, default, log_level)
+                for name, (fetch, default, log_level) in fetches.items()
+            )
+        )
+        result = dict(zip(fetches, values))
+        if not result["vehicles"]:
+            raise VinFastApiError("No vehicles could be loaded for the account")
         return result
+
+    async def get_all_telemetry(self) -> dict[str, TelemetrySnapshot | None]:
+        """Ping every vehicle on the account concurrently.
+
+        Maps each VIN to its parsed telemetry (None when the ping failed or
+        returned nothing). The vehicle list is loaded first if it isn't
+        known yet, since the ping needs x-vin-code. Raises VinFastApiError
+        when no vehicle could be pinged at all, i.e. the cloud looks
+        unreachable.
+        """
+        if not self._vin:
+            await self._fetch_isolated(
+                "vehicles", self._get_cached("vehicles", self.get_vehicles), []
+            )
+
+        vins = self.vins
+        telemetry = await asyncio.gather(
+            *(
+                self._fetch_isolated(
+                    "telemetry", self._fetch_telemetry(vin), _FAILED, logging.DEBUG
+                )
+                for vin in vins
+            )
+        )
+        if not vins or all(value is _FAILED for value in telemetry):
+            raise VinFastApiError("No vehicle could be reached")
+
+        return {
+            vin: None if value is _FAILED else value for vin, value in zip(vins, telemetry)
+        }
+
+    async def probe(self) -> None:
+        """Check that the cloud answers, using the cheapest authenticated request."""
+        await self.get_profile()
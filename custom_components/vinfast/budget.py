@@ -0,0 +1,99 @@
+"""Daily request budget for a VinFast account."""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, timedelta
+import logging
+from typing import Any
+from urllib.parse import urlsplit
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestBudget:
+    """Counts an account's requests per endpoint against a daily allowance.
+
+    The count starts over at local midnight. It is persisted by the account,
+    so restarts and options reloads don't reset it. Polls are paced so the
+    allowance left lasts until the reset, and stop once it is used up.
+    An allowance of 0 means unlimited: requests are still counted.
+    """
+
+    def __init__(self, allowance: int = 0) -> None:
+        """Initialize an unused budget for today."""
+        self.allowance = allowance
+        self._day = dt_util.now().date()
+        self._counts: Counter[str] = Counter()
+
+    def _roll_over(self) -> None:
+        """Start a new count when the local day changed."""
+        today = dt_util.now().date()
+        if today != self._day:
+            _LOGGER.debug(
+                "New day, used %d requests yesterday", sum(self._counts.values())
+            )
+            self._day = today
+            self._counts.clear()
+
+    def record(self, url: str) -> None:
+        """Count a request sent to this URL."""
+        self._roll_over()
+        self._counts[urlsplit(url).path] += 1
+
+    @property
+    def used(self) -> int:
+        """Return the requests sent today."""
+        self._roll_over()
+        return sum(self._counts.values())
+
+    @property
+    def remaining(self) -> int | None:
+        """Return the requests left today, or None when unlimited."""
+        if not self.allowance:
+            return None
+        return max(self.allowance - self.used, 0)
+
+    @property
+    def by_endpoint(self) -> dict[str, int]:
+        """Return today's requests per endpoint path."""
+        self._roll_over()
+        return dict(self._counts)
+
+    def allows(self, cost: int) -> bool:
+        """Return True if a poll sending this many requests fits today."""
+        remaining = self.remaining
+        return remaining is None or remaining >= cost
+
+    def paced_interval(self, cost: int) -> float | None:
+        """Return the shortest poll interval that lasts the day, or None if unlimited.
+
+        The rest of the day is split evenly over the polls the remaining
+        allowance pays for. With none left, the next poll waits for midnight.
+        """
+        remaining = self.remaining
+        if remaining is None:
+            return None
+        now = dt_util.now()
+        midnight = dt_util.start_of_local_day(now.date() + timedelta(days=1))
+        until_reset = (midnight - now).total_seconds()
+        polls = remaining // max(cost, 1)
+        return until_reset / polls if polls else until_reset
+
+    def export(self) -> dict[str, Any]:
+        """Export today's counts for persistent storage."""
+        self._roll_over()
+        return {"day": self._day.isoformat(), "counts": dict(self._counts)}
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore counts from persistent storage if they are from today."""
+        try:
+            day = date.fromisoformat(data["day"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if day == dt_util.now().date():
+            self._day = day
+            self._counts = Counter({
+                endpoint: int(count) for endpoint, count in data.get("counts", {}).items()
+            })
@@ -0,0 +1,99 @@
+"""Upload cadence learning for aligning polls with the car's uploads."""
+from __future__ import annotations
+
+from collections import deque
+import logging
+import math
+from statistics import median
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upload gaps remembered per activity state
+CADENCE_SAMPLES = 8
+# Poll this long after an expected upload, for server processing and clock skew (seconds)
+UPLOAD_MARGIN = 30
+# Shortest delay an aligned or backed-off poll may use (seconds)
+MIN_POLL_DELAY = 60
+# Polls that found no new upload double the delay, up to this factor
+MAX_BACKOFF_FACTOR = 8
+
+
+class UploadCadence:
+    """Learns how often a car uploads telemetry in each activity state.
+
+    The ping serves the server's cached values, each with the lastUpdateTime
+    of the car's upload that set it. The newest one is the car's last
+    upload, and the gaps between successive uploads give the cadence of the
+    state the car was in. Polls are moved to just after an expected upload,
+    and back off while consecutive polls find no new one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without any uploads seen."""
+        self._last_upload: int | None = None  # epoch milliseconds
+        self._gaps: dict[str, deque[float]] = {}
+        self._unchanged = 0
+
+    @property
+    def last_upload(self) -> int | None:
+        """Return when the car last uploaded, in epoch milliseconds."""
+        return self._last_upload
+
+    @property
+    def unchanged_polls(self) -> int:
+        """Return the polls in a row that found no new upload."""
+        return self._unchanged
+
+    def cadence(self, state: str) -> float | None:
+        """Return the typical upload gap in this state (seconds), if learned."""
+        if gaps := self._gaps.get(state):
+            return median(gaps)
+        return None
+
+    def record(self, uploaded_ms: int | None, state: str) -> None:
+        """Record the newest lastUpdateTime of a ping while the car was in state."""
+        if uploaded_ms is None:
+            return
+        last = self._last_upload
+        if last is not None and uploaded_ms <= last:
+            self._unchanged += 1
+            return
+        if last is not None:
+            if state not in self._gaps:
+                self._gaps[state] = deque(maxlen=CADENCE_SAMPLES)
+            self._gaps[state].append((uploaded_ms - last) / 1000)
+        self._last_upload = uploaded_ms
+        self._unchanged = 0
+
+    def next_poll_delay(
+        self, state: str, interval: float, ceiling: float, now_ms: int
+    ) -> float:
+        """Return the seconds until the next poll for a state polled every interval.
+
+        With a learned cadence the poll goes just after the last upload
+        expected within the interval, or waits for the next upload when
+        none is due that soon. Every poll in a row that found no new upload
+        doubles the delay. The result never exceeds ceiling.
+        """
+        delay = float(interval)
+        cadence = self.cadence(state)
+        if cadence and self._last_upload is not None:
+            since = (now_ms - self._last_upload) / 1000
+            # Uploads are expected every cadence seconds after the last one;
+            # the newest that is due before the interval ends
+            expected = math.floor((since + interval - UPLOAD_MARGIN) / cadence)
+            delay = expected * cadence + UPLOAD_MARGIN - since
+            if expected < 1 or delay <= 0:
+                # None due within the interval: wait for the next one
+                delay = max(expected + 1, 1) * cadence + UPLOAD_MARGIN - since
+        if self._unchanged:
+            delay *= min(2 ** self._unchanged, MAX_BACKOFF_FACTOR)
+        return min(max(delay, MIN_POLL_DELAY), max(ceiling, MIN_POLL_DELAY))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned cadence per state for diagnostics."""
+        return {
+            "cadence": {state: round(self.cadence(state) or 0) for state in self._gaps},
+            "unchanged_polls": self._unchanged,
+        }
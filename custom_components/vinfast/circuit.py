@@ -0,0 +1,94 @@
+"""Circuit breaker for VinFast cloud polling."""
+from __future__ import annotations
+
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive failed polls before the circuit opens
+CIRCUIT_FAILURE_THRESHOLD = 3
+# Backoff after the first trip, doubling on every failed probe up to the maximum (seconds)
+CIRCUIT_BASE_DELAY = 60
+CIRCUIT_MAX_DELAY = 3600
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops polling a failing cloud and probes it again after a backoff.
+
+    Closed: requests flow normally and failures are counted. Open: requests
+    are skipped until the jittered backoff has passed. Half-open: one cheap
+    probe decides whether to close again or reopen with a longer backoff.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        base_delay: float = CIRCUIT_BASE_DELAY,
+        max_delay: float = CIRCUIT_MAX_DELAY,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._failures = 0
+        self._trips = 0
+        self._open = False
+        self._retry_at = 0.0
+
+    @property
+    def state(self) -> str:
+        """Return the current circuit state."""
+        if not self._open:
+            return STATE_CLOSED
+        if time.monotonic() >= self._retry_at:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed."""
+        if not self._open:
+            return 0.0
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        return self.state != STATE_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._open:
+            _LOGGER.info("VinFast cloud reachable again, resuming normal polling")
+        self._failures = 0
+        self._trips = 0
+        self._open = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit when over the threshold."""
+        self._failures += 1
+        if not self._open and self._failures < self._failure_threshold:
+            return
+
+        # A failed half-open probe reopens with the next backoff step
+        self._trips += 1
+        delay = min(self._base_delay * 2 ** (self._trips - 1), self._max_delay)
+        # Equal jitter keeps at least half the backoff while spreading retries out
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self._open = True
+        self._retry_at = time.monotonic() + delay
+        _LOGGER.warning(
+            "VinFast cloud failed %d times in a row, pausing requests for %d seconds",
+            self._failures,
+            delay,
+        )
@@ -11,9 +11,10 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .account import async_get_account, async_get_loaded_account
 from .api import VinFastApi, VinFastAuthError, VinFastApiError
 from .const import (
     DOMAIN,
@@ -21,9 +22,15 @@ from .const import (
     CONF_OCPP_CHARGING_STATE,
     CONF_UPDATE_INTERVAL,
     CONF_CHARGING_UPDATE_INTERVAL,
+    CONF_REFRESH_WINDOW,
+    CONF_TELEMETRY_MAX_AGE,
+    CONF_DAILY_BUDGET,
     CONF_REGION,
     DEFAULT_OCPP_CHARGER_ENTITY,
     DEFAULT_OCPP_CHARGING_STATE,
+    DEFAULT_REFRESH_WINDOW,
+    DEFAULT_TELEMETRY_MAX_AGE,
+    DEFAULT_DAILY_BUDGET,
     DEFAULT_REGION,
     REGIONS,
     UPDATE_INTERVAL_NORMAL,
@@ -72,10 +79,10 @@ class VinFastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Test credentials
-                session = async_get_clientsession(self.hass)
+                # Test credentials on a client of our own - the shared account
+                # another entry may be using must not see an unchecked password
                 region = user_input.get(CONF_REGION, DEFAULT_REGION)
-                api = VinFastApi(session, region=region)
+                api = VinFastApi(async_get_clientsession(self.hass), region=region)
 
                 await api.authenticate(
                     user_input[CONF_EMAIL],
@@ -93,17 +100,32 @@ class VinFastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     await self.async_set_unique_id(vin)
                     self._abort_if_unique_id_configured()
 
-                    # Create entry with vehicle name
-                    vehicle_name = vehicles[0].get(
-                        "customizedVehicleName",
-                        vehicles[0].get("vehicleName", "VinFast"),
+                    # Create entry with vehicle name, or the account for several vehicles
+                    if len(vehicles) > 1:
+                        title = user_input[CONF_EMAIL]
+                    else:
+                        title = vehicles[0].get(
+                            "customizedVehicleName",
+                            vehicles[0].get("vehicleName", "VinFast"),
+                        )
+
+                    # The entry set up next reuses this logged-in client, so it
+                    # doesn't log in or fetch vehicles again
+                    await async_get_account(
+                        self.hass,
+                        region,
+                        user_input[CONF_EMAIL],
+                        user_input[CONF_PASSWORD],
+                        api,
                     )
 
                     return self.async_create_entry(
-                        title=vehicle_name,
+                        title=title,
                         data=user_input,
                     )
 
+            except AbortFlow:
+                raise
             except VinFastAuthError:
                 errors["base"] = "invalid_auth"
             except VinFastApiError:
@@ -183,6 +205,15 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
             new_options[CONF_OCPP_CHARGING_STATE] = user_input.get(
                 CONF_OCPP_CHARGING_STATE, DEFAULT_OCPP_CHARGING_STATE
             )
+            new_options[CONF_REFRESH_WINDOW] = user_input.get(
+                CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW
+            )
+            new_options[CONF_TELEMETRY_MAX_AGE] = user_input.get(
+                CONF_TELEMETRY_MAX_AGE, DEFAULT_TELEMETRY_MAX_AGE
+            )
+            new_options[CONF_DAILY_BUDGET] = user_input.get(
+                CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET
+            )
             return self.async_create_entry(title="", data=new_options)
 
         # Get current values
@@ -198,6 +229,15 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
         current_state = self.config_entry.options.get(
             CONF_OCPP_CHARGING_STATE, DEFAULT_OCPP_CHARGING_STATE
         )
+        current_window = self.config_entry.options.get(
+            CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW
+        )
+        current_max_age = self.config_entry.options.get(
+            CONF_TELEMETRY_MAX_AGE, DEFAULT_TELEMETRY_MAX_AGE
+        )
+        current_budget = self.config_entry.options.get(
+            CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET
+        )
 
         # Find the label for current interval value
         default_interval = "4 hours (recommended)"
@@ -223,6 +263,15 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
                 ),
                 vol.Optional(CONF_OCPP_ENTITY, default=current_entity): str,
                 vol.Optional(CONF_OCPP_CHARGING_STATE, default=current_state): str,
+                vol.Optional(CONF_REFRESH_WINDOW, default=current_window): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=600)
+                ),
+                vol.Optional(CONF_TELEMETRY_MAX_AGE, default=current_max_age): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=720)
+                ),
+                vol.Optional(CONF_DAILY_BUDGET, default=current_budget): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=10000)
+                ),
             }),
             errors=errors,
         )
@@ -240,30 +289,42 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
                 # Initialize pairing handler
                 session = async_get_clientsession(self.hass)
                 self._pairing = VinFastPairing(session)
-                self._api = VinFastApi(session)
 
-                # Authenticate
-                await self._api.authenticate(
-                    self.config_entry.data[CONF_EMAIL],
-                    self.config_entry.data[CONF_PASSWORD],
-                )
-                await self._api.get_vehicles()
+                # Borrow the entry's client - it is normally already logged in.
+                # If the entry isn't loaded, log in on a client for this flow only.
+                if (account := async_get_loaded_account(self.hass, self.config_entry)) is not None:
+                    self._pairing.set_request_listener(account.async_record_request)
+                    self._api = account.api
+                else:
+                    self._api = VinFastApi(
+                        session,
+                        region=self.config_entry.data.get(CONF_REGION, DEFAULT_REGION),
+                    )
+                    self._api.set_credentials(
+                        self.config_entry.data[CONF_EMAIL],
+                        self.config_entry.data[CONF_PASSWORD],
+                    )
+                await self._api.ensure_token()
+                if not self._api.vins:
+                    await self._api.get_vehicles()
 
                 # Parse QR code
                 self._qr_params = self._pairing.parse_qr_code(qr_content)
 
-                # Validate VIN matches
+                # Validate the QR code belongs to one of the account's vehicles
+                qr_vin = self._qr_params.get("vin", "")
+                vin = qr_vin if qr_vin in self._api.vins else (self._api.vin or "")
                 self._pairing.validate_qr_for_vehicle(
                     self._qr_params,
-                    self._api.vin or "",
-                    self._api.user_id,
+                    vin,
+                    self._api.user_id_for(vin),
                 )
 
                 # Generate keypair and CSR
                 self._pairing.generate_keypair()
                 device_id = str(uuid.uuid4())[:8]
                 csr = self._pairing.generate_csr(
-                    self._api.vin or "",
+                    vin,
                     device_id,
                     "HomeAssistant"
                 )
@@ -272,12 +333,12 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
                 self._encrypted_csr, self._seed = self._pairing.encrypt_csr(
                     csr,
                     self._qr_params["K"],
-                    self._api.vin or "",
+                    vin,
                 )
 
                 # Trigger OTP
                 await self._pairing.verify_session(
-                    self._api._access_token or "",
+                    self._api.access_token or "",
                     self._qr_params["ssid"],
                     email=self.config_entry.data.get(CONF_EMAIL),
                 )
@@ -319,8 +380,9 @@ class VinFastOptionsFlow(config_entries.OptionsFlow):
                     raise VinFastPairingError("Pairing session lost")
 
                 # Send pairing data with OTP
+                await self._api.ensure_token()
                 response = await self._pairing.send_pair_data(
-                    self._api._access_token or "",
+                    self._api.access_token or "",
                     self._encrypted_csr,
                     otp,
                     self._seed,
@@ -51,11 +51,20 @@ CONF_OCPP_ENTITY = "ocpp_entity"
 CONF_OCPP_CHARGING_STATE = "ocpp_charging_state"
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_CHARGING_UPDATE_INTERVAL = "charging_update_interval"
+CONF_REFRESH_WINDOW = "refresh_window"
+CONF_TELEMETRY_MAX_AGE = "telemetry_max_age"
+CONF_DAILY_BUDGET = "daily_budget"
 
 # Update intervals (seconds)
 # Default: 2.5 hours = ~10 polls per day (respectful of VinFast servers)
 UPDATE_INTERVAL_NORMAL = 9000  # 2.5 hours when idle (default) = ~10 polls/day
 UPDATE_INTERVAL_CHARGING = 300  # 5 minutes when charging via OCPP (default)
+# While the car's own telemetry shows it active (the normal interval is the ceiling)
+UPDATE_INTERVAL_DRIVING = 300  # 5 minutes while driving
+UPDATE_INTERVAL_PARKED = 900  # 15 minutes for the first hour after driving or charging
+# Vehicle list, profile and locations only change when the owner edits them
+UPDATE_INTERVAL_VEHICLE_INFO = 86400  # once a day
+UPDATE_INTERVAL_VEHICLE_INFO_RETRY = 3600  # after a failed refresh
 
 # Update interval options (in hours for normal, minutes for charging)
 UPDATE_INTERVAL_OPTIONS = {
@@ -75,6 +84,23 @@ CHARGING_UPDATE_INTERVAL_OPTIONS = {
     "30 minutes": 1800,
 }
 
+# Refresh requests within this window share one poll (seconds)
+DEFAULT_REFRESH_WINDOW = 30
+
+# Telemetry entities go unavailable once the car reported their value longer
+# ago than this (hours, 0 = never). Until then last known values are shown.
+DEFAULT_TELEMETRY_MAX_AGE = 72
+
+# Requests per account per day across every endpoint (0 = unlimited). Polls
+# are paced to last the day and stop when it is used up; commands still go.
+DEFAULT_DAILY_BUDGET = 500
+
+# What triggered a poll, shown in diagnostics
+REFRESH_REASON_SCHEDULED = "scheduled"
+REFRESH_REASON_OCPP = "ocpp"
+REFRESH_REASON_COMMAND = "command"
+REFRESH_REASON_MANUAL = "manual"
+
 # Legacy - for backward compatibility
 UPDATE_INTERVAL = UPDATE_INTERVAL_NORMAL
 
@@ -91,3 +117,17 @@ SENSOR_ODOMETER = "odometer"
 SENSOR_BATTERY = "battery"
 SENSOR_CHARGING = "charging"
 SENSOR_RANGE = "range"
+
+# hass.data keys for the shared per-account API clients and the lock creating them
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"
+DATA_ACCOUNTS_LOCK = f"{DOMAIN}_accounts_lock"
+
+# Persistent storage
+STORAGE_VERSION = 1
+STORAGE_KEY_TOKENS = f"{DOMAIN}.tokens"
+STORAGE_KEY_ALIASES = f"{DOMAIN}.aliases"
+STORAGE_KEY_ALIAS_YIELD = f"{DOMAIN}.alias_yield"
+STORAGE_KEY_BUDGET = f"{DOMAIN}.budget"
+
+# Minimum delay before retrying a failed background token refresh (seconds)
+TOKEN_REFRESH_RETRY = 60
@@ -1,37 +1,153 @@
 """Data update coordinator for VinFast."""
 from __future__ import annotations
 
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import timedelta
 import logging
+import math
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .account import VinFastAccount, async_get_entry_account
+from .activity import (
+    ACTIVITY_TELEMETRY_KEYS,
+    STATE_CHARGING,
+    STATE_DRIVING,
+    STATE_ASLEEP,
+    STATE_PARKED,
+    VehicleActivity,
+)
 from .api import VinFastApi, VinFastApiError, VinFastAuthError
+from .budget import RequestBudget
+from .cadence import UploadCadence
+from .circuit import STATE_HALF_OPEN, CircuitBreaker
 from .const import (
     DOMAIN,
     UPDATE_INTERVAL_NORMAL,
     UPDATE_INTERVAL_CHARGING,
+    UPDATE_INTERVAL_DRIVING,
+    UPDATE_INTERVAL_PARKED,
+    UPDATE_INTERVAL_VEHICLE_INFO,
+    UPDATE_INTERVAL_VEHICLE_INFO_RETRY,
     CONF_OCPP_ENTITY,
     CONF_OCPP_CHARGING_STATE,
     CONF_UPDATE_INTERVAL,
     CONF_CHARGING_UPDATE_INTERVAL,
-    CONF_REGION,
+    CONF_REFRESH_WINDOW,
+    CONF_TELEMETRY_MAX_AGE,
     DEFAULT_OCPP_CHARGER_ENTITY,
     DEFAULT_OCPP_CHARGING_STATE,
-    DEFAULT_REGION,
+    DEFAULT_REFRESH_WINDOW,
+    DEFAULT_TELEMETRY_MAX_AGE,
+    REFRESH_REASON_MANUAL,
+    REFRESH_REASON_OCPP,
+    REFRESH_REASON_SCHEDULED,
 )
+from .telemetry import TelemetrySnapshot
+from .view import VehicleView
+
+# Number of recent polls kept for diagnostics
+POLL_HISTORY_SIZE = 20
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching VinFast data."""
+class VinFastVehicleInfoCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Slow coordinator for the account's vehicle list, profile and locations.
+
+    Refreshed once a day or on demand. Data is keyed by VIN in the same
+    shape as the telemetry coordinator's, without telemetry. Entities that
+    show only vehicle info attach here, so telemetry polls don't wake them.
+    """
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        get_api: Callable[[], Awaitable[VinFastApi]],
+    ) -> None:
+        """Initialize the coordinator, borrowing the API client from get_api."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} vehicle info",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_VEHICLE_INFO),
+        )
+        self.config_entry = entry
+        self._get_api = get_api
+        self._stale: bool = False
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Fetch the vehicle info, keeping the last known values on failure.
+
+        Refreshes, scheduled or on demand, bypass the API's endpoint cache:
+        its entries live as long as this coordinator's interval, so it would
+        serve the values this refresh is meant to replace.
+        """
+        api = await self._get_api()
+        if self.data is not None:
+            api.invalidate_cache()
+        try:
+            await api.ensure_token()
+            info = await api.get_vehicle_info()
+        except VinFastApiError as err:
+            if self.data is None:
+                raise UpdateFailed(f"Error fetching vehicle info: {err}") from err
+            _LOGGER.warning("Vehicle info refresh failed, keeping last known values: %s", err)
+            self._stale = True
+            self.update_interval = timedelta(seconds=UPDATE_INTERVAL_VEHICLE_INFO_RETRY)
+            return self.data
+
+        self._stale = False
+        self.update_interval = timedelta(seconds=UPDATE_INTERVAL_VEHICLE_INFO)
+        return self._split_by_vehicle(info)
+
+    @staticmethod
+    def _split_by_vehicle(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        """Fan the account-wide vehicle info out into per-VIN data."""
+        return {
+            vin: {
+                "vehicles": [vehicle],
+                "profile": data.get("profile", {}),
+                "telemetry": None,
+                "locations": data.get("locations", []),
+                "view": VehicleView(vin, vehicle, None),
+            }
+            for vehicle in data.get("vehicles", [])
+            if (vin := vehicle.get("vinCode"))
+        }
+
+    @property
+    def stale(self) -> bool:
+        """Return True while showing vehicle info from before a failed refresh."""
+        return self._stale
+
+    @callback
+    def async_inputs_changed(self, vin: str, keys: tuple[str, ...] | None) -> bool:
+        """Return True; vehicle info updates rarely, so every update is written."""
+        return True
+
+
+class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, dict[str, Any]]]):
+    """Class to manage fetching VinFast data for every vehicle on an account.
+
+    Data is keyed by VIN. Each vehicle's entry has the same shape a
+    single-vehicle poll always had: its own vehicle info as the only item
+    of "vehicles", its own "telemetry", and the account-wide "profile" and
+    "locations".
+
+    Only telemetry is polled here. The vehicle info comes from the
+    vehicle_info coordinator, which refreshes on its own slower schedule.
+    """
 
     config_entry: ConfigEntry
 
@@ -44,52 +160,389 @@ class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=configured_interval),
+            # Refresh requests within the window are coalesced into one poll.
+            # Any poll cancels the queued one, as it serves those requests too.
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=entry.options.get(CONF_REFRESH_WINDOW, DEFAULT_REFRESH_WINDOW),
+                immediate=True,
+                function=self.async_refresh,
+            ),
         )
         self.config_entry = entry
+        self._account: VinFastAccount | None = None
         self._api: VinFastApi | None = None
         self._is_ocpp_charging: bool = False
+        # What each vehicle is doing, from its own telemetry
+        self._activity: dict[str, VehicleActivity] = {}
+        # How often each vehicle uploads telemetry, learned from the pings
+        self._cadence: dict[str, UploadCadence] = {}
         self._unsub_charger_listener: callable | None = None
+        # Telemetry keys read by enabled entities (key -> number of entities)
+        self._telemetry_consumers: Counter[str] = Counter()
+        self._breaker = CircuitBreaker()
+        self._stale: bool = False
+        # Reasons waiting for the next poll, and those served by the poll in flight
+        self._pending_reasons: Counter[str] = Counter()
+        self._poll_reasons: Counter[str] | None = None
+        # Whether the poll in flight has sent its telemetry request yet
+        self._poll_sent: bool = False
+        self._unsub_follow_up: CALLBACK_TYPE | None = None
+        self._poll_history: deque[dict[str, Any]] = deque(maxlen=POLL_HISTORY_SIZE)
+        # Telemetry keys that changed in the last update per VIN (None = everything)
+        self._changes: dict[str, frozenset[str] | None] | None = None
+        self.vehicle_info = VinFastVehicleInfoCoordinator(hass, entry, self._async_get_api)
+        self._unsub_vehicle_info: CALLBACK_TYPE | None = self.vehicle_info.async_add_listener(
+            self._async_vehicle_info_updated
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from VinFast API."""
-        if self._api is None:
-            session = async_get_clientsession(self.hass)
-            region = self.config_entry.data.get(CONF_REGION, DEFAULT_REGION)
-            self._api = VinFastApi(session, region=region)
+    async def async_request_refresh(self) -> None:
+        """Request a refresh. Callers that don't give a reason are manual updates."""
+        await self.async_request_refresh_for(REFRESH_REASON_MANUAL)
 
-            # Authenticate
-            try:
-                await self._api.authenticate(
-                    self.config_entry.data[CONF_EMAIL],
-                    self.config_entry.data[CONF_PASSWORD],
-                )
-            except VinFastAuthError as err:
-                raise UpdateFailed(f"Authentication failed: {err}") from err
-            except VinFastApiError as err:
-                raise UpdateFailed(f"API error: {err}") from err
+    async def async_request_refresh_for(self, reason: str) -> None:
+        """Request a refresh for a reason, sharing polls with other requests.
+
+        A request made while a poll is in flight is served by that poll, as
+        long as the poll hasn't sent its request yet: after that it can't
+        see what the request is about (such as a command's effect), so the
+        request waits for one follow-up poll. Requests within the refresh
+        window share one poll.
+        """
+        if self._poll_reasons is not None and not self._poll_sent:
+            self._poll_reasons[reason] += 1
+            _LOGGER.debug("Refresh for %s served by the poll in flight", reason)
+            return
+        self._pending_reasons[reason] += 1
+        if self._poll_reasons is not None:
+            _LOGGER.debug("Refresh for %s queued behind the poll in flight", reason)
+            return
+        await self._debounced_refresh.async_call()
+
+    @callback
+    def _schedule_follow_up(self) -> None:
+        """Poll again for requests that arrived after the last poll was sent."""
+        if self._unsub_follow_up is None:
+            # The refresh window has passed by then, so the debouncer runs it
+            self._unsub_follow_up = async_call_later(
+                self.hass, self._debounced_refresh.cooldown, self._async_follow_up
+            )
+
+    async def _async_follow_up(self, _now: Any) -> None:
+        """Run the follow-up poll, unless another poll already served it."""
+        self._unsub_follow_up = None
+        if self._pending_reasons:
+            await self._debounced_refresh.async_call()
+
+    async def _async_update_data(self) -> dict[str, dict[str, Any]]:
+        """Poll, recording which requests this round trip served."""
+        reasons = self._pending_reasons or Counter({REFRESH_REASON_SCHEDULED: 1})
+        self._pending_reasons = Counter()
+        self._poll_reasons = reasons
+        self._poll_sent = False
+        started = dt_util.utcnow()
+        outcome = "failed"
+        previous, was_stale = self.data, self._stale
+        try:
+            await self._async_get_api()
+            # Decided once per poll: why this poll is skipped, if it is
+            skip = None
+            if self.data is not None:
+                if not self._breaker.allow_request():
+                    skip = "circuit_open"
+                elif not self._budget_allows_poll():
+                    skip = "over_budget"
+            data = await self._async_update_or_serve_stale(skip)
+            if not self.last_update_success or self._stale != was_stale:
+                # Availability or the stale flag changes for every entity
+                self._changes = None
+            else:
+                self._changes = self._diff_by_vehicle(previous, data)
+            outcome = skip or ("stale" if self._stale else "ok")
+            return data
+        finally:
+            self._poll_reasons = None
+            self._poll_sent = False
+            if self._pending_reasons:
+                self._schedule_follow_up()
+            self._poll_history.append({
+                "started": started.isoformat(),
+                "duration": round((dt_util.utcnow() - started).total_seconds(), 2),
+                "reasons": dict(reasons),
+                "outcome": outcome,
+            })
+
+    @property
+    def poll_history(self) -> list[dict[str, Any]]:
+        """Return the most recent polls with what triggered them."""
+        return list(self._poll_history)
+
+    async def _async_update_or_serve_stale(self, skip: str | None) -> dict[str, dict[str, Any]]:
+        """Fetch data from VinFast API, unless skip gives a reason not to.
+
+        Once there is data, a failed poll keeps serving the last known
+        values (marked stale) instead of turning every entity unavailable,
+        and the circuit breaker pauses polling while the cloud keeps failing.
+        """
+        if skip == "circuit_open":
+            _LOGGER.debug(
+                "Circuit open, serving last known values for %d more seconds",
+                self._breaker.retry_in,
+            )
+            self._update_polling_interval()
+            return self._with_telemetry({})
+
+        if skip == "over_budget":
+            _LOGGER.debug("Daily request budget used up, serving last known values")
+            self._update_polling_interval()
+            return self._with_telemetry({})
+
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed as err:
+            self._breaker.record_failure()
+            # An open circuit schedules the next poll for when it allows a probe
+            self._update_polling_interval()
+            if self.data is None:
+                raise
+            _LOGGER.warning("Update failed, keeping last known values: %s", err)
+            self._stale = True
+            return self._with_telemetry({})
+
+        self._breaker.record_success()
+        self._stale = False
+        self._update_activity(data)
+        return data
+
+    async def _async_get_api(self) -> VinFastApi:
+        """Return the shared API client, acquiring the account on first use."""
+        if self._account is None:
+            # Borrow the shared client - a config flow may already have logged in
+            self._account = await async_get_entry_account(self.hass, self.config_entry)
+            self._account.async_acquire(self.config_entry)
+            self._api = self._account.api
+            self._api.set_requested_keys(self._requested_telemetry_keys())
+        return self._api
+
+    async def _async_fetch_data(self) -> dict[str, dict[str, Any]]:
+        """Poll the API once, raising UpdateFailed on failure."""
+        if self.vehicle_info.data is None:
+            # First poll - the pings need to know which vehicles there are
+            await self.vehicle_info.async_refresh()
+            if self.vehicle_info.data is None:
+                raise UpdateFailed("Vehicle info could not be loaded")
+
+        try:
+            await self._api.ensure_token()
+            if self._breaker.state == STATE_HALF_OPEN:
+                # Check the cloud is back with one cheap request before a full poll
+                await self._api.probe()
+        except VinFastAuthError as err:
+            raise UpdateFailed(f"Authentication failed: {err}") from err
+        except VinFastApiError as err:
+            raise UpdateFailed(f"API error: {err}") from err
 
+        # Refresh requests from now on need a poll of their own
+        self._poll_sent = True
         try:
-            return await self._api.get_all_data()
+            telemetry = await self._api.get_all_telemetry()
         except VinFastAuthError:
-            # Re-authenticate
+            # Token was rejected by the server - renew it and try once more
             try:
-                await self._api.authenticate(
-                    self.config_entry.data[CONF_EMAIL],
-                    self.config_entry.data[CONF_PASSWORD],
-                )
-                return await self._api.get_all_data()
+                self._api.invalidate_token()
+                await self._api.ensure_token()
+                telemetry = await self._api.get_all_telemetry()
             except Exception as err:
                 raise UpdateFailed(f"Re-authentication failed: {err}") from err
         except VinFastApiError as err:
             raise UpdateFailed(f"Error fetching data: {err}") from err
 
+        self._account.async_check_alias_cache()
+        self._record_uploads(telemetry)
+        return self._with_telemetry(telemetry)
+
+    def _with_telemetry(
+        self, telemetry: dict[str, TelemetrySnapshot | None]
+    ) -> dict[str, dict[str, Any]]:
+        """Combine the per-VIN vehicle info with each vehicle's telemetry.
+
+        Each ping is merged into the vehicle's last known telemetry, so an
+        alias a ping didn't return - or a failed ping - keeps its previous
+        value until it is older than the configured maximum age.
+        """
+        previous = self.data or {}
+        now_ms = int(dt_util.utcnow().timestamp() * 1000)
+        max_age = self.config_entry.options.get(CONF_TELEMETRY_MAX_AGE, DEFAULT_TELEMETRY_MAX_AGE)
+        data: dict[str, dict[str, Any]] = {}
+        for vin, info in self.vehicle_info.data.items():
+            last_known = previous[vin]["telemetry"] if vin in previous else None
+            snapshot = telemetry.get(vin)
+            if snapshot is None:
+                snapshot = last_known
+            else:
+                snapshot = snapshot.merged_with(last_known, now_ms)
+            expired = frozenset()
+            if snapshot is not None and max_age:
+                expired = frozenset(snapshot.updated_before(now_ms - max_age * 3_600_000))
+            data[vin] = {
+                **info,
+                "telemetry": snapshot,
+                # Entity values, converted once here rather than on every state read
+                "view": VehicleView(vin, info["vehicles"][0], snapshot, expired),
+            }
+        return data
+
+    @callback
+    def _async_vehicle_info_updated(self) -> None:
+        """Rebuild the vehicle data when the vehicle info changed."""
+        if self.data is None or self.vehicle_info.data is None:
+            return
+        data = self._with_telemetry({})
+        changes = self._diff_by_vehicle(self.data, data)
+        if changes is not None and not any(
+            changed is None or changed for changed in changes.values()
+        ):
+            return
+        self._changes = changes
+        self.data = data
+        self.async_update_listeners()
+
+    @staticmethod
+    def _diff_by_vehicle(
+        previous: dict[str, dict[str, Any]] | None, data: dict[str, dict[str, Any]]
+    ) -> dict[str, frozenset[str] | None] | None:
+        """Return the telemetry keys that changed per VIN since the previous data.
+
+        None for a vehicle means all of its entities are affected: it is new,
+        its vehicle info changed, or its telemetry appeared or went away.
+        Keys whose value just expired count as changed.
+        """
+        if previous is None:
+            return None
+        changes: dict[str, frozenset[str] | None] = {}
+        for vin, vehicle_data in data.items():
+            old = previous.get(vin)
+            if old is vehicle_data:
+                changes[vin] = frozenset()
+                continue
+            if old is None or old["vehicles"] != vehicle_data["vehicles"]:
+                changes[vin] = None
+                continue
+            telemetry, old_telemetry = vehicle_data["telemetry"], old["telemetry"]
+            if telemetry is None or old_telemetry is None:
+                changes[vin] = None if telemetry is not old_telemetry else frozenset()
+                continue
+            changed = set() if telemetry is old_telemetry else telemetry.changed_keys(old_telemetry)
+            changed |= old["view"].expired ^ vehicle_data["view"].expired
+            changes[vin] = frozenset(changed)
+        return changes
+
+    @callback
+    def async_inputs_changed(self, vin: str, keys: tuple[str, ...] | None) -> bool:
+        """Return True if the last update changed any of these inputs of a vehicle.
+
+        keys are the telemetry keys an entity reads; None means it reads more
+        than telemetry and is always updated.
+        """
+        if keys is None or self._changes is None or not self.last_update_success:
+            return True
+        changed = self._changes.get(vin)
+        return changed is None or not changed.isdisjoint(keys)
+
+    def _requested_telemetry_keys(self) -> set[str] | None:
+        """Return the telemetry keys to request, or None for all of them.
+
+        Until the platforms have registered their entities (first refresh)
+        every core alias is requested. The aliases the activity state machine
+        reads are requested even when their entities are disabled.
+        """
+        if not self._telemetry_consumers:
+            return None
+        return set(self._telemetry_consumers).union(ACTIVITY_TELEMETRY_KEYS)
+
+    @callback
+    def async_add_telemetry_consumer(self, keys: Iterable[str]) -> CALLBACK_TYPE:
+        """Register telemetry keys read by an enabled entity.
+
+        Entities call this when added to hass and the returned callback when
+        removed, so disabling an entity drops its aliases from the next ping.
+        """
+        keys = tuple(keys)
+        self._telemetry_consumers.update(keys)
+        self._async_update_requested_keys()
+
+        @callback
+        def _remove_consumer() -> None:
+            self._telemetry_consumers.subtract(keys)
+            self._telemetry_consumers += Counter()  # Drop keys nobody reads anymore
+            self._async_update_requested_keys()
+
+        return _remove_consumer
+
+    @callback
+    def _async_update_requested_keys(self) -> None:
+        """Push the current consumer key set to the API client."""
+        if self._api is not None:
+            self._api.set_requested_keys(self._requested_telemetry_keys())
+
+    @property
+    def stale(self) -> bool:
+        """Return True while entities show last known values from before a failure."""
+        return self._stale
+
+    @property
+    def activity(self) -> dict[str, str]:
+        """Return each vehicle's activity state (driving, charging, parked, asleep)."""
+        return {vin: activity.state for vin, activity in self._activity.items()}
+
+    @property
+    def upload_cadence(self) -> dict[str, dict[str, Any]]:
+        """Return each vehicle's learned upload cadence per activity state."""
+        return {vin: cadence.as_dict() for vin, cadence in self._cadence.items()}
+
+    @property
+    def budget(self) -> RequestBudget | None:
+        """Return the account's daily request budget."""
+        return self._account.budget if self._account is not None else None
+
+    @callback
+    def async_record_request(self, url: str) -> None:
+        """Count a request sent outside the API client, such as a remote command."""
+        if self._account is not None:
+            self._account.async_record_request(url)
+
+    def _poll_cost(self) -> int:
+        """Return the requests one poll sends: a telemetry ping per vehicle."""
+        return len(self.vehicle_info.data or ()) or 1
+
+    def _budget_allows_poll(self) -> bool:
+        """Return True if the daily budget has room for another poll."""
+        budget = self.budget
+        return budget is None or budget.allows(self._poll_cost())
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker guarding the polls."""
+        return self._breaker
+
+    @property
+    def api(self) -> VinFastApi | None:
+        """Return the authenticated API client."""
+        return self._api
+
     @property
     def vin(self) -> str | None:
-        """Return the VIN."""
+        """Return the VIN of the primary vehicle."""
         if self._api:
             return self._api.vin
         return None
 
+    @property
+    def vins(self) -> list[str]:
+        """Return the VINs of all vehicles with data."""
+        return list(self.data) if self.data else []
+
     def _get_ocpp_entity(self) -> str:
         """Get the configured OCPP entity."""
         return self.config_entry.options.get(
@@ -154,7 +607,9 @@ class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             # If charging started, trigger an immediate refresh
             if self._is_ocpp_charging:
-                self.hass.async_create_task(self.async_request_refresh())
+                self.hass.async_create_task(
+                    self.async_request_refresh_for(REFRESH_REASON_OCPP)
+                )
 
     def _get_normal_interval(self) -> int:
         """Get configured normal update interval."""
@@ -164,22 +619,105 @@ class VinFastDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Get configured charging update interval."""
         return self.config_entry.options.get(CONF_CHARGING_UPDATE_INTERVAL, UPDATE_INTERVAL_CHARGING)
 
+    def _update_activity(self, data: dict[str, dict[str, Any]]) -> None:
+        """Run each vehicle's activity state machine on freshly polled telemetry.
+
+        The car's last upload, as seen in the pings, tells whether the
+        values are current. The interval is recomputed after every poll, as
+        each one uses up some of the daily budget.
+        """
+        now_ms = int(dt_util.utcnow().timestamp() * 1000)
+        for vin, vehicle_data in data.items():
+            if vin not in self._activity:
+                self._activity[vin] = VehicleActivity()
+            uploaded_ms = self._cadence[vin].last_upload if vin in self._cadence else None
+            self._activity[vin].update(vehicle_data["view"], uploaded_ms, now_ms)
+        for vin in self._activity.keys() - data.keys():
+            del self._activity[vin]
+        for vin in self._cadence.keys() - data.keys():
+            del self._cadence[vin]
+        self._update_polling_interval()
+
+    def _record_uploads(self, telemetry: dict[str, TelemetrySnapshot | None]) -> None:
+        """Learn each vehicle's upload cadence from the pings as received.
+
+        Uploads seen now are attributed to the state the car was in since
+        the previous poll.
+        """
+        for vin, snapshot in telemetry.items():
+            if snapshot is None:
+                continue
+            if vin not in self._cadence:
+                self._cadence[vin] = UploadCadence()
+            state = self._activity[vin].state if vin in self._activity else STATE_ASLEEP
+            self._cadence[vin].record(snapshot.reported_at(), state)
+
     def _update_polling_interval(self) -> None:
-        """Update the polling interval based on charging state."""
+        """Update the polling interval from OCPP and the vehicles' activity.
+
+        The most active vehicle sets the pace: driving, charging (the car's
+        own status or the OCPP charger) and recently parked poll faster than
+        the configured normal interval, which is used once every car is asleep.
+        Within that, each vehicle's poll is aligned to just after its next
+        expected upload and backs off while polls find no new upload. The
+        daily budget sets the floor: polls are spread so it lasts the day.
+        While the circuit breaker is open, the next poll is the probe once
+        its backoff has passed, even when the budget would wait longer.
+        """
+        normal = self._get_normal_interval()
+        intervals = {
+            STATE_DRIVING: UPDATE_INTERVAL_DRIVING,
+            STATE_CHARGING: self._get_charging_interval(),
+            STATE_PARKED: UPDATE_INTERVAL_PARKED,
+        }
+        interval_seconds = normal
         if self._is_ocpp_charging:
-            interval_seconds = self._get_charging_interval()
-            new_interval = timedelta(seconds=interval_seconds)
-            _LOGGER.debug("OCPP charging detected - switching to %d-second polling", interval_seconds)
-        else:
-            interval_seconds = self._get_normal_interval()
-            new_interval = timedelta(seconds=interval_seconds)
-            _LOGGER.debug("Not charging - switching to %d-second polling", interval_seconds)
-
-        if self.update_interval != new_interval:
-            self.update_interval = new_interval
-
-    def async_unsubscribe(self) -> None:
-        """Unsubscribe from charger state changes."""
+            interval_seconds = min(interval_seconds, intervals[STATE_CHARGING])
+        now_ms = int(dt_util.utcnow().timestamp() * 1000)
+        for vin, activity in self._activity.items():
+            state_interval = intervals.get(activity.state, normal)
+            if vin in self._cadence:
+                state_interval = self._cadence[vin].next_poll_delay(
+                    activity.state, state_interval, normal, now_ms
+                )
+            interval_seconds = min(interval_seconds, round(state_interval))
+        if (budget := self.budget) is not None and (
+            paced := budget.paced_interval(self._poll_cost())
+        ) is not None:
+            interval_seconds = max(interval_seconds, round(paced))
+        if (retry_in := self._breaker.retry_in) > 0:
+            # Probe as soon as the backoff allows, not at the next regular or
+            # paced tick; a failing cloud isn't using up the budget anyway
+            interval_seconds = math.ceil(retry_in)
+
+        new_interval = timedelta(seconds=interval_seconds)
+        if self.update_interval == new_interval:
+            return
+        _LOGGER.debug(
+            "Switching to %d-second polling (OCPP charging: %s, activity: %s, budget left: %s)",
+            interval_seconds,
+            self._is_ocpp_charging,
+            self.activity,
+            budget.remaining if budget is not None else None,
+        )
+        self.update_interval = new_interval
+        if self._poll_reasons is None and self._listeners:
+            # Outside a poll nothing else reschedules, so move the next poll now.
+            # A poll in flight schedules the next one with the new interval.
+            self._schedule_refresh()
+
+    async def async_unsubscribe(self) -> None:
+        """Unsubscribe from charger state changes and release the shared client."""
         if self._unsub_charger_listener:
             self._unsub_charger_listener()
             self._unsub_charger_listener = None
+        if self._unsub_vehicle_info:
+            self._unsub_vehicle_info()
+            self._unsub_vehicle_info = None
+        if self._unsub_follow_up:
+            self._unsub_follow_up()
+            self._unsub_follow_up = None
+        if self._account is not None:
+            await self._account.async_release(self.config_entry.entry_id)
+            self._account = None
+            self._api = None
@@ -1,18 +1,15 @@
 """Device tracker platform for VinFast integration."""
 from __future__ import annotations
 
-from typing import Any
-
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
+from .entity import VinFastEntity
 
 
 async def async_setup_entry(
@@ -23,34 +20,27 @@ async def async_setup_entry(
     """Set up VinFast device tracker based on a config entry."""
     coordinator: VinFastDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities([VinFastDeviceTracker(coordinator)])
+    async_add_entities(
+        VinFastDeviceTracker(coordinator, vin) for vin in coordinator.vins
+    )
 
 
-class VinFastDeviceTracker(CoordinatorEntity[VinFastDataUpdateCoordinator], TrackerEntity):
+class VinFastDeviceTracker(VinFastEntity, TrackerEntity):
     """Representation of a VinFast vehicle tracker."""
 
-    _attr_has_entity_name = True
     _attr_name = "Location"
     _attr_icon = "mdi:car-connected"
+    _update_keys = ("latitude", "longitude")
 
-    def __init__(self, coordinator: VinFastDataUpdateCoordinator) -> None:
+    def __init__(self, coordinator: VinFastDataUpdateCoordinator, vin: str) -> None:
         """Initialize the device tracker."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.vin}_location"
+        super().__init__(coordinator, vin)
+        self._attr_unique_id = f"{vin}_location"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
+    async def async_added_to_hass(self) -> None:
+        """Register the telemetry this tracker needs with the coordinator."""
+        await super().async_added_to_hass()
+        self._async_register_telemetry(self._update_keys)
 
     @property
     def source_type(self) -> SourceType:
@@ -60,29 +50,15 @@ class VinFastDeviceTracker(CoordinatorEntity[VinFastDataUpdateCoordinator], Trac
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        if self.coordinator.data:
-            telemetry = self.coordinator.data.get("telemetry")
-            if telemetry and isinstance(telemetry, dict):
-                lat = telemetry.get("latitude")
-                if lat is not None:
-                    try:
-                        return float(lat)
-                    except (ValueError, TypeError):
-                        pass
+        if view := self.vehicle_view:
+            return view.latitude
         return None
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        if self.coordinator.data:
-            telemetry = self.coordinator.data.get("telemetry")
-            if telemetry and isinstance(telemetry, dict):
-                lon = telemetry.get("longitude")
-                if lon is not None:
-                    try:
-                        return float(lon)
-                    except (ValueError, TypeError):
-                        pass
+        if view := self.vehicle_view:
+            return view.longitude
         return None
 
     @property
@@ -90,5 +66,11 @@ class VinFastDeviceTracker(CoordinatorEntity[VinFastDataUpdateCoordinator], Trac
         """Return if entity is available."""
         if not self.coordinator.last_update_success:
             return False
-        # Only available if we have location data
-        return self.latitude is not None and self.longitude is not None
+        # Only available if we have recent enough location data
+        view = self.vehicle_view
+        return (
+            view is not None
+            and view.latitude is not None
+            and view.longitude is not None
+            and view.expired.isdisjoint(self._update_keys)
+        )
@@ -10,6 +10,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import VinFastDataUpdateCoordinator
+from .telemetry import TelemetrySnapshot
 
 TO_REDACT = {
     CONF_EMAIL,
@@ -43,10 +44,48 @@ async def async_get_config_entry_diagnostics(
         },
         "coordinator": {
             "vin": "**REDACTED**" if coordinator.vin else None,
+            "vehicle_count": len(coordinator.vins),
             "last_update_success": coordinator.last_update_success,
             "update_interval": str(coordinator.update_interval),
+            "stale": coordinator.stale,
+            # Keyed by VIN, so only the states are included
+            "activity": list(coordinator.activity.values()),
+            "upload_cadence": list(coordinator.upload_cadence.values()),
+            "circuit": {
+                "state": coordinator.breaker.state,
+                "failures": coordinator.breaker.failures,
+                "retry_in": round(coordinator.breaker.retry_in),
+            },
+            "poll_history": coordinator.poll_history,
+            "budget": {
+                "allowance": coordinator.budget.allowance,
+                "used": coordinator.budget.used,
+                "remaining": coordinator.budget.remaining,
+                "by_endpoint": coordinator.budget.by_endpoint,
+            } if coordinator.budget is not None else None,
+            "vehicle_info": {
+                "last_update_success": coordinator.vehicle_info.last_update_success,
+                "update_interval": str(coordinator.vehicle_info.update_interval),
+                "stale": coordinator.vehicle_info.stale,
+            },
         },
-        "data": async_redact_data(coordinator.data, TO_REDACT) if coordinator.data else None,
+        # Per-vehicle data is keyed by VIN, so only the values are included
+        "data": [
+            async_redact_data(_as_plain_data(vehicle_data), TO_REDACT)
+            for vehicle_data in coordinator.data.values()
+        ] if coordinator.data else None,
     }
 
     return diagnostics_data
+
+
+def _as_plain_data(vehicle_data: dict[str, Any]) -> dict[str, Any]:
+    """Turn a vehicle's telemetry snapshot into plain, JSON-serializable data.
+
+    The derived view is left out; it only repeats the telemetry in display units.
+    """
+    plain = {key: value for key, value in vehicle_data.items() if key != "view"}
+    telemetry: TelemetrySnapshot | None = plain.get("telemetry")
+    if telemetry is not None:
+        plain["telemetry"] = telemetry.as_dict()
+    return plain
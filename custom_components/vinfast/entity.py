@@ -0,0 +1,84 @@
+"""Base entity for VinFast integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import VinFastDataUpdateCoordinator, VinFastVehicleInfoCoordinator
+from .view import VehicleView, vehicle_device_info
+
+
+class VinFastEntity(
+    CoordinatorEntity[VinFastDataUpdateCoordinator | VinFastVehicleInfoCoordinator]
+):
+    """Base class for entities belonging to one vehicle on the account.
+
+    Entities attach to the telemetry coordinator, or to its vehicle_info
+    coordinator when they only show vehicle info.
+    """
+
+    _attr_has_entity_name = True
+    # Telemetry keys the state is derived from; None writes state on every update
+    _update_keys: tuple[str, ...] | None = None
+
+    def __init__(
+        self,
+        coordinator: VinFastDataUpdateCoordinator | VinFastVehicleInfoCoordinator,
+        vin: str,
+    ) -> None:
+        """Initialize the entity for the vehicle with this VIN."""
+        super().__init__(coordinator)
+        self._vin = vin
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the update changed what this entity shows."""
+        if self.coordinator.async_inputs_changed(self._vin, self._update_keys):
+            super()._handle_coordinator_update()
+
+    @property
+    def vehicle_data(self) -> dict[str, Any] | None:
+        """Return this vehicle's slice of the coordinator data."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(self._vin)
+        return None
+
+    @property
+    def vehicle_view(self) -> VehicleView | None:
+        """Return the values derived from this vehicle's data in the last update."""
+        if data := self.vehicle_data:
+            return data.get("view")
+        return None
+
+    def _telemetry_fresh(self) -> bool:
+        """Return True if there is telemetry and none this entity reads is too old."""
+        view = self.vehicle_view
+        return (
+            view is not None
+            and view.has_telemetry
+            and view.expired.isdisjoint(self._update_keys or ())
+        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information about this VinFast vehicle."""
+        if view := self.vehicle_view:
+            return view.device_info
+        return vehicle_device_info(self._vin, {})
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values kept from before a failed update."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
+
+    def _async_register_telemetry(self, keys: Iterable[str]) -> None:
+        """Request these telemetry keys from the ping while the entity exists."""
+        keys = tuple(keys)
+        if keys:
+            self.async_on_remove(self.coordinator.async_add_telemetry_consumer(keys))
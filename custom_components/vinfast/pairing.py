@@ -9,6 +9,7 @@ import logging
 import os
 import secrets
 import time
+from collections.abc import Callable
 from typing import Any
 
 from cryptography.hazmat.primitives import hashes, serialization
@@ -20,6 +21,7 @@ import aiohttp
 import async_timeout
 
 from .const import API_BASE
+from .ratelimit import PRIORITY_COMMAND, RATE_LIMIT_MAX_WAIT, limiter_for, parse_retry_after
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,12 +50,48 @@ class VinFastPairing:
         self._vin: str | None = None
         self._user_id: str | None = None
         self._is_paired: bool = False
+        self._request_listener: Callable[[str], None] | None = None
+
+    def set_request_listener(self, listener: Callable[[str], None] | None) -> None:
+        """Register a callback called with the URL of every request sent."""
+        self._request_listener = listener
+
+    async def _acquire(self, url: str) -> bool:
+        """Wait for the host's rate limiter and count the request.
+
+        Returns False instead of waiting when the server asked the host to
+        back off for longer than a command should wait.
+        """
+        limiter = limiter_for(url)
+        if limiter.too_long_to_wait(PRIORITY_COMMAND):
+            _LOGGER.warning(
+                "Rate limited by server for %.0f more seconds", limiter.blocked_for
+            )
+            return False
+        await limiter.acquire(PRIORITY_COMMAND)
+        self._count_request(url)
+        return True
+
+    def _count_request(self, url: str) -> None:
+        """Report a request about to be sent to the request listener."""
+        if self._request_listener:
+            self._request_listener(url)
 
     @property
     def is_paired(self) -> bool:
         """Return True if paired and ready to send commands."""
         return self._is_paired and self._private_key is not None and self._shared_key is not None
 
+    @property
+    def vin(self) -> str | None:
+        """Return the VIN of the paired vehicle."""
+        return self._vin
+
+    @property
+    def session_id(self) -> str | None:
+        """Return the pairing session ID commands are sent under."""
+        return self._session_id
+
     def parse_qr_code(self, qr_content: str) -> dict[str, str]:
         """Parse VinFast pairing QR code.
 
@@ -92,6 +130,7 @@ class VinFastPairing:
             except Exception:
                 pass  # Profile ID check is optional
 
+        self._vin = qr_vin
         return True
 
     def generate_keypair(self) -> tuple[rsa.RSAPrivateKey, str]:
@@ -202,8 +241,10 @@ class VinFastPairing:
         }
 
         try:
+            url = f"{PAIRING_BASE}{VERIFY_SESSION_ENDPOINT}"
+            if not await self._acquire(url):
+                raise VinFastPairingError("Rate limited, try again later")
             async with async_timeout.timeout(30):
-                url = f"{PAIRING_BASE}{VERIFY_SESSION_ENDPOINT}"
                 async with self._session.post(url, json=payload, headers=headers) as response:
                     if response.status == 200:
                         _LOGGER.info("Verify session successful - OTP sent")
@@ -245,8 +286,10 @@ class VinFastPairing:
         }
 
         try:
+            url = f"{PAIRING_BASE}{SEND_PAIR_DATA_ENDPOINT}"
+            if not await self._acquire(url):
+                raise VinFastPairingError("Rate limited, try again later")
             async with async_timeout.timeout(30):
-                url = f"{PAIRING_BASE}{SEND_PAIR_DATA_ENDPOINT}"
                 async with self._session.post(url, json=payload, headers=headers) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -364,21 +407,33 @@ class VinFastPairing:
             "Accept": "application/json",
         }
 
+        url = f"{PAIRING_BASE}{COMMAND_ENDPOINT}"
+        limiter = limiter_for(url)
         try:
-            async with async_timeout.timeout(60):  # Commands may take time
-                url = f"{PAIRING_BASE}{COMMAND_ENDPOINT}"
-                async with self._session.post(url, json=signed_payload, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        _LOGGER.info("Command sent successfully: %s", data)
-                        return True
-                    else:
+            # One retry when the server asks us to back off briefly
+            for attempt in range(2):
+                if not await self._acquire(url):
+                    return False
+                async with async_timeout.timeout(60):  # Commands may take time
+                    async with self._session.post(url, json=signed_payload, headers=headers) as response:
+                        if response.status == 200:
+                            data = await response.json()
+                            _LOGGER.info("Command sent successfully: %s", data)
+                            return True
+
                         text = await response.text()
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        if response.status in (429, 503) and retry_after is not None:
+                            limiter.defer(retry_after)
+                            if attempt == 0 and retry_after <= RATE_LIMIT_MAX_WAIT:
+                                _LOGGER.debug("Command rate limited, retrying in %.0f seconds", retry_after)
+                                continue
                         _LOGGER.error("Command failed: %s - %s", response.status, text)
                         return False
         except aiohttp.ClientError as err:
             _LOGGER.error("Command connection error: %s", err)
             return False
+        return False
 
     def export_keys(self) -> dict[str, str]:
         """Export keys for storage in config entry."""
@@ -389,6 +444,7 @@ class VinFastPairing:
             "private_key_pem": self._private_key_pem or "",
             "shared_key_b64": self._shared_key_b64 or "",
             "session_id": self._session_id or "",
+            "vin": self._vin or "",
         }
 
     def import_keys(self, keys: dict[str, str]) -> bool:
@@ -397,6 +453,7 @@ class VinFastPairing:
             private_key_pem = keys.get("private_key_pem", "")
             shared_key_b64 = keys.get("shared_key_b64", "")
             session_id = keys.get("session_id", "")
+            vin = keys.get("vin") or None
 
             if private_key_pem and shared_key_b64:
                 self._private_key = serialization.load_pem_private_key(
@@ -407,6 +464,7 @@ class VinFastPairing:
                 self._shared_key = base64.b64decode(shared_key_b64)
                 self._shared_key_b64 = shared_key_b64
                 self._session_id = session_id
+                self._vin = vin
                 self._is_paired = True
                 _LOGGER.info("Pairing keys imported successfully")
                 return True
@@ -0,0 +1,138 @@
+"""Per-host request rate limiting for the VinFast cloud."""
+from __future__ import annotations
+
+import asyncio
+from email.utils import parsedate_to_datetime
+import heapq
+import itertools
+import logging
+import time
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower value = served first when requests queue up
+PRIORITY_COMMAND = 0  # user-initiated: remote commands, pairing, token renewal
+PRIORITY_POLL = 10  # scheduled coordinator polls
+
+# Sustained requests per second and burst size allowed per host
+RATE_LIMIT_RATE = 1.0
+RATE_LIMIT_BURST = 10
+
+# Longest server backoff a command waits out, queued or before a retry, instead of failing
+RATE_LIMIT_MAX_WAIT = 30
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """Token bucket for one host that serves queued requests by priority.
+
+    Requests take a token when one is available. Otherwise they queue and
+    are released, highest priority first, as tokens refill. A Retry-After
+    from the server blocks the whole host until it has passed.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT_RATE, burst: int = RATE_LIMIT_BURST) -> None:
+        """Initialize the limiter with a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    @property
+    def blocked_for(self) -> float:
+        """Return the seconds left on a server-requested backoff."""
+        return max(self._blocked_until - time.monotonic(), 0.0)
+
+    def too_long_to_wait(self, priority: int) -> bool:
+        """Return True if a request at this priority should fail rather than queue.
+
+        Polls don't wait out a server backoff at all, and commands wait at
+        most RATE_LIMIT_MAX_WAIT, so nothing hangs for a long Retry-After.
+        """
+        max_wait = RATE_LIMIT_MAX_WAIT if priority == PRIORITY_COMMAND else 0.0
+        return self.blocked_for > max_wait
+
+    def _take(self) -> bool:
+        """Take a token if the host isn't blocked and one is available."""
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return False
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait until a request at this priority may be sent."""
+        if not self._waiters and self._take():
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._schedule()
+        await future
+
+    def defer(self, seconds: float) -> None:
+        """Block the host for a server-requested backoff."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        # Refill starts when the block ends, so it doesn't end with a full burst
+        self._tokens = 0.0
+        self._updated = self._blocked_until
+        _LOGGER.debug("Rate limited by server, holding requests for %.0f seconds", seconds)
+
+    def _schedule(self) -> None:
+        """Arm a timer for when the next queued request can go."""
+        if self._wakeup is not None:
+            return
+        delay = max(
+            self._blocked_until - time.monotonic(),
+            (1 - self._tokens) / self._rate if self._tokens < 1 else 0.0,
+        )
+        self._wakeup = asyncio.get_running_loop().call_later(max(delay, 0.0), self._dispatch)
+
+    def _dispatch(self) -> None:
+        """Release queued requests, highest priority first, while tokens last."""
+        self._wakeup = None
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():  # Cancelled while queued
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if self._waiters:
+            self._schedule()
+
+
+# One limiter per host, shared by every client talking to it
+_LIMITERS: dict[str, HostRateLimiter] = {}
+
+
+def limiter_for(url: str) -> HostRateLimiter:
+    """Return the shared limiter for a URL's host."""
+    host = urlsplit(url).netloc
+    if host not in _LIMITERS:
+        _LIMITERS[host] = HostRateLimiter()
+    return _LIMITERS[host]
@@ -15,6 +15,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfLength,
     UnitOfPressure,
     UnitOfSpeed,
@@ -22,12 +23,12 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import VinFastDataUpdateCoordinator
+from .coordinator import VinFastDataUpdateCoordinator, VinFastVehicleInfoCoordinator
+from .entity import VinFastEntity
+from .view import VehicleView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,149 +37,18 @@ _LOGGER = logging.getLogger(__name__)
 class VinFastSensorEntityDescription(SensorEntityDescription):
     """Describes VinFast sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], Any] = lambda x: None
+    value_fn: Callable[[VehicleView], Any] = lambda x: None
+    # Telemetry keys value_fn reads - only these are requested from the ping
+    telemetry_keys: tuple[str, ...] = ()
 
 
-def get_vehicle_value(data: dict[str, Any], key: str) -> Any:
-    """Get a value from vehicle data."""
-    vehicles = data.get("vehicles", [])
-    if vehicles:
-        return vehicles[0].get(key)
-    return None
-
-
-def get_odometer_miles(data: dict[str, Any]) -> float | None:
-    """Get odometer from telemetry (preferred) or vehicle info (fallback).
-
-    The real-time odometer comes from VEHICLE_STATUS_ODOMETER telemetry alias.
-    Falls back to vehicle-info endpoint which may have stale data.
-    API returns values in kilometers - we convert to miles.
-    """
-    KM_TO_MILES = 0.621371
-
-    # First, try the real-time odometer from telemetry (VEHICLE_STATUS_ODOMETER alias)
-    odometer_value = get_telemetry_value(data, "odometer")
-    if odometer_value is not None:
-        try:
-            val_km = float(odometer_value)
-            _LOGGER.debug("Telemetry odometer (km): %s", val_km)
-            # Convert km to miles
-            if val_km > 0:
-                val_miles = val_km * KM_TO_MILES
-                _LOGGER.debug("Telemetry odometer (miles): %s", val_miles)
-                return round(val_miles, 1)
-        except (ValueError, TypeError):
-            pass
-
-    # Fallback to vehicle info (may be stale/cached) - also in km
-    value = get_vehicle_value(data, "odometer")
-    if value is not None:
-        try:
-            val_km = float(value)
-            _LOGGER.debug("Vehicle info odometer (km, fallback): %s", val_km)
-            # Convert km to miles
-            val_miles = val_km * KM_TO_MILES
-            _LOGGER.debug("Vehicle info odometer (miles): %s", val_miles)
-            return round(val_miles, 1)
-        except (ValueError, TypeError):
-            return None
-    return None
-
-
-def get_telemetry_value(data: dict[str, Any], key: str) -> Any:
-    """Get a value from telemetry data."""
-    telemetry = data.get("telemetry")
-    if telemetry and isinstance(telemetry, dict):
-        return telemetry.get(key)
-    return None
-
-
-# Unit conversion constants
-KM_TO_MILES = 0.621371
-KPA_TO_PSI = 0.145038
-
-
-def get_range_miles(data: dict[str, Any]) -> float | None:
-    """Convert range from km to miles."""
-    value = get_telemetry_value(data, "range")
-    if value is not None:
-        try:
-            return round(float(value) * KM_TO_MILES, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
-
-
-def get_speed_mph(data: dict[str, Any]) -> float | None:
-    """Convert speed from km/h to mph."""
-    value = get_telemetry_value(data, "speed")
-    if value is not None:
-        try:
-            return round(float(value) * KM_TO_MILES, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
-
-
-def get_tire_pressure_psi(data: dict[str, Any], key: str) -> float | None:
-    """Convert tire pressure from kPa to PSI."""
-    value = get_telemetry_value(data, key)
-    if value is not None:
-        try:
-            return round(float(value) * KPA_TO_PSI, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
-
-
-def get_temperature_f(data: dict[str, Any], key: str) -> float | None:
-    """Convert temperature from Celsius to Fahrenheit."""
-    value = get_telemetry_value(data, key)
-    if value is not None:
-        try:
-            celsius = float(value)
-            return round((celsius * 9 / 5) + 32, 1)
-        except (ValueError, TypeError):
-            pass
-    return None
-
-
-def get_gear_position(data: dict[str, Any]) -> str | None:
-    """Convert gear position number to letter.
-
-    From GearStatus.java in VinFast APK:
-    - 0 = OFF (ignition off)
-    - 1 = P (Park)
-    - 2 = R (Reverse)
-    - 3 = N (Neutral)
-    - 4 = D (Drive)
-    """
-    value = get_telemetry_value(data, "gear")
-    if value is not None:
-        try:
-            gear_map = {0: "OFF", 1: "P", 2: "R", 3: "N", 4: "D"}
-            return gear_map.get(int(value), str(value))
-        except (ValueError, TypeError):
-            return str(value)
-    return None
-
-
-def get_charging_status_text(data: dict[str, Any]) -> str | None:
-    """Convert charging status code to text."""
-    value = get_telemetry_value(data, "charging_status")
-    if value is not None:
-        try:
-            status_map = {
-                0: "Not Charging",
-                1: "Charging",
-                2: "Complete",
-                3: "Scheduled",
-                4: "Error",
-            }
-            return status_map.get(int(value), f"Unknown ({value})")
-        except (ValueError, TypeError):
-            return str(value)
-    return None
+# Sensors with no vehicle-info fallback, unavailable until telemetry arrives
+TELEMETRY_ONLY_SENSORS = frozenset({
+    "battery_level", "battery_12v", "range", "time_to_full",
+    "charging_status", "charge_limit", "speed", "gear",
+    "outside_temp", "inside_temp", "tire_pressure_fl", "tire_pressure_fr",
+    "tire_pressure_rl", "tire_pressure_rr",
+})
 
 
 SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
@@ -190,38 +60,38 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:counter",
-        value_fn=lambda data: get_odometer_miles(data),  # API returns km, convert to miles
+        telemetry_keys=("odometer",),
+        value_fn=lambda view: view.odometer_miles,
     ),
     VinFastSensorEntityDescription(
         key="vehicle_name",
         translation_key="vehicle_name",
         icon="mdi:car",
-        value_fn=lambda data: get_vehicle_value(data, "customizedVehicleName")
-        or get_vehicle_value(data, "vehicleName"),
+        value_fn=lambda view: view.vehicle_name,
     ),
     VinFastSensorEntityDescription(
         key="model",
         translation_key="model",
         icon="mdi:car-info",
-        value_fn=lambda data: f"{get_vehicle_value(data, 'vehicleType')} {get_vehicle_value(data, 'vehicleVariant')}".strip(),
+        value_fn=lambda view: view.model,
     ),
     VinFastSensorEntityDescription(
         key="year",
         translation_key="year",
         icon="mdi:calendar",
-        value_fn=lambda data: get_vehicle_value(data, "yearOfProduct"),
+        value_fn=lambda view: view.year,
     ),
     VinFastSensorEntityDescription(
         key="color",
         translation_key="color",
         icon="mdi:palette",
-        value_fn=lambda data: get_vehicle_value(data, "exteriorColor"),
+        value_fn=lambda view: view.color,
     ),
     VinFastSensorEntityDescription(
         key="vin",
         translation_key="vin",
         icon="mdi:identifier",
-        value_fn=lambda data: get_vehicle_value(data, "vinCode"),
+        value_fn=lambda view: view.vin_code,
     ),
     # ==================== Battery & Charging Sensors ====================
     VinFastSensorEntityDescription(
@@ -231,7 +101,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:battery",
-        value_fn=lambda data: get_telemetry_value(data, "battery_level"),
+        telemetry_keys=("battery_level",),
+        value_fn=lambda view: view.battery_level,
     ),
     VinFastSensorEntityDescription(
         key="battery_12v",
@@ -240,7 +111,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-battery",
-        value_fn=lambda data: get_telemetry_value(data, "lv_battery_level"),
+        telemetry_keys=("lv_battery_level",),
+        value_fn=lambda view: view.lv_battery_level,
     ),
     VinFastSensorEntityDescription(
         key="range",
@@ -249,7 +121,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:map-marker-distance",
-        value_fn=lambda data: get_range_miles(data),  # API returns km, convert to miles
+        telemetry_keys=("range",),
+        value_fn=lambda view: view.range_miles,
     ),
     VinFastSensorEntityDescription(
         key="time_to_full",
@@ -258,20 +131,23 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:timer",
-        value_fn=lambda data: get_telemetry_value(data, "time_to_full"),
+        telemetry_keys=("time_to_full",),
+        value_fn=lambda view: view.time_to_full,
     ),
     VinFastSensorEntityDescription(
         key="charging_status",
         translation_key="charging_status",
         icon="mdi:ev-station",
-        value_fn=lambda data: get_charging_status_text(data),
+        telemetry_keys=("charging_status",),
+        value_fn=lambda view: view.charging_status,
     ),
     VinFastSensorEntityDescription(
         key="charge_limit",
         translation_key="charge_limit",
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:battery-charging-high",
-        value_fn=lambda data: get_telemetry_value(data, "charge_limit"),
+        telemetry_keys=("charge_limit",),
+        value_fn=lambda view: view.charge_limit,
     ),
     # ==================== Speed & Driving Sensors ====================
     VinFastSensorEntityDescription(
@@ -281,13 +157,15 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SPEED,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:speedometer",
-        value_fn=lambda data: get_speed_mph(data),  # API returns km/h, convert to mph
+        telemetry_keys=("speed",),
+        value_fn=lambda view: view.speed_mph,
     ),
     VinFastSensorEntityDescription(
         key="gear",
         translation_key="gear",
         icon="mdi:car-shift-pattern",
-        value_fn=lambda data: get_gear_position(data),
+        telemetry_keys=("gear",),
+        value_fn=lambda view: view.gear,
     ),
     # ==================== Temperature Sensors ====================
     VinFastSensorEntityDescription(
@@ -297,7 +175,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
-        value_fn=lambda data: get_temperature_f(data, "outside_temp"),  # API returns C, convert to F
+        telemetry_keys=("outside_temp",),
+        value_fn=lambda view: view.outside_temp_f,
     ),
     VinFastSensorEntityDescription(
         key="inside_temp",
@@ -306,7 +185,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
-        value_fn=lambda data: get_temperature_f(data, "inside_temp"),  # API returns C, convert to F
+        telemetry_keys=("inside_temp",),
+        value_fn=lambda view: view.inside_temp_f,
     ),
     # ==================== Tire Pressure Sensors (kPa -> PSI) ====================
     VinFastSensorEntityDescription(
@@ -316,7 +196,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_fl"),  # API returns kPa
+        telemetry_keys=("tire_pressure_fl",),
+        value_fn=lambda view: view.tire_pressure_psi["tire_pressure_fl"],
     ),
     VinFastSensorEntityDescription(
         key="tire_pressure_fr",
@@ -325,7 +206,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_fr"),  # API returns kPa
+        telemetry_keys=("tire_pressure_fr",),
+        value_fn=lambda view: view.tire_pressure_psi["tire_pressure_fr"],
     ),
     VinFastSensorEntityDescription(
         key="tire_pressure_rl",
@@ -334,7 +216,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_rl"),  # API returns kPa
+        telemetry_keys=("tire_pressure_rl",),
+        value_fn=lambda view: view.tire_pressure_psi["tire_pressure_rl"],
     ),
     VinFastSensorEntityDescription(
         key="tire_pressure_rr",
@@ -343,7 +226,8 @@ SENSOR_DESCRIPTIONS: tuple[VinFastSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:car-tire-alert",
-        value_fn=lambda data: get_tire_pressure_psi(data, "tire_pressure_rr"),  # API returns kPa
+        telemetry_keys=("tire_pressure_rr",),
+        value_fn=lambda view: view.tire_pressure_psi["tire_pressure_rr"],
     ),
 )
 
@@ -356,50 +240,49 @@ async def async_setup_entry(
     """Set up VinFast sensors based on a config entry."""
     coordinator: VinFastDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[VinFastSensor] = []
+    entities: list[SensorEntity] = []
 
-    # Add predefined sensors
-    for description in SENSOR_DESCRIPTIONS:
-        entities.append(VinFastSensor(coordinator, description))
+    # Add predefined sensors for every vehicle on the account. Sensors that
+    # read no telemetry only change with the vehicle info.
+    for vin in coordinator.vins:
+        for description in SENSOR_DESCRIPTIONS:
+            source = coordinator if description.telemetry_keys else coordinator.vehicle_info
+            entities.append(VinFastSensor(source, vin, description))
+
+    # The request budget is per account, so it is shown on the first vehicle only
+    if coordinator.vins:
+        entities.append(VinFastApiBudgetSensor(coordinator, coordinator.vins[0]))
 
     async_add_entities(entities)
 
 
-class VinFastSensor(CoordinatorEntity[VinFastDataUpdateCoordinator], SensorEntity):
+class VinFastSensor(VinFastEntity, SensorEntity):
     """Representation of a VinFast sensor."""
 
     entity_description: VinFastSensorEntityDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
-        coordinator: VinFastDataUpdateCoordinator,
+        coordinator: VinFastDataUpdateCoordinator | VinFastVehicleInfoCoordinator,
+        vin: str,
         description: VinFastSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vin)
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.vin}_{description.key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
+        self._attr_unique_id = f"{vin}_{description.key}"
+        self._update_keys = description.telemetry_keys
 
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
+    async def async_added_to_hass(self) -> None:
+        """Register the telemetry this sensor needs with the coordinator."""
+        await super().async_added_to_hass()
+        self._async_register_telemetry(self.entity_description.telemetry_keys)
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.entity_description.value_fn(self.coordinator.data)
+        if view := self.vehicle_view:
+            return self.entity_description.value_fn(view)
         return None
 
     @property
@@ -407,14 +290,42 @@ class VinFastSensor(CoordinatorEntity[VinFastDataUpdateCoordinator], SensorEntit
         """Return if entity is available."""
         if not self.coordinator.last_update_success:
             return False
-        # Telemetry-only sensors are only available when we have telemetry data
+        # Telemetry-only sensors are only available with recent enough telemetry
         # Note: odometer is NOT in this list since it falls back to vehicle info
-        telemetry_only_sensors = (
-            "battery_level", "battery_12v", "range", "time_to_full",
-            "charging_status", "charge_limit", "speed", "gear",
-            "outside_temp", "inside_temp", "tire_pressure_fl", "tire_pressure_fr",
-            "tire_pressure_rl", "tire_pressure_rr",
-        )
-        if self.entity_description.key in telemetry_only_sensors:
-            return self.coordinator.data and self.coordinator.data.get("telemetry") is not None
+        if self.entity_description.key in TELEMETRY_ONLY_SENSORS:
+            return self._telemetry_fresh()
         return True
+
+
+class VinFastApiBudgetSensor(VinFastEntity, SensorEntity):
+    """Requests left in the account's daily budget."""
+
+    _attr_translation_key = "api_budget"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:api"
+    _attr_native_unit_of_measurement = "requests"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: VinFastDataUpdateCoordinator, vin: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, vin)
+        self._attr_unique_id = f"{vin}_api_budget"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the requests left today, unknown when the budget is unlimited."""
+        if budget := self.coordinator.budget:
+            return budget.remaining
+        return None
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available - the count is kept while polls fail."""
+        return self.coordinator.budget is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return today's usage next to the allowance."""
+        if not (budget := self.coordinator.budget):
+            return None
+        return {"used": budget.used, "allowance": budget.allowance}
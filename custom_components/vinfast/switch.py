@@ -7,12 +7,11 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, REFRESH_REASON_COMMAND
 from .coordinator import VinFastDataUpdateCoordinator
+from .entity import VinFastEntity
 from .pairing import VinFastPairing, CONTROL_ALIASES
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,31 +27,33 @@ async def async_setup_entry(
     """Set up VinFast switches based on a config entry."""
     coordinator: VinFastDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Only add climate switch if paired
+    # Only add climate switch if paired, on the vehicle the keys were issued for
+    # (keys from before multi-vehicle support don't record it - the primary vehicle)
     pairing_keys = entry.options.get(CONF_PAIRING_KEYS)
     if pairing_keys:
-        entities = [VinFastClimateSwitch(coordinator, entry)]
+        vin = pairing_keys.get("vin") or coordinator.vin
+        entities = [VinFastClimateSwitch(coordinator, vin, entry)]
         async_add_entities(entities)
     else:
         _LOGGER.info("Remote control not paired - climate switch not available")
 
 
-class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], SwitchEntity):
+class VinFastClimateSwitch(VinFastEntity, SwitchEntity):
     """Representation of VinFast climate control switch."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "climate"
     _attr_icon = "mdi:air-conditioner"
 
     def __init__(
         self,
         coordinator: VinFastDataUpdateCoordinator,
+        vin: str,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the climate switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, vin)
         self._entry = entry
-        self._attr_unique_id = f"{coordinator.vin}_climate"
+        self._attr_unique_id = f"{vin}_climate"
         self._pairing: VinFastPairing | None = None
         self._is_on: bool = False
 
@@ -66,39 +67,19 @@ class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], Swit
             from homeassistant.helpers.aiohttp_client import async_get_clientsession
             session = async_get_clientsession(self.coordinator.hass)
             self._pairing = VinFastPairing(session)
+            self._pairing.set_request_listener(self.coordinator.async_record_request)
             if self._pairing.import_keys(pairing_keys):
                 _LOGGER.info("Pairing keys loaded for climate control")
             else:
                 _LOGGER.warning("Failed to load pairing keys")
                 self._pairing = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this VinFast vehicle."""
-        vehicles = self.coordinator.data.get("vehicles", []) if self.coordinator.data else []
-        vehicle = vehicles[0] if vehicles else {}
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.vin or "unknown")},
-            name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
-            manufacturer="VinFast",
-            model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
-            sw_version=str(vehicle.get("yearOfProduct", "")),
-        )
-
     @property
     def is_on(self) -> bool:
         """Return true if climate is on."""
-        # Try to get from telemetry if available
-        if self.coordinator.data:
-            telemetry = self.coordinator.data.get("telemetry", {})
-            if telemetry:
-                climate_status = telemetry.get("climate_on") or telemetry.get("ac_status")
-                if climate_status is not None:
-                    try:
-                        return int(climate_status) == 1
-                    except (ValueError, TypeError):
-                        pass
+        # Prefer the reported state from telemetry if available
+        if (view := self.vehicle_view) and view.climate_on is not None:
+            return view.climate_on
         return self._is_on
 
     @property
@@ -123,39 +104,33 @@ class VinFastClimateSwitch(CoordinatorEntity[VinFastDataUpdateCoordinator], Swit
             _LOGGER.error("Cannot send command - not paired")
             return
 
-        # Re-authenticate to get fresh token
-        from homeassistant.helpers.aiohttp_client import async_get_clientsession
-        from .api import VinFastApi
-        from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-
-        session = async_get_clientsession(self.coordinator.hass)
-        api = VinFastApi(session)
+        # Borrow the coordinator's client - it keeps the token fresh in the background
+        api = self.coordinator.api
+        if api is None:
+            _LOGGER.error("Cannot send command - API client not ready")
+            return
 
         try:
-            await api.authenticate(
-                self._entry.data[CONF_EMAIL],
-                self._entry.data[CONF_PASSWORD],
-            )
-            await api.get_vehicles()
+            await api.ensure_token()
 
             # Get device key for climate control
             device_key = CONTROL_ALIASES.get("CLIMATE_CONTROL_AIR_CONDITION_ENABLE", "3416_0_5850")
 
             # Send command
             success = await self._pairing.send_command(
-                access_token=api._access_token or "",
+                access_token=api.access_token or "",
                 message_name="CLIMATE_CONTROL_AIR_CONDITION_ENABLE",
                 device_key=device_key,
                 value=value,
-                user_id=api.user_id or "",
-                session_id=self._pairing._session_id or "",
+                user_id=api.user_id_for(self._vin) or "",
+                session_id=self._pairing.session_id or "",
             )
 
             if success:
                 self._is_on = value == 1
                 _LOGGER.info("Climate %s command sent successfully", "ON" if value else "OFF")
                 # Trigger coordinator refresh after a delay
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_request_refresh_for(REFRESH_REASON_COMMAND)
             else:
                 _LOGGER.error("Failed to send climate command")
 
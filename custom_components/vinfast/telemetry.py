@@ -0,0 +1,528 @@
+"""Telemetry request planning and ping response decoding for VinFast."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime
+import json
+import sys
+from typing import Any, NamedTuple
+
+# Map core aliases to friendly keys for backward compatibility
+ALIAS_TO_KEY: dict[str, str] = {
+    # Battery & Charging
+    "VEHICLE_STATUS_HV_BATTERY_SOC": "battery_level",
+    "VEHICLE_STATUS_LV_BATTERY_SOC": "lv_battery_level",
+    "VEHICLE_STATUS_REMAINING_DISTANCE": "range",
+    "VEHICLE_STATUS_ODOMETER": "odometer",
+    "CHARGING_STATUS_CHARGING_STATUS": "charging_status",
+    "CHARGING_STATUS_CHARGING_REMAINING_TIME": "time_to_full",
+    "CHARGE_CONTROL_CURRENT_TARGET_SOC": "charge_limit",
+    "CHARGE_CONTROL_SAMPLE_CHARGE_STATUS": "sample_charge_status",
+    # Vehicle Status
+    "VEHICLE_STATUS_IGNITION_STATUS": "ignition",
+    "VEHICLE_STATUS_GEAR_POSITION": "gear",
+    "VEHICLE_STATUS_VEHICLE_SPEED": "speed",
+    "VEHICLE_STATUS_HANDBRAKE_STATUS": "handbrake",
+    # Climate
+    "VEHICLE_STATUS_AMBIENT_TEMPERATURE": "outside_temp",
+    "CLIMATE_INFORMATION_DRIVER_TEMPERATURE": "inside_temp",
+    "CLIMATE_INFORMATION_STATUS": "climate_status",
+    # Tire Pressure
+    "VEHICLE_STATUS_FRONT_LEFT_TIRE_PRESSURE": "tire_pressure_fl",
+    "VEHICLE_STATUS_FRONT_RIGHT_TIRE_PRESSURE": "tire_pressure_fr",
+    "VEHICLE_STATUS_REAR_LEFT_TIRE_PRESSURE": "tire_pressure_rl",
+    "VEHICLE_STATUS_REAR_RIGHT_TIRE_PRESSURE": "tire_pressure_rr",
+    # Door Status
+    "DOOR_AJAR_FRONT_LEFT_DOOR_STATUS": "door_fl",
+    "DOOR_AJAR_FRONT_RIGHT_DOOR_STATUS": "door_fr",
+    "DOOR_AJAR_REAR_LEFT_DOOR_STATUS": "door_rl",
+    "DOOR_AJAR_REAR_RIGHT_DOOR_STATUS": "door_rr",
+    "DOOR_TRUNK_DOOR_STATUS": "trunk_status",
+    # Remote Control Status
+    "REMOTE_CONTROL_DOOR_STATUS": "locked",
+    "REMOTE_CONTROL_BONNET_CONTROL_STATUS": "hood_status",
+    "REMOTE_CONTROL_WINDOW_STATUS": "window_status",
+    "REMOTE_CONTROL_CHARGE_PORT_STATUS": "plugged_in",
+    # Location
+    "LOCATION_LATITUDE": "latitude",
+    "LOCATION_LONGITUDE": "longitude",
+    "VEHICLE_BEARING_DEGREE": "heading",
+}
+
+
+# Friendly key -> alias, for turning the keys entities consume into ping requests
+KEY_TO_ALIAS: dict[str, str] = {key: alias for alias, key in ALIAS_TO_KEY.items()}
+
+
+def aliases_for_keys(keys: Iterable[str]) -> frozenset[str]:
+    """Return the aliases that produce the given friendly telemetry keys.
+
+    Aliases without a friendly name are exposed under their lower-cased
+    alias, so those keys map back by upper-casing them.
+    """
+    return frozenset(KEY_TO_ALIAS.get(key, key.upper()) for key in keys)
+
+
+def _decode_number(value: Any) -> Any:
+    """Decode a numeric ping value, keeping the raw value if it isn't one."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _decode_text(value: Any) -> Any:
+    """Pass a textual ping value through unchanged."""
+    return value
+
+
+# Alias metadata "type" -> decoder. Integer types decode to float as well,
+# matching what entities have always received for them.
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "string": _decode_text,
+    "str": _decode_text,
+    "text": _decode_text,
+    "opaque": _decode_text,
+}
+
+
+def decoder_for_type(resource_type: str | None) -> Callable[[Any], Any]:
+    """Return the decoder for an alias metadata type."""
+    if not resource_type:
+        return _decode_number
+    return _DECODERS.get(resource_type.lower(), _decode_number)
+
+
+class PlanEntry(NamedTuple):
+    """Where a ping value goes in the parsed telemetry."""
+
+    alias: str
+    friendly_key: str
+    path: str
+    decode: Callable[[Any], Any]
+    slot: int
+
+
+def _epoch_ms(value: Any) -> int:
+    """Convert a ping lastUpdateTime to epoch milliseconds (0 when unknown)."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value:
+        if value.isdigit():
+            return int(value)
+        try:
+            return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000)
+        except ValueError:
+            pass
+    return 0
+
+
+class TelemetryLayout:
+    """Value slots shared by every snapshot decoded with one request plan.
+
+    Each resource gets a fixed slot, with its alias and friendly key
+    interned once here instead of being stored again in every snapshot.
+    Resources the plan didn't ask for are appended when they turn up.
+    """
+
+    __slots__ = ("aliases", "keys", "paths", "slot_by_key")
+
+    def __init__(self) -> None:
+        """Initialize an empty layout."""
+        self.aliases: list[str] = []
+        self.keys: list[str] = []
+        self.paths: list[str] = []
+        self.slot_by_key: dict[str, int] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the number of slots."""
+        return len(self.aliases)
+
+    def add(self, alias: str, friendly_key: str, path: str) -> int:
+        """Return the slot for a friendly key, adding it if it is new."""
+        slot = self.slot_by_key.get(friendly_key)
+        if slot is None:
+            slot = len(self.aliases)
+            friendly_key = sys.intern(friendly_key)
+            self.aliases.append(sys.intern(alias))
+            self.keys.append(friendly_key)
+            self.paths.append(path)
+            self.slot_by_key[friendly_key] = slot
+        return slot
+
+
+class TelemetrySnapshot(Mapping[str, Any]):
+    """Decoded telemetry of one ping, read like a dict of friendly keys.
+
+    Values sit in a flat list indexed by the layout's slots (None where
+    the ping returned nothing) and update times in an array of epoch
+    milliseconds, so a snapshot costs two arrays rather than a dict entry
+    plus a nested dict per alias.
+    """
+
+    __slots__ = ("_layout", "_values", "_updated", "_count")
+
+    def __init__(
+        self, layout: TelemetryLayout, values: list[Any], updated: array, count: int
+    ) -> None:
+        """Initialize a snapshot over decoded slot arrays."""
+        self._layout = layout
+        self._values = values
+        self._updated = updated
+        self._count = count
+
+    def _slot(self, key: str) -> int | None:
+        """Return the slot holding a value for key, if there is one."""
+        slot = self._layout.slot_by_key.get(key)
+        if slot is None or slot >= len(self._values) or self._values[slot] is None:
+            return None
+        return slot
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value for a friendly key."""
+        slot = self._slot(key)
+        if slot is None:
+            raise KeyError(key)
+        return self._values[slot]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for a friendly key, or default."""
+        slot = self._layout.slot_by_key.get(key)
+        if slot is None:
+            return default
+        try:
+            value = self._values[slot]
+        except IndexError:  # Slot added to the layout after this snapshot
+            return default
+        return default if value is None else value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the friendly keys that have a value."""
+        keys = self._layout.keys
+        return (keys[slot] for slot, value in enumerate(self._values) if value is not None)
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return self._count
+
+    def updated_at(self, key: str) -> int | None:
+        """Return when the car last reported key, in epoch milliseconds."""
+        slot = self._slot(key)
+        if slot is None or not self._updated[slot]:
+            return None
+        return self._updated[slot]
+
+    def reported_at(self) -> int | None:
+        """Return the newest lastUpdateTime in the snapshot, in epoch milliseconds.
+
+        On a ping as received this is when the car last uploaded. A merged
+        snapshot also carries the receive time of values without one.
+        """
+        newest = max(self._updated, default=0)
+        return newest or None
+
+    def merged_with(
+        self, previous: TelemetrySnapshot | None, received_ms: int
+    ) -> TelemetrySnapshot:
+        """Return this snapshot with the last known values filled in from previous.
+
+        Aliases this ping didn't return keep their previous value and update
+        time, as do values the car reported more recently than this ping's.
+        Values without a lastUpdateTime are stamped with received_ms, so
+        every value has an age.
+        """
+        layout = self._layout
+        values = list(self._values)
+        updated = array("q", self._updated)
+        for slot, value in enumerate(values):
+            if value is not None and not updated[slot]:
+                updated[slot] = received_ms
+
+        if previous is not None:
+            old_layout = previous._layout
+            same_layout = old_layout is layout
+            for old_slot, old_value in enumerate(previous._values):
+                if old_value is None:
+                    continue
+                slot = old_slot if same_layout else layout.add(
+                    old_layout.aliases[old_slot],
+                    old_layout.keys[old_slot],
+                    old_layout.paths[old_slot],
+                )
+                if slot >= len(values):
+                    grow = slot + 1 - len(values)
+                    values.extend([None] * grow)
+                    updated.extend([0] * grow)
+                old_updated = previous._updated[old_slot]
+                if values[slot] is None or updated[slot] < old_updated:
+                    values[slot] = old_value
+                    updated[slot] = old_updated
+
+        count = sum(value is not None for value in values)
+        return TelemetrySnapshot(layout, values, updated, count)
+
+    def updated_before(self, cutoff_ms: int) -> set[str]:
+        """Return the friendly keys whose value was reported before cutoff_ms."""
+        keys, updated = self._layout.keys, self._updated
+        return {
+            keys[slot]
+            for slot, value in enumerate(self._values)
+            if value is not None and updated[slot] < cutoff_ms
+        }
+
+    def changed_keys(self, previous: TelemetrySnapshot) -> set[str]:
+        """Return the friendly keys whose value differs from a previous snapshot.
+
+        A value the car reported with the same lastUpdateTime in both pings
+        is unchanged without comparing it; values without one are compared.
+        """
+        if previous._layout is not self._layout:
+            return {
+                key for key in {*self, *previous} if self.get(key) != previous.get(key)
+            }
+        keys = self._layout.keys
+        values, updated = self._values, self._updated
+        old_values, old_updated = previous._values, previous._updated
+        changed = set()
+        for slot in range(max(len(values), len(old_values))):
+            value = values[slot] if slot < len(values) else None
+            if slot >= len(old_values):
+                if value is not None:
+                    changed.add(keys[slot])
+                continue
+            if value is not None and updated[slot] and updated[slot] == old_updated[slot]:
+                continue
+            if value != old_values[slot]:
+                changed.add(keys[slot])
+        return changed
+
+    def raw_aliases(self) -> dict[str, dict[str, Any]]:
+        """Return the values by alias with their resource path and update time."""
+        layout = self._layout
+        return {
+            layout.aliases[slot]: {
+                "value": value,
+                "path": layout.paths[slot],
+                "last_update": self._updated[slot] or None,
+            }
+            for slot, value in enumerate(self._values)
+            if value is not None
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict copy, with values by alias under "_raw_aliases"."""
+        return {**self, "_raw_aliases": self.raw_aliases()}
+
+
+def format_device_key(object_id: str, instance_id: str, resource_id: str) -> str:
+    """Build a ping deviceKey: {objectId}_{instanceId:05d}_{resourceId:05d}."""
+    return f"{int(object_id)}_{int(instance_id):05d}_{int(resource_id):05d}"
+
+
+def device_key_to_path(device_key: str) -> str:
+    """Convert a ping deviceKey (34183_00001_00003) to a resource path (/34183/1/3)."""
+    parts = device_key.split("_")
+    if len(parts) != 3:
+        return device_key
+    try:
+        return f"/{int(parts[0])}/{int(parts[1])}/{int(parts[2])}"
+    except ValueError:
+        return device_key
+
+
+class TelemetryRequestPlan:
+    """A precompiled telemetry ping request.
+
+    Built once per alias catalogue and resource selection, it holds the
+    serialized request body and the lookup tables used to resolve each
+    returned deviceKey to its alias and friendly key.
+    """
+
+    __slots__ = ("body", "by_device_key", "by_path", "layout", "size", "uses_aliases")
+
+    def __init__(
+        self,
+        resources: Iterable[tuple[str | None, str, str, str, str | None]],
+    ) -> None:
+        """Compile a plan from (alias, objectId, instanceId, resourceId, type) tuples.
+
+        A resource without an alias (static fallback paths) is reported
+        under its resource path.
+        """
+        request_objects: list[dict[str, str]] = []
+        self.by_device_key: dict[str, PlanEntry] = {}
+        self.by_path: dict[str, PlanEntry] = {}
+        self.layout = TelemetryLayout()
+        self.uses_aliases = False
+
+        for alias, obj_id, inst_id, rsrc_id, resource_type in resources:
+            path = f"/{obj_id}/{inst_id}/{rsrc_id}"
+            request_objects.append({
+                "objectId": obj_id,
+                "instanceId": inst_id,
+                "resourceId": rsrc_id,
+            })
+            if alias:
+                self.uses_aliases = True
+            name = alias or path
+            friendly_key = ALIAS_TO_KEY.get(name, name.lower())
+            entry = PlanEntry(
+                name,
+                friendly_key,
+                path,
+                decoder_for_type(resource_type),
+                self.layout.add(name, friendly_key, path),
+            )
+            self.by_path[path] = entry
+            try:
+                self.by_device_key[format_device_key(obj_id, inst_id, rsrc_id)] = entry
+            except ValueError:
+                pass  # Non-numeric ids are still resolvable through by_path
+
+        self.size = len(request_objects)
+        self.body = json.dumps(request_objects, separators=(",", ":")).encode()
+
+    def resolve(self, device_key: str) -> PlanEntry | None:
+        """Resolve a returned deviceKey, learning unfamiliar key spellings."""
+        entry = self.by_device_key.get(device_key)
+        if entry is None:
+            entry = self.by_path.get(device_key_to_path(device_key))
+            if entry is not None:
+                self.by_device_key[device_key] = entry
+        return entry
+
+
+def decode_ping_response(
+    raw_data: list[Any], plan: TelemetryRequestPlan | None
+) -> tuple[TelemetrySnapshot, bool]:
+    """Decode ping items into a telemetry snapshot.
+
+    Returns the snapshot and whether any item carried a key the plan's
+    alias catalogue could not resolve.
+    """
+    layout = plan.layout if plan else TelemetryLayout()
+    values: list[Any] = [None] * layout.size
+    updated = array("q", bytes(8 * layout.size))
+    count = 0
+    unresolved = False
+
+    by_device_key = plan.by_device_key if plan else {}
+    resolve = plan.resolve if plan else None
+    uses_aliases = plan.uses_aliases if plan else False
+
+    for item in raw_data:
+        if not isinstance(item, dict):
+            continue
+
+        value = item.get("value")
+        if value is None:
+            continue
+        device_key = item.get("deviceKey")
+        if not device_key:
+            continue
+
+        entry = by_device_key.get(device_key)
+        if entry is None and resolve is not None:
+            entry = resolve(device_key)
+
+        if entry is not None:
+            slot = entry.slot
+            parsed_value = entry.decode(value)
+        else:
+            path = device_key_to_path(device_key)
+            slot = layout.add(path, path.lower(), path)
+            parsed_value = _decode_number(value)
+            unresolved = unresolved or uses_aliases
+            if slot >= len(values):
+                grow = layout.size - len(values)
+                values.extend([None] * grow)
+                updated.extend(array("q", bytes(8 * grow)))
+
+        if values[slot] is None:
+            count += 1
+        values[slot] = parsed_value
+        updated[slot] = _epoch_ms(item.get("lastUpdateTime"))
+
+    return TelemetrySnapshot(layout, values, updated, count), unresolved
+
+
+# A path that returned nothing in this many pings is dropped from the request
+YIELD_MIN_SAMPLES = 5
+# Dropped paths are re-probed on every Nth ping in case the vehicle starts reporting them
+YIELD_REPROBE_INTERVAL = 50
+
+
+class AliasYieldTracker:
+    """Learns which requested resource paths ever return a value.
+
+    Tracked per vehicle model, since which resources a car reports depends
+    on its model rather than on the individual vehicle.
+    """
+
+    __slots__ = ("_stats", "polls")
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Initialize the tracker, optionally from exported data."""
+        data = data or {}
+        self.polls: int = data.get("polls", 0)
+        # path -> [times requested, times returned]
+        self._stats: dict[str, list[int]] = {
+            path: list(counts) for path, counts in data.get("paths", {}).items()
+        }
+
+    @property
+    def reprobe_due(self) -> bool:
+        """Return True if the next ping should include dropped paths again."""
+        return self.polls % YIELD_REPROBE_INTERVAL == 0
+
+    def is_dead(self, path: str) -> bool:
+        """Return True if a path has never returned a value."""
+        counts = self._stats.get(path)
+        return counts is not None and counts[1] == 0 and counts[0] >= YIELD_MIN_SAMPLES
+
+    def dead_paths(self) -> frozenset[str]:
+        """Return all paths currently dropped from requests."""
+        return frozenset(path for path in self._stats if self.is_dead(path))
+
+    def record(self, requested: Iterable[str], returned: Iterable[str]) -> bool:
+        """Record one ping. Returns True if the set of dead paths changed."""
+        before = self.dead_paths()
+        returned = set(returned)
+        for path in requested:
+            counts = self._stats.setdefault(path, [0, 0])
+            counts[0] += 1
+            if path in returned:
+                counts[1] += 1
+        self.polls += 1
+        return self.dead_paths() != before
+
+    def export(self) -> dict[str, Any]:
+        """Export the learned profile for persistent storage."""
+        return {"polls": self.polls, "paths": self._stats}
+
+
+class AliasCatalogue:
+    """A vehicle model's alias catalogue and how fresh it is.
+
+    Kept per vehicle model, since the resource paths behind the aliases
+    depend on the model.
+    """
+
+    __slots__ = ("attempted_at", "fetched_at", "mappings", "miss", "version")
+
+    def __init__(self) -> None:
+        """Initialize an empty catalogue."""
+        self.mappings: dict[str, dict[str, str]] = {}  # alias -> {path, objectId, etc}
+        self.version: str | None = None
+        self.fetched_at: float | None = None  # epoch, survives restarts
+        self.miss: bool = False  # ping returned keys outside the catalogue
+        self.attempted_at: float = 0.0  # last forced re-fetch (monotonic)
+
+    def load(self, mappings: dict[str, dict[str, str]], version: str, fetched_at: float) -> None:
+        """Replace the catalogue with a fetched or persisted one."""
+        self.mappings = mappings
+        self.version = version
+        self.fetched_at = fetched_at
+        self.miss = False
@@ -0,0 +1,226 @@
+"""Derived per-vehicle view of the coordinator data.
+
+The raw poll result holds API strings in API units (km, kPa, Celsius) and
+enum codes. Entities used to convert these every time Home Assistant read a
+state. VehicleView does the conversions once per coordinator update, and
+entities read its precomputed fields.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+from .telemetry import TelemetrySnapshot
+
+# Unit conversion constants
+KM_TO_MILES = 0.621371
+KPA_TO_PSI = 0.145038
+
+# From GearStatus.java in VinFast APK
+GEAR_POSITIONS = {0: "OFF", 1: "P", 2: "R", 3: "N", 4: "D"}
+
+CHARGING_STATUSES = {
+    0: "Not Charging",
+    1: "Charging",
+    2: "Complete",
+    3: "Scheduled",
+    4: "Error",
+}
+
+DOOR_KEYS = ("door_fl", "door_fr", "door_rl", "door_rr")
+TIRE_KEYS = ("tire_pressure_fl", "tire_pressure_fr", "tire_pressure_rl", "tire_pressure_rr")
+
+
+def vehicle_device_info(vin: str, vehicle: dict[str, Any]) -> DeviceInfo:
+    """Return device information for a vehicle from its vehicle info."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, vin)},
+        name=vehicle.get("customizedVehicleName", vehicle.get("vehicleName", "VinFast")),
+        manufacturer="VinFast",
+        model=f"{vehicle.get('vehicleType', '')} {vehicle.get('vehicleVariant', '')}".strip(),
+        sw_version=str(vehicle.get("yearOfProduct", "")),
+    )
+
+
+def _as_float(value: Any) -> float | None:
+    """Parse a telemetry value as a float, or None."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _as_int(value: Any) -> int | None:
+    """Parse a telemetry value as an integer code, or None."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _scaled(value: Any, factor: float) -> float | None:
+    """Convert a telemetry value by a unit factor, rounded for display."""
+    number = _as_float(value)
+    if number is None:
+        return None
+    return round(number * factor, 1)
+
+
+def _is_one(value: Any) -> bool | None:
+    """Decode a 0/1 status code (1 = on/open)."""
+    code = _as_int(value)
+    if code is None:
+        return None
+    return code == 1
+
+
+def _decode(value: Any, table: dict[int, str], unknown: str) -> str | None:
+    """Decode an enum code to text, keeping unparsable values as they are."""
+    if value is None:
+        return None
+    try:
+        return table.get(int(value), unknown.format(value))
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _missing(key: str) -> None:
+    """Telemetry lookup for a vehicle without telemetry."""
+    return None
+
+
+def _fahrenheit(value: Any) -> float | None:
+    """Convert a Celsius telemetry value to Fahrenheit."""
+    celsius = _as_float(value)
+    if celsius is None:
+        return None
+    return round((celsius * 9 / 5) + 32, 1)
+
+
+def _any_open(get: Callable[[str], Any], keys: tuple[str, ...]) -> bool | None:
+    """Return True if any door is open, False if all reported closed, else None."""
+    any_found = False
+    for key in keys:
+        value = get(key)
+        if value is not None:
+            any_found = True
+            if _as_int(value) == 1:
+                return True
+    return False if any_found else None
+
+
+class VehicleView:
+    """Converted values, decoded enums and device info for one vehicle."""
+
+    __slots__ = (
+        "vin",
+        "has_telemetry",
+        "expired",
+        "device_info",
+        # Vehicle info
+        "vehicle_name",
+        "model",
+        "year",
+        "color",
+        "vin_code",
+        # Telemetry, converted to display units
+        "odometer_miles",
+        "range_miles",
+        "speed_mph",
+        "outside_temp_f",
+        "inside_temp_f",
+        "tire_pressure_psi",
+        "battery_level",
+        "lv_battery_level",
+        "time_to_full",
+        "charge_limit",
+        "latitude",
+        "longitude",
+        # Decoded enums
+        "gear",
+        "charging_status",
+        "unlocked",
+        "ignition_on",
+        "charging",
+        "plugged_in",
+        "trunk_open",
+        "hood_open",
+        "door_open",
+        "any_door_open",
+        "any_window_open",
+        "climate_on",
+    )
+
+    def __init__(
+        self,
+        vin: str,
+        vehicle: dict[str, Any],
+        telemetry: TelemetrySnapshot | None,
+        expired: frozenset[str] = frozenset(),
+    ) -> None:
+        """Derive every entity value from one vehicle's poll result.
+
+        expired holds the telemetry keys whose last known value is too old
+        to show.
+        """
+        self.vin = vin
+        self.has_telemetry = telemetry is not None
+        self.expired = expired
+        self.device_info = vehicle_device_info(vin, vehicle)
+
+        self.vehicle_name = vehicle.get("customizedVehicleName") or vehicle.get("vehicleName")
+        self.model = f"{vehicle.get('vehicleType')} {vehicle.get('vehicleVariant')}".strip()
+        self.year = vehicle.get("yearOfProduct")
+        self.color = vehicle.get("exteriorColor")
+        self.vin_code = vehicle.get("vinCode")
+
+        get = telemetry.get if telemetry is not None else _missing
+
+        # Real-time odometer from telemetry; the vehicle-info one may be stale
+        odometer_km = _as_float(get("odometer"))
+        if odometer_km is None or odometer_km <= 0:
+            odometer_km = _as_float(vehicle.get("odometer"))
+        self.odometer_miles = (
+            round(odometer_km * KM_TO_MILES, 1) if odometer_km is not None else None
+        )
+        self.range_miles = _scaled(get("range"), KM_TO_MILES)
+        self.speed_mph = _scaled(get("speed"), KM_TO_MILES)
+        self.outside_temp_f = _fahrenheit(get("outside_temp"))
+        self.inside_temp_f = _fahrenheit(get("inside_temp"))
+        self.tire_pressure_psi = {key: _scaled(get(key), KPA_TO_PSI) for key in TIRE_KEYS}
+        self.battery_level = get("battery_level")
+        self.lv_battery_level = get("lv_battery_level")
+        self.time_to_full = get("time_to_full")
+        self.charge_limit = get("charge_limit")
+        self.latitude = _as_float(get("latitude"))
+        self.longitude = _as_float(get("longitude"))
+
+        charging_code = get("charging_status")
+        self.gear = _decode(get("gear"), GEAR_POSITIONS, "{}")
+        self.charging_status = _decode(charging_code, CHARGING_STATUSES, "Unknown ({})")
+        # VinFast: 0=unlocked, 1=locked (from DoorsInfo.java). The LOCK device
+        # class is on when unlocked, so the binary sensor reads `unlocked`.
+        locked = _as_int(get("locked"))
+        self.unlocked = locked == 0 if locked is not None else None
+        self.ignition_on = _is_one(get("ignition"))
+        self.charging = _is_one(charging_code)
+        # Dedicated charge port status, else plugged in if charging status is not 0
+        self.plugged_in = _is_one(get("plugged_in"))
+        if self.plugged_in is None and (code := _as_int(charging_code)) is not None:
+            self.plugged_in = code > 0
+        self.trunk_open = _is_one(get("trunk_status"))
+        self.hood_open = _is_one(get("hood_status"))
+        self.door_open = {key: _is_one(get(key)) for key in DOOR_KEYS}
+        self.any_door_open = _any_open(get, DOOR_KEYS)
+        window = _as_int(get("window_status"))
+        # If non-zero, at least one window is open
+        self.any_window_open = window != 0 if window is not None else None
+        self.climate_on = _is_one(get("climate_on") or get("ac_status"))
+
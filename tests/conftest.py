@@ -0,0 +1,6 @@
+"""Shared test setup for the VinFast integration."""
+import pathlib
+import sys
+
+# Import the integration from this checkout, as the benchmarks do
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
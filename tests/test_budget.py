@@ -0,0 +1,101 @@
+"""Tests for the daily request budget."""
+import pytest
+
+from custom_components.vinfast.budget import RequestBudget
+
+PING = "https://example.com/ccaraccessmgmt/api/v1/telemetry/app/ping"
+TOKEN = "https://example.com/oauth/token"
+
+
+@pytest.fixture(autouse=True)
+def _noon(freezer):
+    """Start every test at local noon (UTC in tests)."""
+    freezer.move_to("2024-03-01 12:00:00")
+
+
+def test_counts_per_endpoint():
+    budget = RequestBudget(100)
+    budget.record(PING)
+    budget.record(PING + "?x=1")
+    budget.record(TOKEN)
+
+    assert budget.used == 3
+    assert budget.remaining == 97
+    assert budget.by_endpoint == {
+        "/ccaraccessmgmt/api/v1/telemetry/app/ping": 2,
+        "/oauth/token": 1,
+    }
+
+
+def test_day_rollover(freezer):
+    budget = RequestBudget(100)
+    budget.record(PING)
+
+    freezer.move_to("2024-03-01 23:59:59")
+    assert budget.used == 1
+    freezer.move_to("2024-03-02 00:00:01")
+    assert budget.used == 0
+    assert budget.remaining == 100
+    assert budget.export() == {"day": "2024-03-02", "counts": {}}
+
+
+def test_allows():
+    budget = RequestBudget(3)
+    budget.record(PING)
+    budget.record(PING)
+
+    assert budget.allows(1)
+    assert not budget.allows(2)
+    budget.record(PING)
+    budget.record(PING)
+    assert budget.remaining == 0
+
+
+def test_unlimited():
+    budget = RequestBudget(0)
+    budget.record(PING)
+
+    assert budget.used == 1
+    assert budget.remaining is None
+    assert budget.allows(1000)
+    assert budget.paced_interval(1) is None
+
+
+def test_paced_interval_spreads_remaining_polls():
+    budget = RequestBudget(100)
+    for _ in range(4):
+        budget.record(PING)
+
+    # 12 hours left for 96 requests, 2 per poll: 48 polls
+    assert budget.paced_interval(2) == 43200 / 48
+
+
+def test_paced_interval_waits_for_midnight_when_used_up():
+    budget = RequestBudget(1)
+    budget.record(PING)
+
+    assert budget.paced_interval(1) == 43200
+    assert budget.paced_interval(5) == 43200
+
+
+def test_load_restores_today_only():
+    budget = RequestBudget(100)
+    budget.load({"day": "2024-03-01", "counts": {"/oauth/token": 2}})
+    assert budget.used == 2
+
+    budget.load({"day": "2024-02-29", "counts": {"/oauth/token": 50}})
+    assert budget.used == 2
+
+    fresh = RequestBudget(100)
+    fresh.load({})
+    fresh.load({"day": "not a date"})
+    assert fresh.used == 0
+
+
+def test_export_round_trip():
+    budget = RequestBudget(100)
+    budget.record(PING)
+
+    restored = RequestBudget(100)
+    restored.load(budget.export())
+    assert restored.by_endpoint == budget.by_endpoint
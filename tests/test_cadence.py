@@ -0,0 +1,97 @@
+"""Tests for upload cadence learning and poll alignment."""
+from custom_components.vinfast.cadence import (
+    CADENCE_SAMPLES,
+    MAX_BACKOFF_FACTOR,
+    MIN_POLL_DELAY,
+    UPLOAD_MARGIN,
+    UploadCadence,
+)
+
+T0 = 1_700_000_000_000
+
+
+def _learned(state, gap, uploads=4):
+    """Return a cadence that saw uploads every gap seconds in state."""
+    cadence = UploadCadence()
+    for k in range(uploads):
+        cadence.record(T0 + k * gap * 1000, state)
+    return cadence
+
+
+def test_learns_median_gap_per_state():
+    cadence = _learned("driving", 60)
+    cadence.record(T0 + 180_000 + 900_000, "parked")
+
+    assert cadence.cadence("driving") == 60
+    assert cadence.cadence("parked") == 900
+    assert cadence.cadence("charging") is None
+    assert cadence.last_upload == T0 + 1_080_000
+
+
+def test_keeps_the_latest_samples():
+    cadence = UploadCadence()
+    upload = T0
+    for _ in range(CADENCE_SAMPLES + 1):
+        upload += 10_000
+        cadence.record(upload, "driving")
+    for _ in range(CADENCE_SAMPLES):
+        upload += 60_000
+        cadence.record(upload, "driving")
+
+    assert cadence.cadence("driving") == 60
+
+
+def test_poll_aligned_after_last_upload_in_interval():
+    cadence = _learned("driving", 60)
+    last = cadence.last_upload
+
+    # Uploads due at +60 ... +300; the last that fits is +240
+    assert cadence.next_poll_delay("driving", 300, 9000, last + 10_000) == (
+        240 + UPLOAD_MARGIN - 10
+    )
+
+
+def test_poll_waits_for_upload_beyond_interval():
+    cadence = _learned("parked", 1800, uploads=2)
+    last = cadence.last_upload
+
+    assert cadence.next_poll_delay("parked", 900, 9000, last + 5_000) == (
+        1800 + UPLOAD_MARGIN - 5
+    )
+    assert cadence.next_poll_delay("parked", 900, 1000, last + 5_000) == 1000
+
+
+def test_unknown_cadence_uses_interval():
+    cadence = _learned("driving", 60)
+
+    assert cadence.next_poll_delay("charging", 300, 9000, cadence.last_upload) == 300
+
+
+def test_unchanged_polls_back_off():
+    cadence = _learned("driving", 60)
+    last = cadence.last_upload
+
+    cadence.record(last, "driving")
+    assert cadence.unchanged_polls == 1
+    assert cadence.next_poll_delay("charging", 300, 9000, last) == 600
+
+    for _ in range(5):
+        cadence.record(last - 1000, "driving")
+    assert cadence.next_poll_delay("charging", 300, 9000, last) == 300 * MAX_BACKOFF_FACTOR
+
+    cadence.record(last + 60_000, "driving")
+    assert cadence.unchanged_polls == 0
+
+
+def test_delay_floor():
+    cadence = UploadCadence()
+
+    assert cadence.next_poll_delay("driving", 10, 5, T0) == MIN_POLL_DELAY
+
+
+def test_ignores_missing_upload_time():
+    cadence = _learned("driving", 60)
+    cadence.record(None, "driving")
+
+    assert cadence.unchanged_polls == 0
+    assert cadence.as_dict() == {"cadence": {"driving": 60}, "unchanged_polls": 0}
@@ -0,0 +1,70 @@
+"""Tests for the polling circuit breaker."""
+from custom_components.vinfast.circuit import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+def _open_breaker():
+    """Return a breaker tripped by three failures."""
+    breaker = CircuitBreaker(failure_threshold=3, base_delay=60, max_delay=3600)
+    for _ in range(3):
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_at_failure_threshold(freezer):
+    breaker = CircuitBreaker(failure_threshold=3, base_delay=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request()
+    assert breaker.retry_in == 0
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request()
+    assert breaker.failures == 3
+    # Equal jitter keeps between half and all of the backoff
+    assert 30 <= breaker.retry_in <= 60
+
+
+def test_half_open_after_backoff(freezer):
+    breaker = _open_breaker()
+    freezer.tick(60)
+
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.allow_request()
+    assert breaker.retry_in == 0
+
+
+def test_failed_probe_reopens_with_longer_backoff(freezer):
+    breaker = _open_breaker()
+    freezer.tick(60)
+    breaker.record_failure()
+
+    assert breaker.state == STATE_OPEN
+    assert 60 <= breaker.retry_in <= 120
+
+
+def test_backoff_is_capped(freezer):
+    breaker = CircuitBreaker(failure_threshold=1, base_delay=60, max_delay=100)
+    for _ in range(10):
+        breaker.record_failure()
+        assert breaker.retry_in <= 100
+        freezer.tick(100)
+
+
+def test_success_closes(freezer):
+    breaker = _open_breaker()
+    freezer.tick(60)
+    breaker.record_success()
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+    # The backoff starts over from the base delay
+    for _ in range(3):
+        breaker.record_failure()
+    assert 30 <= breaker.retry_in <= 60
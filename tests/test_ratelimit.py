@@ -0,0 +1,95 @@
+"""Tests for the per-host token bucket."""
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from custom_components.vinfast.ratelimit import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RATE_LIMIT_MAX_WAIT,
+    HostRateLimiter,
+    limiter_for,
+    parse_retry_after,
+)
+
+
+def test_bucket_refills_at_rate(freezer):
+    limiter = HostRateLimiter(rate=1.0, burst=2)
+    assert limiter._take()
+    assert limiter._take()
+    assert not limiter._take()
+
+    freezer.tick(0.5)
+    assert not limiter._take()
+    freezer.tick(0.5)
+    assert limiter._take()
+
+
+def test_bucket_refill_is_capped_at_burst(freezer):
+    limiter = HostRateLimiter(rate=1.0, burst=2)
+    freezer.tick(60)
+
+    assert limiter._take()
+    assert limiter._take()
+    assert not limiter._take()
+
+
+def test_defer_blocks_the_host(freezer):
+    limiter = HostRateLimiter(rate=1.0, burst=2)
+    limiter.defer(10)
+
+    assert limiter.blocked_for == 10
+    assert not limiter._take()
+    freezer.tick(9)
+    assert limiter.blocked_for == 1
+    assert not limiter._take()
+
+
+def test_defer_refills_from_empty_once_the_block_ends(freezer):
+    limiter = HostRateLimiter(rate=1.0, burst=2)
+    limiter.defer(10)
+
+    freezer.tick(10)
+    assert limiter.blocked_for == 0
+    assert not limiter._take()
+    freezer.tick(1)
+    assert limiter._take()
+    assert not limiter._take()
+
+
+def test_defer_keeps_the_longer_block():
+    limiter = HostRateLimiter()
+    limiter.defer(20)
+    limiter.defer(5)
+
+    assert limiter.blocked_for > 15
+
+
+def test_too_long_to_wait():
+    limiter = HostRateLimiter()
+    assert not limiter.too_long_to_wait(PRIORITY_POLL)
+    assert not limiter.too_long_to_wait(PRIORITY_COMMAND)
+
+    limiter.defer(RATE_LIMIT_MAX_WAIT / 2)
+    assert limiter.too_long_to_wait(PRIORITY_POLL)
+    assert not limiter.too_long_to_wait(PRIORITY_COMMAND)
+
+    limiter.defer(RATE_LIMIT_MAX_WAIT * 2)
+    assert limiter.too_long_to_wait(PRIORITY_COMMAND)
+
+
+def test_limiter_is_shared_per_host():
+    limiter = limiter_for("https://example.com/a")
+
+    assert limiter_for("https://example.com/b?x=1") is limiter
+    assert limiter_for("https://other.example.com/a") is not limiter
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("-5") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert 55 <= parse_retry_after(date) <= 60
@@ -0,0 +1,146 @@
+"""Tests for telemetry snapshots and alias yield tracking."""
+from custom_components.vinfast.telemetry import (
+    YIELD_MIN_SAMPLES,
+    YIELD_REPROBE_INTERVAL,
+    AliasYieldTracker,
+    TelemetryRequestPlan,
+    decode_ping_response,
+)
+
+RESOURCES = [
+    ("VEHICLE_STATUS_HV_BATTERY_SOC", "34183", "1", "9", "Float"),
+    ("CHARGING_STATUS_CHARGING_STATUS", "34183", "1", "10", "Integer"),
+]
+
+
+def _item(resource_id, value, updated=None):
+    """Build a ping item for a resource of object 34183 instance 1."""
+    item = {"deviceKey": f"34183_00001_{resource_id:05d}", "value": value}
+    if updated is not None:
+        item["lastUpdateTime"] = updated
+    return item
+
+
+def _snapshot(plan, *items):
+    """Decode ping items with a plan."""
+    snapshot, unresolved = decode_ping_response(list(items), plan)
+    assert not unresolved
+    return snapshot
+
+
+def test_merge_keeps_values_the_ping_did_not_return():
+    plan = TelemetryRequestPlan(RESOURCES)
+    previous = _snapshot(plan, _item(9, "80", 1000), _item(10, "1", 1000))
+    merged = _snapshot(plan, _item(9, "75", 2000)).merged_with(previous, 5000)
+
+    assert dict(merged) == {"battery_level": 75.0, "charging_status": 1.0}
+    assert merged.updated_at("battery_level") == 2000
+    assert merged.updated_at("charging_status") == 1000
+    assert merged.reported_at() == 2000
+
+
+def test_merge_stamps_values_without_update_time():
+    plan = TelemetryRequestPlan(RESOURCES)
+    merged = _snapshot(plan, _item(9, "80")).merged_with(None, 5000)
+
+    assert merged.updated_at("battery_level") == 5000
+
+
+def test_merge_keeps_newer_previous_values():
+    plan = TelemetryRequestPlan(RESOURCES)
+    previous = _snapshot(plan, _item(9, "80", 2000)).merged_with(None, 2500)
+    merged = _snapshot(plan, _item(9, "60", 1000)).merged_with(previous, 3000)
+
+    assert merged["battery_level"] == 80.0
+    assert merged.updated_at("battery_level") == 2000
+
+
+def test_merge_across_plans():
+    full, partial = TelemetryRequestPlan(RESOURCES), TelemetryRequestPlan(RESOURCES[:1])
+    previous = _snapshot(full, _item(9, "80", 1000), _item(10, "1", 1000))
+    merged = _snapshot(partial, _item(9, "70", 2000)).merged_with(previous, 3000)
+
+    assert dict(merged) == {"battery_level": 70.0, "charging_status": 1.0}
+    assert merged.updated_at("charging_status") == 1000
+
+
+def test_updated_before():
+    plan = TelemetryRequestPlan(RESOURCES)
+    snapshot = _snapshot(plan, _item(9, "80", 1000), _item(10, "1", 3000))
+
+    assert snapshot.updated_before(2000) == {"battery_level"}
+    assert snapshot.updated_before(1000) == set()
+    assert snapshot.updated_before(4000) == {"battery_level", "charging_status"}
+
+
+def test_changed_keys():
+    plan = TelemetryRequestPlan(RESOURCES)
+    previous = _snapshot(plan, _item(9, "80", 1000), _item(10, "1", 1000))
+
+    same = _snapshot(plan, _item(9, "80", 1000), _item(10, "1", 1000))
+    assert same.changed_keys(previous) == set()
+
+    changed = _snapshot(plan, _item(9, "79", 2000), _item(10, "1", 2000))
+    assert changed.changed_keys(previous) == {"battery_level"}
+
+    gone = _snapshot(plan, _item(9, "80", 1000))
+    assert gone.changed_keys(previous) == {"charging_status"}
+
+
+def test_changed_keys_compares_values_without_update_time():
+    plan = TelemetryRequestPlan(RESOURCES)
+    previous = _snapshot(plan, _item(9, "80"))
+
+    assert _snapshot(plan, _item(9, "80")).changed_keys(previous) == set()
+    assert _snapshot(plan, _item(9, "81")).changed_keys(previous) == {"battery_level"}
+
+
+def test_changed_keys_across_plans():
+    full, partial = TelemetryRequestPlan(RESOURCES), TelemetryRequestPlan(RESOURCES[:1])
+    previous = _snapshot(full, _item(9, "80", 1000), _item(10, "1", 1000))
+    current = _snapshot(partial, _item(9, "80", 1000))
+
+    assert current.changed_keys(previous) == {"charging_status"}
+
+
+def test_yield_dead_path_threshold():
+    tracker = AliasYieldTracker()
+    for _ in range(YIELD_MIN_SAMPLES - 1):
+        assert not tracker.record(["/1/0/0", "/1/0/1"], ["/1/0/0"])
+    assert not tracker.is_dead("/1/0/1")
+
+    assert tracker.record(["/1/0/0", "/1/0/1"], ["/1/0/0"])
+    assert tracker.is_dead("/1/0/1")
+    assert tracker.dead_paths() == frozenset({"/1/0/1"})
+
+
+def test_yield_path_that_returned_once_stays_alive():
+    tracker = AliasYieldTracker()
+    tracker.record(["/1/0/1"], ["/1/0/1"])
+    for _ in range(YIELD_MIN_SAMPLES * 2):
+        tracker.record(["/1/0/1"], [])
+
+    assert not tracker.is_dead("/1/0/1")
+
+
+def test_yield_reprobe_interval():
+    tracker = AliasYieldTracker()
+    assert tracker.reprobe_due
+    tracker.record(["/1/0/1"], [])
+    for _ in range(YIELD_REPROBE_INTERVAL - 2):
+        tracker.record([], [])
+        assert not tracker.reprobe_due
+
+    tracker.record([], [])
+    assert tracker.polls == YIELD_REPROBE_INTERVAL
+    assert tracker.reprobe_due
+
+
+def test_yield_export_round_trip():
+    tracker = AliasYieldTracker()
+    for _ in range(YIELD_MIN_SAMPLES):
+        tracker.record(["/1/0/0", "/1/0/1"], ["/1/0/0"])
+
+    restored = AliasYieldTracker(tracker.export())
+    assert restored.polls == YIELD_MIN_SAMPLES
+    assert restored.dead_paths() == frozenset({"/1/0/1"})
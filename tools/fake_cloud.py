@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the VinFast cloud.
+
+Serves Auth0 /oauth/token, the connected-car endpoints used by api.py
+(user-vehicle, profile, location-favorite, get-alias, telemetry ping) and
+the pairing/remote command endpoints used by pairing.py from fixture
+files, with configurable latency, errors, 401s and 429s.
+
+Clients are pointed at it through a session whose resolver sends every
+hostname to the stand-in (see stand_in_session), so the integration runs
+unmodified: URLs, per-host rate limiting and TLS all behave as they do
+against the real cloud. The server uses a throwaway self-signed
+certificate that the stand-in session does not verify.
+
+In record mode the server is a proxy instead: requests are forwarded to
+the real host, answered with the real response, and a sanitized copy of
+every response is written to the fixture directory for later replay.
+
+Usage:
+    python3 tools/fake_cloud.py [--port N] [--fixtures DIR] [--latency S] ...
+    python3 tools/fake_cloud.py --record DIR
+
+Needs aiohttp and cryptography (both installed with Home Assistant).
+"""
+
+import argparse
+import asyncio
+import base64
+from collections import Counter
+from dataclasses import asdict, dataclass, fields
+import datetime
+import json
+import pathlib
+import random
+import secrets
+import socket
+import ssl
+import sys
+import tempfile
+import time
+
+import aiohttp
+from aiohttp import web
+from aiohttp.abc import AbstractResolver
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from sanitize import Sanitizer  # noqa: E402
+
+DEFAULT_FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+# Request path -> endpoint name used for fixtures, faults and stats
+ENDPOINTS = {
+    "/oauth/token": "token",
+    "/ccarusermgnt/api/v1/user-vehicle": "vehicles",
+    "/ccarusermgnt/api/v1/auth0/account/profile": "profile",
+    "/ccarusermgnt/api/v1/location-favorite": "locations",
+    "/modelmgmt/api/v2/vehicle-model/mobile-app/vehicle/get-alias": "aliases",
+    "/ccaraccessmgmt/api/v1/telemetry/app/ping": "ping",
+    "/ccaraccessmgmt/api/v1/pairing/app/verify-session": "verify_session",
+    "/ccaraccessmgmt/api/v1/pairing/app/send-pair-data": "send_pair_data",
+    "/ccaraccessmgmt/api/v2/remote/app/command": "command",
+}
+
+# Endpoints served straight from their fixture file
+STATIC_ENDPOINTS = ("profile", "locations", "aliases")
+
+OK = 200000
+
+
+@dataclass
+class Fault:
+    """Misbehaviour injected into one endpoint (or all of them as "*")."""
+
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # up to this many extra seconds, uniformly random
+    error_rate: float = 0.0  # share of requests answered with error_status
+    error_status: int = 500
+    unauthorized_rate: float = 0.0  # share of authenticated requests answered 401
+    rate_limit_rate: float = 0.0  # share of requests answered 429
+    retry_after: int = 5  # Retry-After sent with a 429
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Fault":
+        """Build a fault from a JSON object, ignoring unknown fields."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def device_key(obj_id: int, inst_id: int, rsrc_id: int) -> str:
+    """Build a ping deviceKey the way the cloud formats it."""
+    return f"{obj_id}_{inst_id:05d}_{rsrc_id:05d}"
+
+
+def make_token(ttl: float) -> str:
+    """Return an unsigned JWT-shaped token expiring after ttl seconds."""
+    claims = {"exp": int(time.time() + ttl), "sub": "stand-in"}
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return f"eyJhbGciOiJub25lIn0.{payload}.{secrets.token_urlsafe(16)}"
+
+
+def _self_signed_context(directory: pathlib.Path) -> ssl.SSLContext:
+    """Create a server TLS context with a throwaway self-signed certificate."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "vinfast-stand-in")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=30))
+        .sign(key, hashes.SHA256())
+    )
+    cert_file = directory / "cert.pem"
+    key_file = directory / "key.pem"
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+class StandInResolver(AbstractResolver):
+    """Resolves every hostname to the stand-in server."""
+
+    def __init__(self, port: int, host: str = "127.0.0.1") -> None:
+        """Initialize the resolver for a stand-in listening on host:port."""
+        self._host = host
+        self._port = port
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> list:
+        """Return the stand-in's address whatever host was asked for."""
+        return [{
+            "hostname": host,
+            "host": self._host,
+            "port": self._port,
+            "family": socket.AF_INET,
+            "proto": 0,
+            "flags": socket.AI_NUMERICHOST,
+        }]
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+def stand_in_session(port: int, host: str = "127.0.0.1", **kwargs) -> aiohttp.ClientSession:
+    """Return a client session that talks to the stand-in instead of the internet."""
+    connector = aiohttp.TCPConnector(
+        resolver=StandInResolver(port, host), ssl=False, limit=0
+    )
+    return aiohttp.ClientSession(connector=connector, **kwargs)
+
+
+class FakeVinFastCloud:
+    """The stand-in server: fixture replay with fault injection, or a recording proxy."""
+
+    def __init__(
+        self,
+        fixtures: pathlib.Path | str | None = DEFAULT_FIXTURES,
+        faults: dict[str, Fault] | None = None,
+        token_ttl: float = 3600,
+        password: str | None = None,
+        seed: int | None = None,
+        record_to: pathlib.Path | str | None = None,
+    ) -> None:
+        """Initialize the server.
+
+        fixtures is a directory of <endpoint>.json files ({"status", "body"});
+        None starts with an empty account. faults maps endpoint names (or "*"
+        for all of them) to injected misbehaviour. password, when set, is the
+        only one the token endpoint accepts. record_to switches to proxy mode
+        and writes sanitized fixtures there.
+        """
+        self.faults: dict[str, Fault] = dict(faults or {})
+        self.token_ttl = token_ttl
+        self.password = password
+        self.requests: Counter[str] = Counter()
+        self.commands: list[dict] = []
+        self.port: int | None = None
+        self._random = random.Random(seed)
+        self._fixtures: dict[str, dict] = {}
+        self._vehicles: dict[str, dict] = {}
+        self._telemetry: dict[str, dict[tuple[int, int, int], dict]] = {}
+        self._default_telemetry: dict[tuple[int, int, int], dict] = {}
+        self._alias_paths: dict[str, tuple[int, int, int]] = {}
+        self._access_tokens: dict[str, float] = {}
+        self._refresh_tokens: set[str] = set()
+        self._record_to = pathlib.Path(record_to) if record_to else None
+        self._sanitizer = Sanitizer()
+        self._upstream: aiohttp.ClientSession | None = None
+        self._runner: web.AppRunner | None = None
+        self._tmp: tempfile.TemporaryDirectory | None = None
+
+        if fixtures is not None and self._record_to is None:
+            self.load_fixtures(fixtures)
+
+        self.app = web.Application(client_max_size=16 * 1024 * 1024)
+        for path in ENDPOINTS:
+            self.app.router.add_route("*", path, self._handle)
+        self.app.router.add_post("/_stand-in/faults", self._handle_set_faults)
+        self.app.router.add_post("/_stand-in/expire-tokens", self._handle_expire_tokens)
+        self.app.router.add_get("/_stand-in/stats", self._handle_stats)
+
+    # Fixtures and vehicle state
+
+    def load_fixtures(self, directory: pathlib.Path | str) -> None:
+        """Load <endpoint>.json and ping[.<VIN>].json files from a directory."""
+        for file in sorted(pathlib.Path(directory).glob("*.json")):
+            fixture = json.loads(file.read_text())
+            name, _, vin = file.stem.partition(".")
+            if name == "ping":
+                items = self._index_ping(fixture["body"].get("data") or [])
+                if vin:
+                    self._telemetry[vin] = items
+                else:
+                    self._default_telemetry = items
+                continue
+            self._fixtures[name] = fixture
+
+        for vehicle in self._fixtures.get("vehicles", {}).get("body", {}).get("data") or []:
+            self._vehicles[vehicle["vinCode"]] = vehicle
+        resources = self._fixtures.get("aliases", {}).get("body", {}).get("data", {})
+        for resource in resources.get("resources", []) if isinstance(resources, dict) else []:
+            self._alias_paths[resource["alias"]] = (
+                int(resource["devObjID"]),
+                int(resource["devObjInstID"]),
+                int(resource["devRsrcID"]),
+            )
+
+    @staticmethod
+    def _index_ping(items: list) -> dict[tuple[int, int, int], dict]:
+        """Index ping items by (objectId, instanceId, resourceId).
+
+        Update times are shifted so the newest is now, keeping their
+        relative ages. Otherwise fixture values would look days old to the
+        integration's telemetry age limit.
+        """
+        stamps = [
+            stamp for item in items if isinstance(stamp := item.get("lastUpdateTime"), int)
+        ]
+        shift = int(time.time() * 1000) - max(stamps) if stamps else 0
+        return {
+            (int(item["objectId"]), int(item["instanceId"]), int(item["resourceId"])): (
+                {**item, "lastUpdateTime": item["lastUpdateTime"] + shift}
+                if isinstance(item.get("lastUpdateTime"), int) else item
+            )
+            for item in items
+        }
+
+    @property
+    def vins(self) -> list[str]:
+        """Return the VINs on the stand-in account."""
+        return list(self._vehicles)
+
+    def add_vehicle(self, vin: str, **info) -> None:
+        """Add a vehicle to the account, based on the first fixture vehicle."""
+        template = next(iter(self._vehicles.values()), {})
+        self._vehicles[vin] = {**template, **info, "vinCode": vin}
+
+    def set_values(self, vin: str, values: dict[str, object]) -> None:
+        """Set a vehicle's telemetry by alias, stamped with the current time.
+
+        Aliases must be in the alias catalogue fixture.
+        """
+        state = self._telemetry.setdefault(vin, dict(self._default_telemetry))
+        now = int(time.time() * 1000)
+        for alias, value in values.items():
+            obj_id, inst_id, rsrc_id = self._alias_paths[alias]
+            state[(obj_id, inst_id, rsrc_id)] = {
+                "objectId": obj_id,
+                "instanceId": inst_id,
+                "resourceId": rsrc_id,
+                "deviceKey": device_key(obj_id, inst_id, rsrc_id),
+                "value": str(value),
+                "lastUpdateTime": now,
+            }
+
+    def expire_tokens(self) -> None:
+        """Revoke every access token so the next API request gets a 401."""
+        self._access_tokens.clear()
+
+    # Lifecycle
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening (on a free port by default) and return the port."""
+        self._tmp = tempfile.TemporaryDirectory(prefix="vinfast-stand-in-")
+        context = _self_signed_context(pathlib.Path(self._tmp.name))
+        if self._record_to is not None:
+            self._record_to.mkdir(parents=True, exist_ok=True)
+            self._upstream = aiohttp.ClientSession()
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port, ssl_context=context)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        """Stop the server and release its resources."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self._upstream is not None:
+            await self._upstream.close()
+            self._upstream = None
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+    def session(self, **kwargs) -> aiohttp.ClientSession:
+        """Return a client session routed to this server."""
+        return stand_in_session(self.port, **kwargs)
+
+    # Request handling
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Apply faults and dispatch a request to its endpoint."""
+        name = ENDPOINTS[request.path]
+        self.requests[name] += 1
+        if self._record_to is not None:
+            return await self._proxy(request)
+
+        fault = self.faults.get(name) or self.faults.get("*")
+        if fault is not None:
+            delay = fault.latency + self._random.uniform(0, fault.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._random.random() < fault.rate_limit_rate:
+                return web.json_response(
+                    {"code": 429000, "message": "Too many requests"},
+                    status=429,
+                    headers={"Retry-After": str(fault.retry_after)},
+                )
+            if self._random.random() < fault.error_rate:
+                return web.json_response(
+                    {"code": fault.error_status * 1000, "message": "Injected error"},
+                    status=fault.error_status,
+                )
+
+        if name != "token":
+            unauthorized_rate = fault.unauthorized_rate if fault else 0.0
+            if not self._authorized(request) or self._random.random() < unauthorized_rate:
+                return web.json_response(
+                    {"code": 401000, "message": "Unauthorized"}, status=401
+                )
+
+        if name in STATIC_ENDPOINTS:
+            fixture = self._fixtures.get(name) or {"status": 200, "body": {"code": OK, "data": []}}
+            return web.json_response(fixture["body"], status=fixture.get("status", 200))
+        return await getattr(self, f"_serve_{name}")(request)
+
+    def _authorized(self, request: web.Request) -> bool:
+        """Return True if the request carries a live access token."""
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        expires_at = self._access_tokens.get(token)
+        return expires_at is not None and expires_at > time.time()
+
+    def _issue_tokens(self) -> web.Response:
+        """Answer a token request with a fresh access/refresh token pair."""
+        access_token = make_token(self.token_ttl)
+        refresh_token = secrets.token_urlsafe(24)
+        self._access_tokens[access_token] = time.time() + self.token_ttl
+        self._refresh_tokens.add(refresh_token)
+        return web.json_response({
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "id_token": make_token(self.token_ttl),
+            "scope": "openid profile email offline_access",
+            "expires_in": int(self.token_ttl),
+            "token_type": "Bearer",
+        })
+
+    async def _serve_token(self, request: web.Request) -> web.Response:
+        """Auth0 password and refresh-token grants."""
+        body = await request.json()
+        grant = body.get("grant_type")
+        if grant == "password":
+            if self.password is not None and body.get("password") != self.password:
+                return web.json_response(
+                    {"error": "invalid_grant", "error_description": "Wrong email or password."},
+                    status=401,
+                )
+            return self._issue_tokens()
+        if grant == "refresh_token":
+            # Auth0 rotates refresh tokens: each one can be used once
+            if body.get("refresh_token") in self._refresh_tokens:
+                self._refresh_tokens.discard(body["refresh_token"])
+                return self._issue_tokens()
+            return web.json_response(
+                {"error": "invalid_grant", "error_description": "Unknown or invalid refresh token."},
+                status=403,
+            )
+        return web.json_response({"error": "unsupported_grant_type"}, status=400)
+
+    async def _serve_vehicles(self, request: web.Request) -> web.Response:
+        """The account's vehicles, including ones added with add_vehicle()."""
+        body = dict(self._fixtures.get("vehicles", {}).get("body") or {"code": OK})
+        body["data"] = list(self._vehicles.values())
+        return web.json_response(body)
+
+    async def _serve_ping(self, request: web.Request) -> web.Response:
+        """Return the stored value of every requested resource the vehicle has."""
+        vin = request.headers.get("x-vin-code")
+        if vin not in self._vehicles:
+            return web.json_response({"code": 404000, "message": "Vehicle not found"}, status=404)
+
+        state = self._telemetry.get(vin, self._default_telemetry)
+        data = []
+        for resource in await request.json():
+            key = (
+                int(resource.get("objectId", 0)),
+                int(resource.get("instanceId", 0)),
+                int(resource.get("resourceId", 0)),
+            )
+            if (item := state.get(key)) is not None:
+                data.append(item)
+        return web.json_response({"code": OK, "message": "Success", "data": data})
+
+    async def _serve_verify_session(self, request: web.Request) -> web.Response:
+        """Pretend to send a pairing OTP."""
+        return web.json_response({"code": OK, "message": "Success", "data": {}})
+
+    async def _serve_send_pair_data(self, request: web.Request) -> web.Response:
+        """Complete pairing with freshly generated keys; any OTP is accepted."""
+        return web.json_response({"code": OK, "message": "Success", "data": {
+            "base64EncryptedCert": base64.b64encode(secrets.token_bytes(256)).decode(),
+            "base64Seed2": base64.b64encode(secrets.token_bytes(16)).decode(),
+            "base64EncryptedShareKey": base64.b64encode(secrets.token_bytes(32)).decode(),
+        }})
+
+    async def _serve_command(self, request: web.Request) -> web.Response:
+        """Accept a signed remote command and remember what it asked for."""
+        body = await request.json()
+        try:
+            content = json.loads(base64.b64decode(body.get("message_content", "")))
+        except ValueError:
+            content = None
+        self.commands.append({"message_name": body.get("message_name"), "content": content})
+        return web.json_response({"code": OK, "message": "Success", "data": {"status": "SENT"}})
+
+    # Record mode
+
+    async def _proxy(self, request: web.Request) -> web.Response:
+        """Forward a request to the real host and record the sanitized response."""
+        name = ENDPOINTS[request.path]
+        headers = {
+            key: value
+            for key, value in request.headers.items()
+            if key.lower() not in ("host", "content-length", "accept-encoding")
+        }
+        url = f"https://{request.host}{request.path_qs}"
+        async with self._upstream.request(
+            request.method, url, headers=headers, data=await request.read()
+        ) as response:
+            payload = await response.read()
+            status = response.status
+            content_type = response.headers.get("Content-Type", "application/json")
+            retry_after = response.headers.get("Retry-After")
+
+        # Tokens are issued by the stand-in itself during replay, never recorded
+        if name != "token":
+            try:
+                self._record(name, request, status, json.loads(payload))
+            except ValueError:
+                print(f"{name}: non-JSON response ({status}), not recorded", file=sys.stderr)
+
+        reply_headers = {"Content-Type": content_type}
+        if retry_after:
+            reply_headers["Retry-After"] = retry_after
+        return web.Response(body=payload, status=status, headers=reply_headers)
+
+    def _record(self, name: str, request: web.Request, status: int, body) -> None:
+        """Write one sanitized response to the fixture directory."""
+        sanitizer = self._sanitizer
+        if name == "aliases" and isinstance(body, dict) and isinstance(body.get("data"), dict):
+            sanitizer.learn_aliases(body["data"].get("resources", []))
+        body = sanitizer.sanitize(body)
+
+        filename = f"{name}.json"
+        if name == "ping" and (vin := request.headers.get("x-vin-code")):
+            filename = f"ping.{sanitizer.vin(vin)}.json"
+            path = self._record_to / filename
+            if path.exists() and status == 200:
+                # Polls request different subsets; keep the union of what came back
+                previous = json.loads(path.read_text())["body"].get("data") or []
+                merged = {item.get("deviceKey"): item for item in previous}
+                merged.update((item.get("deviceKey"), item) for item in body.get("data") or [])
+                body["data"] = list(merged.values())
+
+        path = self._record_to / filename
+        path.write_text(json.dumps({"status": status, "body": body}, indent=2) + "\n")
+        print(f"recorded {filename} ({status})", file=sys.stderr)
+
+    # Control endpoints, for driving a standalone server from outside
+
+    async def _handle_set_faults(self, request: web.Request) -> web.Response:
+        """Replace the injected faults: {"<endpoint>|*": {Fault fields}}."""
+        self.faults = {
+            name: Fault.from_dict(data) for name, data in (await request.json()).items()
+        }
+        return web.json_response({name: asdict(f) for name, f in self.faults.items()})
+
+    async def _handle_expire_tokens(self, request: web.Request) -> web.Response:
+        """Revoke all access tokens."""
+        self.expire_tokens()
+        return web.json_response({"expired": True})
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        """Report request counts per endpoint and the commands received."""
+        return web.json_response({"requests": self.requests, "commands": self.commands})
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run the stand-in until interrupted."""
+    fault = Fault(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        unauthorized_rate=args.unauthorized_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+    )
+    cloud = FakeVinFastCloud(
+        fixtures=args.fixtures,
+        faults={"*": fault},
+        token_ttl=args.token_ttl,
+        password=args.password,
+        seed=args.seed,
+        record_to=args.record,
+    )
+    port = await cloud.start(args.host, args.port)
+    mode = f"recording to {args.record}" if args.record else f"replaying {args.fixtures}"
+    print(f"VinFast stand-in on https://{args.host}:{port} ({mode})")
+    print("Connect with tools/fake_cloud.py stand_in_session(port); Ctrl+C to stop")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await cloud.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--fixtures", type=pathlib.Path, default=DEFAULT_FIXTURES,
+                        help="fixture directory to replay")
+    parser.add_argument("--record", type=pathlib.Path, metavar="DIR",
+                        help="proxy to the real cloud and write sanitized fixtures to DIR")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of HTTP 500 answers")
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0,
+                        help="share of HTTP 401 answers to authenticated requests")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="share of HTTP 429 answers")
+    parser.add_argument("--retry-after", type=int, default=5, help="Retry-After sent with 429s")
+    parser.add_argument("--token-ttl", type=float, default=3600, help="access token lifetime")
+    parser.add_argument("--password", help="only accept this password (default: any)")
+    parser.add_argument("--seed", type=int, help="random seed for fault injection")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
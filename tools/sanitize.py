@@ -0,0 +1,131 @@
+"""Strip personal data from recorded VinFast cloud responses.
+
+Used by the stand-in cloud's record mode so real responses can be checked
+in as replay fixtures. VINs and account ids are replaced by stable
+pseudonyms (the same VIN always maps to the same fake VIN within one
+recording), secrets and personal fields are redacted and coordinates are
+moved to a fixed placeholder point.
+"""
+
+import json
+
+# Values that grant access and must never reach a fixture
+SECRET_KEYS = {
+    "access_token",
+    "refresh_token",
+    "id_token",
+    "base64EncryptedShareKey",
+    "base64EncryptedCert",
+    "base64Seed2",
+}
+
+# Free-text personal fields
+PERSONAL_KEYS = {
+    "email",
+    "phone",
+    "phoneNumber",
+    "name",
+    "firstName",
+    "lastName",
+    "fullName",
+    "nickname",
+    "picture",
+    "avatar",
+    "address",
+    "dateOfBirth",
+    "licensePlate",
+    "customizedVehicleName",
+    "sub",
+    "username",
+    "userName",
+}
+
+# Identifiers replaced by stable pseudonyms so relations between responses survive
+ID_KEYS = {"userId", "accountId", "uid", "id"}
+VIN_KEYS = {"vinCode", "vin"}
+
+COORDINATE_KEYS = {
+    "latitude": 0,
+    "lat": 0,
+    "longitude": 1,
+    "lng": 1,
+    "lon": 1,
+}
+
+# Hoan Kiem Lake, Hanoi - a public landmark rather than anyone's driveway
+PLACEHOLDER_LOCATION = (21.0285, 105.8522)
+
+
+class Sanitizer:
+    """Rewrites responses from one recording session consistently."""
+
+    def __init__(self) -> None:
+        """Initialize empty pseudonym tables."""
+        self._vins: dict[str, str] = {}
+        self._ids: dict[str, str] = {}
+        # Ping deviceKey -> 0 for latitude, 1 for longitude
+        self._location_keys: dict[str, int] = {}
+
+    def vin(self, vin: str) -> str:
+        """Return the stable fake VIN for a real one."""
+        if vin not in self._vins:
+            self._vins[vin] = f"VFFAKE{len(self._vins) + 1:011d}"
+        return self._vins[vin]
+
+    def learn_aliases(self, resources: list) -> None:
+        """Remember which ping resources carry the vehicle position."""
+        for resource in resources:
+            if not isinstance(resource, dict):
+                continue
+            alias = resource.get("alias") or ""
+            if "LATITUDE" in alias:
+                axis = 0
+            elif "LONGITUDE" in alias:
+                axis = 1
+            else:
+                continue
+            try:
+                obj_id = int(resource.get("devObjID", 0))
+                inst_id = int(resource.get("devObjInstID", 0))
+                rsrc_id = int(resource.get("devRsrcID", 0))
+            except (TypeError, ValueError):
+                continue
+            self._location_keys[f"{obj_id}_{inst_id:05d}_{rsrc_id:05d}"] = axis
+
+    def sanitize(self, body):
+        """Return a sanitized copy of a decoded JSON response body."""
+        cleaned = self._walk(body)
+        if not self._vins:
+            return cleaned
+        # VINs also turn up inside URLs and free text
+        text = json.dumps(cleaned)
+        for real, fake in self._vins.items():
+            text = text.replace(real, fake)
+        return json.loads(text)
+
+    def _walk(self, value, key: str | None = None):
+        """Recursively sanitize one value found under key."""
+        if isinstance(value, dict):
+            if (axis := self._location_keys.get(value.get("deviceKey"))) is not None:
+                value = {**value, "value": str(PLACEHOLDER_LOCATION[axis])}
+            return {k: self._walk(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._walk(item, key) for item in value]
+        if value is None or isinstance(value, bool) or key is None:
+            return value
+
+        if key in SECRET_KEYS:
+            return "REDACTED"
+        if key in VIN_KEYS and isinstance(value, str):
+            return self.vin(value)
+        if key in ID_KEYS:
+            pseudonym = self._ids.setdefault(str(value), f"id-{len(self._ids) + 1:04d}")
+            return pseudonym if isinstance(value, str) else int(pseudonym[3:])
+        if key in COORDINATE_KEYS:
+            point = PLACEHOLDER_LOCATION[COORDINATE_KEYS[key]]
+            return str(point) if isinstance(value, str) else point
+        if key in PERSONAL_KEYS:
+            if key == "email":
+                return "owner@example.com"
+            return "redacted"
+        return value